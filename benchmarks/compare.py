@@ -0,0 +1,64 @@
+"""
+Compares timings saved by ``benchmarks.suite``.
+
+Run with
+    python -m benchmarks.compare baseline.json results.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from typing import Any
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument('baseline', help='path to baseline results')
+    parser.add_argument('candidate', help='path to compared results')
+    parser.add_argument(
+        '--threshold',
+        default=0.1,
+        help='relative change to report as regression/improvement',
+        type=float,
+    )
+    args = parser.parse_args()
+    baseline_timings = _load_timings(args.baseline)
+    candidate_timings = _load_timings(args.candidate)
+    for key, candidate_seconds in candidate_timings.items():
+        baseline_seconds = baseline_timings.get(key)
+        if baseline_seconds is None:
+            continue
+        workload_name, backend_name, size = key
+        ratio = candidate_seconds / baseline_seconds
+        verdict = (
+            'regression'
+            if ratio > 1 + args.threshold
+            else 'improvement'
+            if ratio < 1 - args.threshold
+            else 'same'
+        )
+        sys.stdout.write(
+            f'{workload_name} {backend_name} {size}: '
+            f'{baseline_seconds:.6f}s -> {candidate_seconds:.6f}s, '
+            f'{ratio:.2f}x, {verdict}\n'
+        )
+
+
+def _load_timings(path: str, /) -> dict[tuple[str, str, int], float]:
+    with open(path) as file:
+        results: list[dict[str, Any]] = json.load(file)['results']
+    return {
+        (result['workload'], result['backend'], result['size']): result[
+            'seconds'
+        ]
+        for result in results
+    }
+
+
+if __name__ == '__main__':
+    main()
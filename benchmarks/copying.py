@@ -0,0 +1,56 @@
+"""
+Measures time of shallow & deep copying of maps.
+
+Run with
+    python -m benchmarks.copying
+"""
+
+from __future__ import annotations
+
+import argparse
+import copy
+import random
+import sys
+import timeit
+from collections.abc import Callable
+from functools import partial
+from typing import Any
+
+from dendroid import array_avl, avl, binary, red_black, splay
+
+FACTORIES: dict[str, Callable[..., Any]] = {
+    'array_avl': array_avl.map_,
+    'avl': avl.map_,
+    'binary': binary.map_,
+    'red_black': red_black.map_,
+    'splay': splay.map_,
+}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--size', default=100_000, type=int)
+    parser.add_argument('--repeats', default=3, type=int)
+    parser.add_argument('--seed', default=0, type=int)
+    args = parser.parse_args()
+    keys = list(range(args.size))
+    random.Random(args.seed).shuffle(keys)
+    items = [(key, str(key)) for key in keys]
+    for name, factory in FACTORIES.items():
+        map_ = factory(*items)
+        shallow_copy_time, deep_copy_time = (
+            min(
+                timeit.repeat(
+                    partial(function, map_), number=1, repeat=args.repeats
+                )
+            )
+            for function in (copy.copy, copy.deepcopy)
+        )
+        sys.stdout.write(
+            f'{name}: {shallow_copy_time:.3f}s per shallow copy, '
+            f'{deep_copy_time:.3f}s per deep copy\n'
+        )
+
+
+if __name__ == '__main__':
+    main()
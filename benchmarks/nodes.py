@@ -0,0 +1,94 @@
+"""
+Measures memory per node and insertion/removal/pop throughput of trees.
+
+Run with
+    python -m benchmarks.nodes
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import platform
+import random
+import sys
+import timeit
+import tracemalloc
+from collections.abc import Callable
+from typing import Any
+
+from dendroid import array_avl, avl, binary, red_black, splay
+
+FACTORIES: dict[str, Callable[..., Any]] = {
+    'array_avl': array_avl.map_,
+    'avl': avl.map_,
+    'binary': binary.map_,
+    'red_black': red_black.map_,
+    'splay': splay.map_,
+}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--size', default=100_000, type=int)
+    parser.add_argument('--repeats', default=3, type=int)
+    parser.add_argument('--seed', default=0, type=int)
+    args = parser.parse_args()
+    keys = list(range(args.size))
+    random.Random(args.seed).shuffle(keys)
+    for name, factory in FACTORIES.items():
+        node_memory = _measure_node_memory(factory, keys)
+        insertion_time = removal_time = pop_time = float('inf')
+        for _ in range(args.repeats):
+            map_ = factory()
+            start = timeit.default_timer()
+            for key in keys:
+                map_[key] = key
+            insertion_time = min(
+                insertion_time, timeit.default_timer() - start
+            )
+            start = timeit.default_timer()
+            for key in keys:
+                del map_[key]
+            removal_time = min(removal_time, timeit.default_timer() - start)
+            for key in keys:
+                map_[key] = key
+            # popped nodes are returned, so their handles outlive removal
+            start = timeit.default_timer()
+            for _ in keys:
+                map_.popmin()
+            pop_time = min(pop_time, timeit.default_timer() - start)
+        sys.stdout.write(
+            f'{name}: '
+            + (
+                'unknown memory per node, '
+                if node_memory is None
+                else f'{node_memory:.1f} bytes per node, '
+            )
+            + f'{args.size / insertion_time:,.0f} insertions per second, '
+            f'{args.size / removal_time:,.0f} removals per second, '
+            f'{args.size / pop_time:,.0f} pops per second\n'
+        )
+
+
+def _measure_node_memory(
+    factory: Callable[..., Any], keys: list[int], /
+) -> float | None:
+    if platform.python_implementation() != 'CPython':
+        # memory allocations are not traced by other implementations
+        return None
+    gc.collect()
+    tracemalloc.start()
+    try:
+        map_ = factory()
+        for key in keys:
+            map_[key] = key
+        map_memory, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del map_
+    return map_memory / len(keys)
+
+
+if __name__ == '__main__':
+    main()
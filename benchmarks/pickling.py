@@ -0,0 +1,63 @@
+"""
+Measures size & time of pickling maps.
+
+Run with
+    python -m benchmarks.pickling
+"""
+
+from __future__ import annotations
+
+import argparse
+import pickle
+import random
+import sys
+import timeit
+from collections.abc import Callable
+from functools import partial
+from typing import Any
+
+from dendroid import array_avl, avl, binary, red_black, splay
+
+FACTORIES: dict[str, Callable[..., Any]] = {
+    'array_avl': array_avl.map_,
+    'avl': avl.map_,
+    'binary': binary.map_,
+    'red_black': red_black.map_,
+    'splay': splay.map_,
+}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--size', default=100_000, type=int)
+    parser.add_argument('--repeats', default=3, type=int)
+    parser.add_argument('--seed', default=0, type=int)
+    args = parser.parse_args()
+    keys = list(range(args.size))
+    random.Random(args.seed).shuffle(keys)
+    for name, factory in FACTORIES.items():
+        map_ = factory()
+        for key in keys:
+            map_[key] = str(key)
+        dump = pickle.dumps(map_, pickle.HIGHEST_PROTOCOL)
+        dumping_time = min(
+            timeit.repeat(
+                partial(pickle.dumps, map_, pickle.HIGHEST_PROTOCOL),
+                number=1,
+                repeat=args.repeats,
+            )
+        )
+        loading_time = min(
+            timeit.repeat(
+                partial(pickle.loads, dump), number=1, repeat=args.repeats
+            )
+        )
+        sys.stdout.write(
+            f'{name}: {len(dump) / args.size:.1f} bytes per item, '
+            f'{dumping_time:.3f}s per dumping, '
+            f'{loading_time:.3f}s per loading\n'
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,95 @@
+"""
+Compares set algebra of trees-based sets specialized for same kind operands
+with the generic one used for foreign operands.
+
+Run with
+    python -m benchmarks.set_algebra
+"""
+
+from __future__ import annotations
+
+import argparse
+import operator
+import random
+import sys
+import timeit
+from collections.abc import Callable
+from copy import copy
+from typing import Any
+
+from dendroid import avl, red_black
+
+MAP_FACTORIES: dict[str, Callable[..., Any]] = {
+    'avl': avl.map_,
+    'red_black': red_black.map_,
+}
+SET_FACTORIES: dict[str, Callable[..., Any]] = {
+    'avl': avl.set_,
+    'red_black': red_black.set_,
+}
+OPERATIONS: dict[str, Callable[[Any, Any], Any]] = {
+    '|': operator.or_,
+    '&': operator.and_,
+    '-': operator.sub,
+    '^': operator.xor,
+    '|=': operator.ior,
+    '&=': operator.iand,
+    '-=': operator.isub,
+    '^=': operator.ixor,
+}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--size', default=20_000, type=int)
+    parser.add_argument(
+        '--other-sizes', default=[20, 2_000, 20_000], nargs='+', type=int
+    )
+    parser.add_argument('--repeats', default=3, type=int)
+    parser.add_argument('--seed', default=0, type=int)
+    args = parser.parse_args()
+    generator = random.Random(args.seed)
+    universe = range(4 * max(args.size, *args.other_sizes))
+    values = generator.sample(universe, args.size)
+    for other_size in args.other_sizes:
+        other_values = generator.sample(universe, other_size)
+        for name, set_factory in SET_FACTORIES.items():
+            set_, other_set = set_factory(*values), set_factory(*other_values)
+            # keys view is not a set, so operations fall back to generic ones
+            foreign_other_set = MAP_FACTORIES[name](
+                *[(value, value) for value in other_values]
+            ).keys()
+            for operator_symbol, operation in OPERATIONS.items():
+                specialized_time = _measure(
+                    operation, set_, other_set, args.repeats
+                )
+                generic_time = _measure(
+                    operation, set_, foreign_other_set, args.repeats
+                )
+                sys.stdout.write(
+                    f'{name} {args.size} {operator_symbol} {other_size}: '
+                    f'specialized {specialized_time:.6f}s, '
+                    f'generic {generic_time:.6f}s, '
+                    f'speedup {generic_time / specialized_time:.1f}x\n'
+                )
+
+
+def _measure(
+    operation: Callable[[Any, Any], Any],
+    left: Any,
+    right: Any,
+    repeats: int,
+    /,
+) -> float:
+    result = float('inf')
+    for _ in range(repeats):
+        # in-place operations modify left operand
+        left_copy = copy(left)
+        start = timeit.default_timer()
+        operation(left_copy, right)
+        result = min(result, timeit.default_timer() - start)
+    return result
+
+
+if __name__ == '__main__':
+    main()
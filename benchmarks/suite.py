@@ -0,0 +1,338 @@
+"""
+Runs workloads against all trees kinds & saves timings as JSON.
+
+Run with
+    python -m benchmarks.suite --output results.json
+and compare saved runs with
+    python -m benchmarks.compare baseline.json results.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import copy
+import datetime
+import itertools
+import json
+import pickle
+import platform
+import random
+import sys
+import timeit
+from collections.abc import Callable
+from types import ModuleType
+from typing import Any
+
+import dendroid
+from dendroid import array_avl, avl, binary, red_black, splay
+
+Statement = Callable[[], Any]
+Workload = Callable[[ModuleType, int, random.Random], Statement]
+
+BACKENDS: dict[str, ModuleType] = {
+    'array_avl': array_avl,
+    'avl': avl,
+    'binary': binary,
+    'red_black': red_black,
+    'splay': splay,
+}
+
+
+def _insert(keys: list[int], backend: ModuleType, /) -> Statement:
+    map_ = backend.map_()
+
+    def statement() -> None:
+        for key in keys:
+            map_[key] = key
+
+    return statement
+
+
+def insert_random(
+    backend: ModuleType, size: int, generator: random.Random, /
+) -> Statement:
+    keys = list(range(size))
+    generator.shuffle(keys)
+    return _insert(keys, backend)
+
+
+def insert_sorted(
+    backend: ModuleType, size: int, _generator: random.Random, /
+) -> Statement:
+    return _insert(list(range(size)), backend)
+
+
+def insert_zipf(
+    backend: ModuleType, size: int, generator: random.Random, /
+) -> Statement:
+    # few keys are inserted most of the time like in skewed real-world data
+    cumulative_weights = list(
+        itertools.accumulate(1.0 / rank for rank in range(1, size + 1))
+    )
+    keys = list(range(size))
+    generator.shuffle(keys)
+    return _insert(
+        generator.choices(keys, cum_weights=cumulative_weights, k=size),
+        backend,
+    )
+
+
+def lookup(
+    backend: ModuleType, size: int, generator: random.Random, /
+) -> Statement:
+    keys = list(range(size))
+    map_ = backend.map_(*zip(keys, keys, strict=True))
+    generator.shuffle(keys)
+
+    def statement() -> None:
+        for key in keys:
+            map_[key]
+
+    return statement
+
+
+def lookup_costly_keys(
+    backend: ModuleType, size: int, generator: random.Random, /
+) -> Statement:
+    # keys share long prefixes, so each comparison is expensive
+    prefix = 'prefix' * 20
+    keys = [(prefix, prefix, str(index)) for index in range(size)]
+    map_ = backend.map_(*zip(keys, keys, strict=True))
+    generator.shuffle(keys)
+
+    def statement() -> None:
+        for key in keys:
+            map_[key]
+
+    return statement
+
+
+def floor_ceil(
+    backend: ModuleType, size: int, generator: random.Random, /
+) -> Statement:
+    # keys are even & queried ones are odd, so every query misses
+    keys = list(range(0, 2 * size, 2))
+    map_ = backend.map_(*zip(keys, keys, strict=True))
+    queries = list(range(1, 2 * size - 2, 2))
+    generator.shuffle(queries)
+
+    def statement() -> None:
+        for query in queries:
+            map_.floor(query)
+            map_.ceil(query)
+
+    return statement
+
+
+def count_range(
+    backend: ModuleType, size: int, generator: random.Random, /
+) -> Statement:
+    keys = list(range(size))
+    map_ = backend.map_(*zip(keys, keys, strict=True))
+    bounds = [tuple(sorted(generator.sample(keys, 2))) for _ in range(100)]
+
+    def statement() -> None:
+        for lo, hi in bounds:
+            map_.count_range(lo, hi)
+
+    return statement
+
+
+def iterate(
+    backend: ModuleType, size: int, generator: random.Random, /
+) -> Statement:
+    keys = list(range(size))
+    generator.shuffle(keys)
+    map_ = backend.map_(*zip(keys, keys, strict=True))
+    return lambda: list(map_.items())
+
+
+def scan(
+    backend: ModuleType, size: int, generator: random.Random, /
+) -> Statement:
+    keys = list(range(size))
+    generator.shuffle(keys)
+    map_ = backend.map_(*zip(keys, keys, strict=True))
+
+    def statement() -> None:
+        # values are walked like by iteration, but stepping one by one
+        cursor = map_.cursor()
+        values = [cursor.value]
+        while cursor.next():
+            values.append(cursor.value)
+
+    return statement
+
+
+def set_algebra(
+    backend: ModuleType, size: int, generator: random.Random, /
+) -> Statement:
+    # operands overlap by a half
+    universe = range(2 * size)
+    set_ = backend.set_(*generator.sample(universe, size))
+    other_set = backend.set_(*generator.sample(universe, size))
+
+    def statement() -> None:
+        set_ | other_set
+        set_ & other_set
+        set_ - other_set
+        set_ ^ other_set
+
+    return statement
+
+
+def load_random(
+    backend: ModuleType, size: int, generator: random.Random, /
+) -> Statement:
+    keys = list(range(size))
+    generator.shuffle(keys)
+    return lambda: backend.map_from_columns(keys, keys)
+
+
+def load_sorted(
+    backend: ModuleType, size: int, _generator: random.Random, /
+) -> Statement:
+    keys = list(range(size))
+    return lambda: backend.map_from_columns(keys, keys)
+
+
+def copy_(
+    backend: ModuleType, size: int, generator: random.Random, /
+) -> Statement:
+    keys = list(range(size))
+    generator.shuffle(keys)
+    map_ = backend.map_(*zip(keys, keys, strict=True))
+    return lambda: copy.copy(map_)
+
+
+def pickle_(
+    backend: ModuleType, size: int, generator: random.Random, /
+) -> Statement:
+    keys = list(range(size))
+    generator.shuffle(keys)
+    map_ = backend.map_(*zip(keys, keys, strict=True))
+    return lambda: pickle.loads(pickle.dumps(map_, pickle.HIGHEST_PROTOCOL))
+
+
+def expire(
+    backend: ModuleType, size: int, generator: random.Random, /
+) -> Statement:
+    # older half of keys gets expired like in sliding windows
+    # & joined back, so the map is restored for the next run
+    keys = list(range(size))
+    generator.shuffle(keys)
+    map_ = backend.map_(*zip(keys, keys, strict=True))
+
+    def statement() -> None:
+        nonlocal map_
+        expired = map_.truncate_below(size // 2)
+        map_ = expired.join(map_)
+
+    return statement
+
+
+WORKLOADS: dict[str, Workload] = {
+    'insert_random': insert_random,
+    'insert_sorted': insert_sorted,
+    'insert_zipf': insert_zipf,
+    'lookup': lookup,
+    'lookup_costly_keys': lookup_costly_keys,
+    'floor_ceil': floor_ceil,
+    'count_range': count_range,
+    'iterate': iterate,
+    'scan': scan,
+    'set_algebra': set_algebra,
+    'load_random': load_random,
+    'load_sorted': load_sorted,
+    'copy': copy_,
+    'pickle': pickle_,
+    'expire': expire,
+}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument(
+        '--sizes', default=[1_000, 10_000, 100_000], nargs='+', type=int
+    )
+    parser.add_argument(
+        '--backends', choices=BACKENDS, default=list(BACKENDS), nargs='+'
+    )
+    parser.add_argument(
+        '--workloads', choices=WORKLOADS, default=list(WORKLOADS), nargs='+'
+    )
+    parser.add_argument('--repeats', default=3, type=int)
+    parser.add_argument('--seed', default=0, type=int)
+    parser.add_argument(
+        '--output', help='path to save results as JSON', default=None
+    )
+    args = parser.parse_args()
+    results = []
+    for size in args.sizes:
+        for workload_name in args.workloads:
+            for backend_name in args.backends:
+                seconds = _measure(
+                    WORKLOADS[workload_name],
+                    BACKENDS[backend_name],
+                    size,
+                    args.seed,
+                    args.repeats,
+                )
+                results.append(
+                    {
+                        'backend': backend_name,
+                        'seconds': seconds,
+                        'size': size,
+                        'workload': workload_name,
+                    }
+                )
+                sys.stdout.write(
+                    f'{workload_name} {backend_name} {size}: {seconds:.6f}s\n'
+                )
+    if args.output is not None:
+        with open(args.output, 'w') as file:
+            json.dump(
+                {
+                    'environment': _to_environment(),
+                    'parameters': {'repeats': args.repeats, 'seed': args.seed},
+                    'results': results,
+                },
+                file,
+                indent=2,
+            )
+
+
+def _measure(
+    workload: Workload,
+    backend: ModuleType,
+    size: int,
+    seed: int,
+    repeats: int,
+    /,
+) -> float:
+    result = float('inf')
+    for _ in range(repeats):
+        # same seed makes every backend & repeat see the same data
+        statement = workload(backend, size, random.Random(seed))
+        start = timeit.default_timer()
+        statement()
+        result = min(result, timeit.default_timer() - start)
+    return result
+
+
+def _to_environment() -> dict[str, str]:
+    return {
+        'dendroid_version': dendroid.__version__,
+        'machine': platform.machine(),
+        'python_implementation': platform.python_implementation(),
+        'python_version': platform.python_version(),
+        'system': platform.system(),
+        'timestamp': datetime.datetime.now(datetime.timezone.utc).isoformat(),
+    }
+
+
+if __name__ == '__main__':
+    main()
@@ -1,8 +1,8 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from collections.abc import Iterable, Iterator, Sequence
-from itertools import chain
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from itertools import chain, islice
 from typing import Any, Generic, Protocol, TypeVar, overload
 
 from reprit.base import generate_repr
@@ -10,9 +10,10 @@ from typing_extensions import Self
 
 from .hints import Item, KeyT, Ordered, ValueT
 from .nil import NIL, Nil
-from .utils import capacity
 
 _KeyT_co = TypeVar('_KeyT_co', bound=Ordered, covariant=True)
+_NodeT = TypeVar('_NodeT', bound='Node[Any, Any]')
+_TreeT = TypeVar('_TreeT', bound='Tree[Any, Any]')
 
 
 class Node(Protocol[_KeyT_co, ValueT]):
@@ -94,6 +95,43 @@ class Tree(ABC, HasCustomRepr, Generic[KeyT, ValueT]):
     ) -> Tree[KeyT, KeyT] | Tree[KeyT, ValueT]:
         """Constructs tree from given components."""
 
+    @overload
+    @classmethod
+    def from_sorted(
+        cls,
+        keys: Iterable[KeyT],
+        values: None = ...,
+        /,
+        *,
+        assume_unique: bool = ...,
+    ) -> Tree[KeyT, KeyT]: ...
+
+    @overload
+    @classmethod
+    def from_sorted(
+        cls,
+        keys: Iterable[KeyT],
+        values: Iterable[ValueT],
+        /,
+        *,
+        assume_unique: bool = ...,
+    ) -> Self: ...
+
+    @classmethod
+    @abstractmethod
+    def from_sorted(
+        cls: type[Tree[KeyT, KeyT]] | type[Tree[KeyT, ValueT]],
+        keys: Iterable[KeyT],
+        values: Iterable[ValueT] | None = None,
+        /,
+        *,
+        assume_unique: bool = False,
+    ) -> Tree[KeyT, KeyT] | Tree[KeyT, ValueT]:
+        """
+        Constructs tree from given components with keys in ascending order
+        in linear time.
+        """
+
     @property
     def keys(self, /) -> Sequence[KeyT]:
         return [node.key for node in self]
@@ -102,21 +140,101 @@ class Tree(ABC, HasCustomRepr, Generic[KeyT, ValueT]):
     def values(self, /) -> Sequence[ValueT]:
         return [node.value for node in self]
 
+    @property
+    @abstractmethod
+    def version(self, /) -> int:
+        """
+        Returns number of structural changes of the tree,
+        so positions obtained before them can be detected as outdated.
+        """
+        raise NotImplementedError
+
+    def bisect_left(self, key: KeyT, /) -> int:
+        """Returns number of nodes with keys less than the given one."""
+        result = 0
+        for node in self:
+            if not node.key < key:
+                break
+            result += 1
+        return result
+
+    def bisect_right(self, key: KeyT, /) -> int:
+        """Returns number of nodes with keys not greater than the given one."""
+        result = 0
+        for node in self:
+            if key < node.key:
+                break
+            result += 1
+        return result
+
     @abstractmethod
     def clear(self, /) -> None:
         raise NotImplementedError
 
+    def count_range(
+        self,
+        lo: KeyT | None = None,
+        hi: KeyT | None = None,
+        /,
+        *,
+        inclusive: tuple[bool, bool] = (True, False),
+    ) -> int:
+        """Returns number of nodes with keys between given bounds."""
+        is_lo_inclusive, is_hi_inclusive = inclusive
+        start = (
+            0
+            if lo is None
+            else (
+                self.bisect_left(lo)
+                if is_lo_inclusive
+                else self.bisect_right(lo)
+            )
+        )
+        stop = (
+            len(self)
+            if hi is None
+            else (
+                self.bisect_right(hi)
+                if is_hi_inclusive
+                else self.bisect_left(hi)
+            )
+        )
+        return max(stop - start, 0)
+
+    def delete_range(
+        self,
+        lo: KeyT | None = None,
+        hi: KeyT | None = None,
+        /,
+        *,
+        inclusive: tuple[bool, bool] = (True, False),
+    ) -> Self:
+        """
+        Removes nodes with keys between given bounds
+        & returns tree with them.
+        """
+        nodes = list(self.irange(lo, hi, inclusive=inclusive))
+        items = [node.item for node in nodes]
+        for node in nodes:
+            self.remove(node)
+        return self._from_items(items)
+
     def find(self, key: KeyT, /) -> Node[KeyT, ValueT] | Nil:
         """Searches for the node corresponding to a key."""
-        node = self.root
+        # equality is checked once after the descent,
+        # so each level costs a single comparison
+        candidate: Node[KeyT, ValueT] | Nil
+        node, candidate = self.root, NIL
         while node is not NIL:
             if key < node.key:
                 node = node.left
-            elif node.key < key:
-                node = node.right
             else:
-                break
-        return node
+                candidate, node = node, node.right
+        return (
+            candidate
+            if candidate is not NIL and not candidate.key < key
+            else NIL
+        )
 
     def infimum(self, key: KeyT, /) -> Node[KeyT, ValueT] | Nil:
         """Returns first node with a key not greater than the given one."""
@@ -125,17 +243,108 @@ class Tree(ABC, HasCustomRepr, Generic[KeyT, ValueT]):
         while node is not NIL:
             if key < node.key:
                 node = node.left
-            elif node.key < key:
-                result, node = node, node.right
             else:
-                result = node
-                break
+                result, node = node, node.right
         return result
 
     @abstractmethod
     def insert(self, key: KeyT, value: ValueT, /) -> Node[KeyT, ValueT]:
         """Inserts given key-value pair in the tree."""
 
+    def irange(
+        self,
+        lo: KeyT | None = None,
+        hi: KeyT | None = None,
+        /,
+        *,
+        inclusive: tuple[bool, bool] = (True, False),
+        reverse: bool = False,
+    ) -> Iterator[Node[KeyT, ValueT]]:
+        """
+        Returns iterator over nodes with keys between given bounds
+        in ascending (or descending if ``reverse`` is set) keys order.
+        """
+        is_lo_inclusive, is_hi_inclusive = inclusive
+        node = self.root
+        queue = []
+        if reverse:
+            while node is not NIL:
+                if hi is None or (
+                    not hi < node.key if is_hi_inclusive else node.key < hi
+                ):
+                    queue.append(node)
+                    node = node.right
+                else:
+                    node = node.left
+            while queue:
+                node = queue.pop()
+                if lo is not None and (
+                    node.key < lo if is_lo_inclusive else not lo < node.key
+                ):
+                    return
+                yield node
+                node = node.left
+                while node is not NIL:
+                    queue.append(node)
+                    node = node.right
+        else:
+            while node is not NIL:
+                if lo is None or (
+                    not node.key < lo if is_lo_inclusive else lo < node.key
+                ):
+                    queue.append(node)
+                    node = node.left
+                else:
+                    node = node.right
+            while queue:
+                node = queue.pop()
+                if hi is not None and (
+                    hi < node.key if is_hi_inclusive else not node.key < hi
+                ):
+                    return
+                yield node
+                node = node.right
+                while node is not NIL:
+                    queue.append(node)
+                    node = node.left
+
+    def intersect(self, other: Self, /) -> Self:
+        """
+        Returns tree with nodes of the tree which keys are in the other one.
+
+        Both trees become empty.
+        """
+        items = _merge_items(
+            self,
+            other,
+            include_first=False,
+            include_common=True,
+            include_second=False,
+        )
+        self.clear()
+        other.clear()
+        return self._from_items(items)
+
+    def join(self, other: Self, /) -> Self:
+        """
+        Returns tree with nodes of both trees
+        given that all keys of the tree are less than keys of the other one.
+
+        Both trees become empty.
+        """
+        if (
+            (max_node := self.max()) is not NIL
+            and (min_node := other.min()) is not NIL
+            and not max_node.key < min_node.key
+        ):
+            raise ValueError(
+                'Keys of the tree should be less than keys of the other one.'
+            )
+        items = [node.item for node in chain(self, other)]
+        self.clear()
+        other.clear()
+        return self._from_items(items)
+
     def max(self, /) -> Node[KeyT, ValueT] | Nil:
         """Returns node with the maximum key."""
         node = self.root
@@ -175,6 +384,35 @@ class Tree(ABC, HasCustomRepr, Generic[KeyT, ValueT]):
             self.remove(node)
         return node
 
+    def popmax_many(self, count: int, /) -> Self:
+        """
+        Removes given number of nodes with the greatest keys
+        & returns tree with them.
+        """
+        if count < 0:
+            raise ValueError('Count should be non-negative.')
+        size = len(self)
+        if count >= size:
+            return self.delete_range()
+        last_kept_node = self.select(size - count - 1)
+        assert last_kept_node is not NIL
+        return self.delete_range(
+            last_kept_node.key, None, inclusive=(False, True)
+        )
+
+    def popmin_many(self, count: int, /) -> Self:
+        """
+        Removes given number of nodes with the least keys
+        & returns tree with them.
+        """
+        if count < 0:
+            raise ValueError('Count should be non-negative.')
+        if count >= len(self):
+            return self.delete_range()
+        first_kept_node = self.select(count)
+        assert first_kept_node is not NIL
+        return self.delete_range(None, first_kept_node.key)
+
     @abstractmethod
     def predecessor(
         self, node: Node[KeyT, ValueT], /
@@ -185,26 +423,106 @@ class Tree(ABC, HasCustomRepr, Generic[KeyT, ValueT]):
     def remove(self, node: Node[KeyT, ValueT], /) -> None:
         """Removes node from the tree."""
 
+    def select(self, index: int, /) -> Node[KeyT, ValueT] | Nil:
+        """Returns node with given position in ascending keys order."""
+        return (
+            next(islice(self, index, None), NIL)
+            if 0 <= index < len(self)
+            else NIL
+        )
+
+    def split(self, key: KeyT, /) -> tuple[Self, Self]:
+        """
+        Returns trees with nodes which keys are less than the given one
+        and with the rest of nodes.
+
+        The tree becomes empty.
+        """
+        lower_items: list[Item[KeyT, ValueT]] = []
+        upper_items: list[Item[KeyT, ValueT]] = []
+        for node in self:
+            (lower_items if node.key < key else upper_items).append(node.item)
+        self.clear()
+        return self._from_items(lower_items), self._from_items(upper_items)
+
+    def subtract(self, other: Self, /) -> Self:
+        """
+        Returns tree with nodes of the tree
+        which keys are not in the other one.
+
+        Both trees become empty.
+        """
+        items = _merge_items(
+            self,
+            other,
+            include_first=True,
+            include_common=False,
+            include_second=False,
+        )
+        self.clear()
+        other.clear()
+        return self._from_items(items)
+
     @abstractmethod
     def successor(
         self, node: Node[KeyT, ValueT], /
     ) -> Node[KeyT, ValueT] | Nil:
         """Returns first node with a key greater than of the given one."""
 
+    def symmetric_subtract(self, other: Self, /) -> Self:
+        """
+        Returns tree with nodes of both trees
+        which keys are not in the other one.
+
+        Both trees become empty.
+        """
+        items = _merge_items(
+            self,
+            other,
+            include_first=True,
+            include_common=False,
+            include_second=True,
+        )
+        self.clear()
+        other.clear()
+        return self._from_items(items)
+
     def supremum(self, key: KeyT, /) -> Node[KeyT, ValueT] | Nil:
         """Returns first node with a key not less than the given one."""
         result: Node[KeyT, ValueT] | Nil
         node, result = self.root, NIL
         while node is not NIL:
-            if key < node.key:
-                result, node = node, node.left
-            elif node.key < key:
+            if node.key < key:
                 node = node.right
             else:
-                result = node
-                break
+                result, node = node, node.left
         return result
 
+    def unite(self, other: Self, /) -> Self:
+        """
+        Returns tree with nodes of both trees
+        preferring nodes of the tree for common keys.
+
+        Both trees become empty.
+        """
+        items = _merge_items(
+            self,
+            other,
+            include_first=True,
+            include_common=True,
+            include_second=True,
+        )
+        self.clear()
+        other.clear()
+        return self._from_items(items)
+
+    def _from_items(self, items: Sequence[Item[KeyT, ValueT]], /) -> Self:
+        return self.from_sorted(
+            [key for key, _ in items],
+            [value for _, value in items],
+            assume_unique=True,
+        )
+
     __slots__ = ()
 
     def __bool__(self, /) -> bool:
@@ -229,9 +547,18 @@ class Tree(ABC, HasCustomRepr, Generic[KeyT, ValueT]):
             yield node
             node = node.right
 
+    @abstractmethod
     def __len__(self, /) -> int:
         """Returns number of nodes."""
-        return capacity(self)
+
+    def __reduce__(
+        self, /
+    ) -> tuple[
+        Callable[[type[Self], Sequence[KeyT], Sequence[ValueT]], Self],
+        tuple[type[Self], Sequence[KeyT], Sequence[ValueT]],
+    ]:
+        # flat sorted components are rebuilt into a balanced tree
+        return restore_tree, (type(self), self.keys, self.values)
 
     __repr__ = generate_repr(from_components, with_module_name=True)
 
@@ -250,6 +577,75 @@ class Tree(ABC, HasCustomRepr, Generic[KeyT, ValueT]):
             node = node.left
 
 
+def clone_subtree(
+    root: _NodeT | Nil, clone_node: Callable[[_NodeT], _NodeT], /
+) -> _NodeT | Nil:
+    """
+    Returns copy of the subtree with given root
+    which nodes are made by given function & linked iteratively,
+    so degenerate subtrees are copied without recursion.
+    """
+    if root is NIL:
+        return NIL
+    result = clone_node(root)
+    queue = [(root, result)]
+    while queue:
+        node, clone = queue.pop()
+        if node.left is not NIL:
+            clone.left = left_clone = clone_node(node.left)
+            queue.append((node.left, left_clone))
+        if node.right is not NIL:
+            clone.right = right_clone = clone_node(node.right)
+            queue.append((node.right, right_clone))
+    return result
+
+
+def restore_tree(
+    cls: type[_TreeT], keys: Sequence[Any], values: Sequence[Any], /
+) -> _TreeT:
+    """
+    Restores tree of given class from its pickled components,
+    which are sorted & unique by construction.
+    """
+    return cls.from_sorted(keys, values, assume_unique=True)
+
+
+def _merge_items(
+    first: Iterable[Node[KeyT, ValueT]],
+    second: Iterable[Node[KeyT, ValueT]],
+    /,
+    *,
+    include_first: bool,
+    include_common: bool,
+    include_second: bool,
+) -> list[Item[KeyT, ValueT]]:
+    result: list[Item[KeyT, ValueT]] = []
+    first_nodes, second_nodes = iter(first), iter(second)
+    first_node = next(first_nodes, NIL)
+    second_node = next(second_nodes, NIL)
+    while first_node is not NIL and second_node is not NIL:
+        if first_node.key < second_node.key:
+            if include_first:
+                result.append(first_node.item)
+            first_node = next(first_nodes, NIL)
+        elif second_node.key < first_node.key:
+            if include_second:
+                result.append(second_node.item)
+            second_node = next(second_nodes, NIL)
+        else:
+            if include_common:
+                result.append(first_node.item)
+            first_node = next(first_nodes, NIL)
+            second_node = next(second_nodes, NIL)
+    if include_first and first_node is not NIL:
+        result.append(first_node.item)
+        result.extend(node.item for node in first_nodes)
+    if include_second and second_node is not NIL:
+        result.append(second_node.item)
+        result.extend(node.item for node in second_nodes)
+    return result
+
+
 class Collection(ABC, Generic[ValueT]):
     __slots__ = ()
 
@@ -385,13 +781,13 @@ class AbstractSet(Collection[ValueT]):
 
 class MutableSet(AbstractSet[ValueT]):
     @abstractmethod
-    def add(self, value: ValueT, /) -> None:
-        """Adds given value to the set."""
+    def add(self, value: ValueT, /) -> bool:
+        """Adds given value to the set, returns whether it was missing."""
         raise NotImplementedError
 
     @abstractmethod
     def clear(self, /) -> None:
-        """Adds given value to the set."""
+        """Removes all values from the set."""
         raise NotImplementedError
 
     @abstractmethod
@@ -0,0 +1,685 @@
+from __future__ import annotations
+
+import copy
+import weakref
+from array import array
+from collections.abc import Iterable, Iterator, Sequence
+from typing import Any, Final, Generic, cast, overload
+
+from typing_extensions import Self, override
+
+from . import abcs
+from .hints import Item, KeyT, ValueT
+from .nil import NIL, Nil
+from .utils import to_sorted_components, to_unique_sorted_components
+
+# slot of the sentinel which stands for missing children,
+# it has height of ``-1`` & size of ``0``
+# so metadata of children can be read without checks
+NIL_INDEX: Final = 0
+# slot of the node in the storage of its own after removal
+_DETACHED_INDEX: Final = 1
+
+
+class Node(abcs.HasCustomRepr, Generic[KeyT, ValueT]):
+    @property
+    def balance_factor(self, /) -> int:
+        storage, index = self.storage, self.index
+        return (
+            storage.heights[storage.lefts[index]]
+            - storage.heights[storage.rights[index]]
+        )
+
+    @property
+    def height(self, /) -> int:
+        return self.storage.heights[self.index]
+
+    @property
+    def item(self, /) -> Item[KeyT, ValueT]:
+        return self.key, self.value
+
+    @property
+    def key(self, /) -> KeyT:
+        result: KeyT = self.storage.keys[self.index]
+        return result
+
+    @property
+    def left(self, /) -> Self | Nil:
+        storage = self.storage
+        return cast('Self | Nil', storage.to_node(storage.lefts[self.index]))
+
+    @left.setter
+    def left(self, node: Self | Nil) -> None:
+        storage = self.storage
+        assert isinstance(storage, Storage), 'Removed node cannot be linked.'
+        storage.lefts[self.index] = _to_index(node)
+
+    @property
+    def right(self, /) -> Self | Nil:
+        storage = self.storage
+        return cast('Self | Nil', storage.to_node(storage.rights[self.index]))
+
+    @right.setter
+    def right(self, node: Self | Nil) -> None:
+        storage = self.storage
+        assert isinstance(storage, Storage), 'Removed node cannot be linked.'
+        storage.rights[self.index] = _to_index(node)
+
+    @property
+    def size(self, /) -> int:
+        return self.storage.sizes[self.index]
+
+    @property
+    def value(self, /) -> ValueT:
+        result: ValueT = self.storage.values[self.index]
+        return result
+
+    @value.setter
+    def value(self, value: ValueT) -> None:
+        self.storage.values[self.index] = value
+
+    index: int
+    storage: Storage[KeyT, ValueT] | _DetachedStorage[KeyT, ValueT]
+
+    __slots__ = '__weakref__', 'index', 'storage'
+
+    def __init__(self, storage: Storage[KeyT, ValueT], index: int, /) -> None:
+        self.storage, self.index = storage, index
+
+    def __repr__(self, /) -> str:
+        return f'{type(self).__qualname__}({self.key!r}, {self.value!r})'
+
+
+def _to_index(node: Node[KeyT, ValueT] | Nil, /) -> int:
+    return NIL_INDEX if node is NIL else node.index
+
+
+class _DetachedStorage(Generic[KeyT, ValueT]):
+    """
+    Columns of a single node removed from its tree,
+    only its key & value are stored per node.
+    """
+
+    heights: Final = (-1, 0)
+    lefts: Final = (NIL_INDEX, NIL_INDEX)
+    rights: Final = (NIL_INDEX, NIL_INDEX)
+    sizes: Final = (0, 1)
+
+    def to_node(self, index: int, /) -> Nil:
+        assert index == NIL_INDEX, index
+        return NIL
+
+    keys: list[Any]
+    values: list[Any]
+
+    __slots__ = 'keys', 'values'
+
+    def __init__(self, key: KeyT, value: ValueT, /) -> None:
+        self.keys, self.values = [None, key], [None, value]
+
+
+class Storage(Generic[KeyT, ValueT]):
+    """
+    Parallel columns of AVL tree nodes' keys, values, children & metadata.
+    """
+
+    def allocate(self, key: KeyT, value: ValueT, /) -> int:
+        index = self.free
+        if index == NIL_INDEX:
+            index = len(self.keys)
+            self.keys.append(key)
+            self.values.append(value)
+            self.heights.append(0)
+            self.lefts.append(NIL_INDEX)
+            self.rights.append(NIL_INDEX)
+            self.sizes.append(1)
+        else:
+            # released slots are chained through their left children
+            self.free = self.lefts[index]
+            self.keys[index], self.values[index] = key, value
+            self.heights[index], self.sizes[index] = 0, 1
+            self.lefts[index] = self.rights[index] = NIL_INDEX
+        return index
+
+    def node_at(self, index: int, /) -> Node[KeyT, ValueT]:
+        # handles are cached while alive to keep nodes identities stable
+        result = self.handles.get(index)
+        if result is None:
+            result = self.handles[index] = Node(self, index)
+        return result
+
+    def release(self, index: int, /) -> None:
+        node = self.handles.pop(index, None)
+        if node is not None:
+            # removed node keeps only its key & value
+            node.storage = _DetachedStorage(
+                self.keys[index], self.values[index]
+            )
+            node.index = _DETACHED_INDEX
+        self.keys[index] = self.values[index] = None
+        self.lefts[index], self.free = self.free, index
+
+    def rotated_left(self, index: int, /) -> int:
+        lefts, rights = self.lefts, self.rights
+        replacement = rights[index]
+        assert replacement != NIL_INDEX
+        rights[index], lefts[replacement] = lefts[replacement], index
+        self.update_metadata(index)
+        self.update_metadata(replacement)
+        return replacement
+
+    def rotated_right(self, index: int, /) -> int:
+        lefts, rights = self.lefts, self.rights
+        replacement = lefts[index]
+        assert replacement != NIL_INDEX
+        lefts[index], rights[replacement] = rights[replacement], index
+        self.update_metadata(index)
+        self.update_metadata(replacement)
+        return replacement
+
+    def to_balanced(self, index: int, /) -> int:
+        heights, lefts, rights = self.heights, self.lefts, self.rights
+        self.update_metadata(index)
+        left, right = lefts[index], rights[index]
+        if heights[left] - heights[right] > 1:
+            if heights[lefts[left]] < heights[rights[left]]:
+                lefts[index] = self.rotated_left(left)
+            return self.rotated_right(index)
+        if heights[right] - heights[left] > 1:
+            if heights[lefts[right]] > heights[rights[right]]:
+                rights[index] = self.rotated_right(right)
+            return self.rotated_left(index)
+        return index
+
+    def to_indices(self, /, *, reverse: bool = False) -> Iterator[int]:
+        firsts, seconds = (
+            (self.rights, self.lefts) if reverse else (self.lefts, self.rights)
+        )
+        index, queue = self.root, []
+        while True:
+            while index != NIL_INDEX:
+                queue.append(index)
+                index = firsts[index]
+            if not queue:
+                return
+            index = queue.pop()
+            yield index
+            index = seconds[index]
+
+    def to_node(self, index: int, /) -> Node[KeyT, ValueT] | Nil:
+        return NIL if index == NIL_INDEX else self.node_at(index)
+
+    def update_metadata(self, index: int, /) -> None:
+        heights, lefts, rights, sizes = (
+            self.heights,
+            self.lefts,
+            self.rights,
+            self.sizes,
+        )
+        left, right = lefts[index], rights[index]
+        heights[index] = max(heights[left], heights[right]) + 1
+        sizes[index] = sizes[left] + sizes[right] + 1
+
+    free: int
+    handles: weakref.WeakValueDictionary[int, Node[KeyT, ValueT]]
+    heights: array[int]
+    keys: list[Any]
+    lefts: array[int]
+    rights: array[int]
+    root: int
+    sizes: array[int]
+    values: list[Any]
+
+    __slots__ = (
+        'free',
+        'handles',
+        'heights',
+        'keys',
+        'lefts',
+        'rights',
+        'root',
+        'sizes',
+        'values',
+    )
+
+    def __copy__(self, /) -> Self:
+        result = type(self)()
+        result.keys, result.values = self.keys[:], self.values[:]
+        result.heights, result.sizes = self.heights[:], self.sizes[:]
+        result.lefts, result.rights = self.lefts[:], self.rights[:]
+        result.free, result.root = self.free, self.root
+        return result
+
+    def __init__(self, /) -> None:
+        self.keys, self.values = [None], [None]
+        self.heights = array('b', [-1])
+        self.lefts = array('q', [NIL_INDEX])
+        self.rights = array('q', [NIL_INDEX])
+        self.sizes = array('q', [0])
+        self.free = self.root = NIL_INDEX
+        self.handles = weakref.WeakValueDictionary()
+
+
+class Tree(abcs.Tree[KeyT, ValueT]):
+    @property
+    @override
+    def keys(self, /) -> Sequence[KeyT]:
+        storage = self._storage
+        return list(map(storage.keys.__getitem__, storage.to_indices()))
+
+    @property
+    def root(self, /) -> Node[KeyT, ValueT] | Nil:
+        storage = self._storage
+        return storage.to_node(storage.root)
+
+    @property
+    def storage(self, /) -> Storage[KeyT, ValueT]:
+        return self._storage
+
+    @property
+    @override
+    def values(self, /) -> Sequence[ValueT]:
+        storage = self._storage
+        return list(map(storage.values.__getitem__, storage.to_indices()))
+
+    @property
+    @override
+    def version(self, /) -> int:
+        return self._version
+
+    @override
+    def predecessor(
+        self, node: abcs.Node[KeyT, ValueT], /
+    ) -> Node[KeyT, ValueT] | Nil:
+        assert isinstance(node, Node), node
+        storage = self._storage
+        keys, lefts, rights = storage.keys, storage.lefts, storage.rights
+        index = node.index
+        if (result := lefts[index]) != NIL_INDEX:
+            while rights[result] != NIL_INDEX:
+                result = rights[result]
+        else:
+            result, cursor, key = NIL_INDEX, storage.root, keys[index]
+            while cursor != index:
+                assert cursor != NIL_INDEX
+                if keys[cursor] < key:
+                    result, cursor = cursor, rights[cursor]
+                else:
+                    cursor = lefts[cursor]
+        return storage.to_node(result)
+
+    @override
+    def successor(
+        self, node: abcs.Node[KeyT, ValueT], /
+    ) -> Node[KeyT, ValueT] | Nil:
+        assert isinstance(node, Node), node
+        storage = self._storage
+        keys, lefts, rights = storage.keys, storage.lefts, storage.rights
+        index = node.index
+        if (result := rights[index]) != NIL_INDEX:
+            while lefts[result] != NIL_INDEX:
+                result = lefts[result]
+        else:
+            result, cursor, key = NIL_INDEX, storage.root, keys[index]
+            while cursor != index:
+                assert cursor != NIL_INDEX
+                if key < keys[cursor]:
+                    result, cursor = cursor, lefts[cursor]
+                else:
+                    cursor = rights[cursor]
+        return storage.to_node(result)
+
+    @overload
+    @classmethod
+    def from_components(
+        cls, keys: Iterable[KeyT], values: None = ..., /
+    ) -> Tree[KeyT, KeyT]: ...
+
+    @overload
+    @classmethod
+    def from_components(
+        cls, keys: Iterable[KeyT], values: Iterable[ValueT], /
+    ) -> Tree[KeyT, ValueT]: ...
+
+    @classmethod
+    def from_components(
+        cls: type[Tree[KeyT, KeyT]] | type[Tree[KeyT, ValueT]],
+        keys: Iterable[KeyT],
+        values: Iterable[ValueT] | None = None,
+        /,
+    ) -> Tree[KeyT, KeyT] | Tree[KeyT, ValueT]:
+        return cls._from_unique_sorted_components(
+            *to_unique_sorted_components(keys, values)
+        )
+
+    @overload
+    @classmethod
+    def from_sorted(
+        cls,
+        keys: Iterable[KeyT],
+        values: None = ...,
+        /,
+        *,
+        assume_unique: bool = ...,
+    ) -> Tree[KeyT, KeyT]: ...
+
+    @overload
+    @classmethod
+    def from_sorted(
+        cls,
+        keys: Iterable[KeyT],
+        values: Iterable[ValueT],
+        /,
+        *,
+        assume_unique: bool = ...,
+    ) -> Tree[KeyT, ValueT]: ...
+
+    @classmethod
+    def from_sorted(
+        cls: type[Tree[KeyT, KeyT]] | type[Tree[KeyT, ValueT]],
+        keys: Iterable[KeyT],
+        values: Iterable[ValueT] | None = None,
+        /,
+        *,
+        assume_unique: bool = False,
+    ) -> Tree[KeyT, KeyT] | Tree[KeyT, ValueT]:
+        return cls._from_unique_sorted_components(
+            *to_sorted_components(keys, values, assume_unique=assume_unique)
+        )
+
+    @classmethod
+    def _from_unique_sorted_components(
+        cls, keys: Sequence[KeyT], values: Sequence[ValueT], /
+    ) -> Self:
+        storage: Storage[KeyT, ValueT] = Storage()
+        if not keys:
+            return cls(storage)
+        storage.keys.extend(keys)
+        storage.values.extend(values)
+        size = len(keys)
+        storage.heights.extend([0] * size)
+        storage.lefts.extend([NIL_INDEX] * size)
+        storage.rights.extend([NIL_INDEX] * size)
+        storage.sizes.extend([1] * size)
+        heights, lefts, rights, sizes = (
+            storage.heights,
+            storage.lefts,
+            storage.rights,
+            storage.sizes,
+        )
+        # slots follow keys order shifted by the sentinel one,
+        # so subtrees are formed by bisection of slots' ranges level by level
+        starts, ends = [1], [size + 1]
+        while starts:
+            next_starts: list[int] = []
+            next_ends: list[int] = []
+            for start_index, end_index in zip(starts, ends, strict=True):
+                middle_index = (start_index + end_index) // 2
+                # bisection gives subtrees of the minimal height
+                sizes[middle_index] = subtree_size = end_index - start_index
+                heights[middle_index] = subtree_size.bit_length() - 1
+                if middle_index > start_index:
+                    lefts[middle_index] = (start_index + middle_index) // 2
+                    next_starts.append(start_index)
+                    next_ends.append(middle_index)
+                if middle_index < end_index - 1:
+                    rights[middle_index] = (middle_index + 1 + end_index) // 2
+                    next_starts.append(middle_index + 1)
+                    next_ends.append(end_index)
+            starts, ends = next_starts, next_ends
+        storage.root = (size + 2) // 2
+        return cls(storage)
+
+    @override
+    def bisect_left(self, key: KeyT, /) -> int:
+        storage = self._storage
+        keys, lefts, rights, sizes = (
+            storage.keys,
+            storage.lefts,
+            storage.rights,
+            storage.sizes,
+        )
+        index, result = storage.root, 0
+        while index != NIL_INDEX:
+            if keys[index] < key:
+                result += sizes[lefts[index]] + 1
+                index = rights[index]
+            else:
+                index = lefts[index]
+        return result
+
+    @override
+    def bisect_right(self, key: KeyT, /) -> int:
+        storage = self._storage
+        keys, lefts, rights, sizes = (
+            storage.keys,
+            storage.lefts,
+            storage.rights,
+            storage.sizes,
+        )
+        index, result = storage.root, 0
+        while index != NIL_INDEX:
+            if key < keys[index]:
+                index = lefts[index]
+            else:
+                result += sizes[lefts[index]] + 1
+                index = rights[index]
+        return result
+
+    @override
+    def clear(self, /) -> None:
+        # nodes obtained before clearing keep referring to the old storage
+        self._storage = Storage()
+        self._version += 1
+
+    @override
+    def find(self, key: KeyT, /) -> Node[KeyT, ValueT] | Nil:
+        storage = self._storage
+        keys, lefts, rights = storage.keys, storage.lefts, storage.rights
+        # equality is checked once after the descent,
+        # so each level costs a single comparison
+        index, candidate = storage.root, NIL_INDEX
+        while index != NIL_INDEX:
+            if key < keys[index]:
+                index = lefts[index]
+            else:
+                candidate, index = index, rights[index]
+        return storage.to_node(
+            candidate
+            if candidate != NIL_INDEX and not keys[candidate] < key
+            else NIL_INDEX
+        )
+
+    @override
+    def infimum(self, key: KeyT, /) -> Node[KeyT, ValueT] | Nil:
+        storage = self._storage
+        keys, lefts, rights = storage.keys, storage.lefts, storage.rights
+        index, result = storage.root, NIL_INDEX
+        while index != NIL_INDEX:
+            if key < keys[index]:
+                index = lefts[index]
+            else:
+                result, index = index, rights[index]
+        return storage.to_node(result)
+
+    @override
+    def insert(self, key: KeyT, value: ValueT, /) -> Node[KeyT, ValueT]:
+        storage = self._storage
+        parent = storage.root
+        if parent == NIL_INDEX:
+            index = storage.root = storage.allocate(key, value)
+            self._version += 1
+            return storage.node_at(index)
+        keys, lefts, rights = storage.keys, storage.lefts, storage.rights
+        # the last node which key is not greater than the given one
+        # is checked for equality only once the leaf is reached
+        ancestors, candidate = [], NIL_INDEX
+        while True:
+            ancestors.append(parent)
+            if key < keys[parent]:
+                if lefts[parent] == NIL_INDEX:
+                    if candidate != NIL_INDEX and not keys[candidate] < key:
+                        return storage.node_at(candidate)
+                    index = lefts[parent] = storage.allocate(key, value)
+                    break
+                parent = lefts[parent]
+            else:
+                if rights[parent] == NIL_INDEX:
+                    if not keys[parent] < key:
+                        return storage.node_at(parent)
+                    index = rights[parent] = storage.allocate(key, value)
+                    break
+                candidate, parent = parent, rights[parent]
+        self._rebalance(ancestors)
+        self._version += 1
+        return storage.node_at(index)
+
+    @override
+    def max(self, /) -> Node[KeyT, ValueT] | Nil:
+        storage = self._storage
+        rights, index = storage.rights, storage.root
+        if index != NIL_INDEX:
+            while rights[index] != NIL_INDEX:
+                index = rights[index]
+        return storage.to_node(index)
+
+    @override
+    def min(self, /) -> Node[KeyT, ValueT] | Nil:
+        storage = self._storage
+        lefts, index = storage.lefts, storage.root
+        if index != NIL_INDEX:
+            while lefts[index] != NIL_INDEX:
+                index = lefts[index]
+        return storage.to_node(index)
+
+    @override
+    def popmax(self, /) -> Node[KeyT, ValueT] | Nil:
+        # extreme node is found by walking indices,
+        # so the only handle created is the one of the popped node
+        node = self.max()
+        if node is not NIL:
+            self.remove(node)
+        return node
+
+    @override
+    def popmin(self, /) -> Node[KeyT, ValueT] | Nil:
+        node = self.min()
+        if node is not NIL:
+            self.remove(node)
+        return node
+
+    @override
+    def remove(self, node: abcs.Node[KeyT, ValueT], /) -> None:
+        assert isinstance(node, Node), node
+        storage = self._storage
+        assert node.storage is storage, node
+        self._version += 1
+        lefts, rights = storage.lefts, storage.rights
+        index = node.index
+        ancestors = self._to_ancestors(index)
+        parent = ancestors[-1] if ancestors else NIL_INDEX
+        if lefts[index] == NIL_INDEX:
+            self._replace_child(parent, index, rights[index])
+        elif rights[index] == NIL_INDEX:
+            self._replace_child(parent, index, lefts[index])
+        else:
+            successor, successor_ancestors = rights[index], []
+            while lefts[successor] != NIL_INDEX:
+                successor_ancestors.append(successor)
+                successor = lefts[successor]
+            if successor_ancestors:
+                lefts[successor_ancestors[-1]] = rights[successor]
+                rights[successor] = rights[index]
+            lefts[successor] = lefts[index]
+            self._replace_child(parent, index, successor)
+            ancestors.append(successor)
+            ancestors.extend(successor_ancestors)
+        self._rebalance(ancestors)
+        storage.release(index)
+
+    @override
+    def select(self, index: int, /) -> Node[KeyT, ValueT] | Nil:
+        storage = self._storage
+        lefts, rights, sizes = storage.lefts, storage.rights, storage.sizes
+        cursor = storage.root
+        if not 0 <= index < sizes[cursor]:
+            return NIL
+        while True:
+            assert cursor != NIL_INDEX
+            left_size = sizes[lefts[cursor]]
+            if index < left_size:
+                cursor = lefts[cursor]
+            elif index > left_size:
+                index -= left_size + 1
+                cursor = rights[cursor]
+            else:
+                return storage.node_at(cursor)
+
+    @override
+    def supremum(self, key: KeyT, /) -> Node[KeyT, ValueT] | Nil:
+        storage = self._storage
+        keys, lefts, rights = storage.keys, storage.lefts, storage.rights
+        index, result = storage.root, NIL_INDEX
+        while index != NIL_INDEX:
+            if keys[index] < key:
+                index = rights[index]
+            else:
+                result, index = index, lefts[index]
+        return storage.to_node(result)
+
+    def _rebalance(self, path: list[int], /) -> None:
+        storage = self._storage
+        while path:
+            index = path.pop()
+            replacement = storage.to_balanced(index)
+            if replacement != index:
+                self._replace_child(
+                    path[-1] if path else NIL_INDEX, index, replacement
+                )
+
+    def _replace_child(
+        self, parent: int, origin: int, replacement: int, /
+    ) -> None:
+        storage = self._storage
+        if parent == NIL_INDEX:
+            storage.root = replacement
+        elif storage.lefts[parent] == origin:
+            storage.lefts[parent] = replacement
+        else:
+            storage.rights[parent] = replacement
+
+    def _to_ancestors(self, index: int, /) -> list[int]:
+        storage = self._storage
+        keys, lefts, rights = storage.keys, storage.lefts, storage.rights
+        result, cursor, key = [], storage.root, keys[index]
+        while cursor != index:
+            assert cursor != NIL_INDEX
+            result.append(cursor)
+            cursor = lefts[cursor] if key < keys[cursor] else rights[cursor]
+        return result
+
+    _storage: Storage[KeyT, ValueT]
+
+    __slots__ = '_storage', '_version'
+
+    @override
+    def __copy__(self, /) -> Self:
+        return type(self)(copy.copy(self._storage))
+
+    def __init__(self, storage: Storage[KeyT, ValueT], /) -> None:
+        self._storage, self._version = storage, 0
+
+    @override
+    def __iter__(self, /) -> Iterator[Node[KeyT, ValueT]]:
+        storage = self._storage
+        return map(storage.node_at, storage.to_indices())
+
+    @override
+    def __len__(self, /) -> int:
+        storage = self._storage
+        return storage.sizes[storage.root]
+
+    @override
+    def __reversed__(self, /) -> Iterator[Node[KeyT, ValueT]]:
+        storage = self._storage
+        return map(storage.node_at, storage.to_indices(reverse=True))
@@ -1,9 +1,8 @@
 from __future__ import annotations
 
-import copy
-from collections.abc import Iterable
+from collections.abc import Iterable, Sequence
 from reprlib import recursive_repr
-from typing import Generic, cast, overload
+from typing import Generic, overload
 
 from reprit.base import generate_repr
 from typing_extensions import Self, override
@@ -11,12 +10,7 @@ from typing_extensions import Self, override
 from . import abcs
 from .hints import Item, KeyT, ValueT
 from .nil import NIL, Nil
-from .utils import (
-    dereference_maybe,
-    maybe_weakref,
-    to_unique_sorted_items,
-    to_unique_sorted_values,
-)
+from .utils import to_sorted_components, to_unique_sorted_components
 
 
 class Node(abcs.HasCustomRepr, Generic[KeyT, ValueT]):
@@ -28,53 +22,12 @@ class Node(abcs.HasCustomRepr, Generic[KeyT, ValueT]):
     def item(self, /) -> Item[KeyT, ValueT]:
         return self.key, self.value
 
-    @property
-    def key(self, /) -> KeyT:
-        return self._key
-
-    @property
-    def left(self, /) -> Self | Nil:
-        return self._left
-
-    @left.setter
-    def left(self, node: Self | Nil) -> None:
-        self._left = node
-        _set_parent(node, self)
-
-    @property
-    def parent(self, /) -> Self | Nil:
-        return dereference_maybe(self._parent)
+    key: KeyT
+    left: Self | Nil
+    right: Self | Nil
+    value: ValueT
 
-    @parent.setter
-    def parent(self, value: Self | Nil, /) -> None:
-        self._parent = maybe_weakref(value)
-
-    @property
-    def right(self, /) -> Self | Nil:
-        return self._right
-
-    @right.setter
-    def right(self, node: Self | Nil) -> None:
-        self._right = node
-        _set_parent(node, self)
-
-    @property
-    def value(self, /) -> ValueT:
-        return self._value
-
-    @value.setter
-    def value(self, value: ValueT) -> None:
-        self._value = value
-
-    __slots__ = (
-        '__weakref__',
-        '_key',
-        '_left',
-        '_parent',
-        '_right',
-        '_value',
-        'height',
-    )
+    __slots__ = 'height', 'key', 'left', 'right', 'size', 'value'
 
     def __init__(
         self,
@@ -84,38 +37,36 @@ class Node(abcs.HasCustomRepr, Generic[KeyT, ValueT]):
         *,
         left: Self | Nil = NIL,
         right: Self | Nil = NIL,
-        parent: Self | Nil = NIL,
     ) -> None:
-        self._key, self._value = key, value
-        self.left, self.right, self.parent = left, right, parent
-        self.height = max(_to_height(self.left), _to_height(self.right)) + 1
+        self.key, self.value = key, value
+        self.left, self.right = left, right
+        self.height = max(_to_height(left), _to_height(right)) + 1
+        self.size = _to_size(left) + _to_size(right) + 1
 
     __repr__ = recursive_repr()(generate_repr(__init__))
 
     def __getstate__(
         self, /
-    ) -> tuple[KeyT, ValueT, int, Self | Nil, Self | Nil, Self | Nil]:
+    ) -> tuple[KeyT, ValueT, int, int, Self | Nil, Self | Nil]:
         return (
-            self._key,
-            self._value,
+            self.key,
+            self.value,
             self.height,
-            self.parent,
+            self.size,
             self.left,
             self.right,
         )
 
     def __setstate__(
-        self,
-        state: tuple[KeyT, ValueT, int, Self | Nil, Self | Nil, Self | Nil],
-        /,
+        self, state: tuple[KeyT, ValueT, int, int, Self | Nil, Self | Nil], /
     ) -> None:
         (
-            self._key,
-            self._value,
+            self.key,
+            self.value,
             self.height,
-            self.parent,
-            self._left,
-            self._right,
+            self.size,
+            self.left,
+            self.right,
         ) = state
 
 
@@ -123,15 +74,49 @@ def _to_height(node: Node[KeyT, ValueT] | Nil, /) -> int:
     return -1 if node is NIL else node.height
 
 
-def _update_height(node: Node[KeyT, ValueT], /) -> None:
-    node.height = max(_to_height(node.left), _to_height(node.right)) + 1
+def _to_size(node: Node[KeyT, ValueT] | Nil, /) -> int:
+    return 0 if node is NIL else node.size
 
 
-def _set_parent(
-    node: Node[KeyT, ValueT] | Nil, parent: Node[KeyT, ValueT] | Nil, /
-) -> None:
-    if node is not NIL:
-        node.parent = parent
+def _update_metadata(node: Node[KeyT, ValueT], /) -> None:
+    node.height = max(_to_height(node.left), _to_height(node.right)) + 1
+    node.size = _to_size(node.left) + _to_size(node.right) + 1
+
+
+def _clone_node(node: Node[KeyT, ValueT], /) -> Node[KeyT, ValueT]:
+    result = Node(node.key, node.value)
+    result.height, result.size = node.height, node.size
+    return result
+
+
+def _to_balanced_root(
+    keys: Sequence[KeyT], values: Sequence[ValueT], /
+) -> Node[KeyT, ValueT] | Nil:
+    if not keys:
+        return NIL
+    nodes = list(map(Node, keys, values))
+    # subtrees are formed by bisection of nodes' ranges level by level,
+    # so nodes are linked without recursion
+    starts, ends = [0], [len(nodes)]
+    while starts:
+        next_starts: list[int] = []
+        next_ends: list[int] = []
+        for start_index, end_index in zip(starts, ends, strict=True):
+            middle_index = (start_index + end_index) // 2
+            node = nodes[middle_index]
+            # bisection gives subtrees of the minimal height
+            node.size = size = end_index - start_index
+            node.height = size.bit_length() - 1
+            if middle_index > start_index:
+                node.left = nodes[(start_index + middle_index) // 2]
+                next_starts.append(start_index)
+                next_ends.append(middle_index)
+            if middle_index < end_index - 1:
+                node.right = nodes[(middle_index + 1 + end_index) // 2]
+                next_starts.append(middle_index + 1)
+                next_ends.append(end_index)
+        starts, ends = next_starts, next_ends
+    return nodes[len(nodes) // 2]
 
 
 class Tree(abcs.Tree[KeyT, ValueT]):
@@ -139,34 +124,49 @@ class Tree(abcs.Tree[KeyT, ValueT]):
     def root(self, /) -> Node[KeyT, ValueT] | Nil:
         return self._root
 
+    @property
+    @override
+    def version(self, /) -> int:
+        return self._version
+
     @override
     def predecessor(
         self, node: abcs.Node[KeyT, ValueT], /
     ) -> Node[KeyT, ValueT] | Nil:
+        result: Node[KeyT, ValueT] | Nil
         assert isinstance(node, Node), node
-        if node.left is NIL:
-            result = node.parent
-            while result is not NIL and node is result.left:
-                node, result = result, result.parent
-        else:
+        if node.left is not NIL:
             result = node.left
             while result.right is not NIL:
                 result = result.right
+        else:
+            result, cursor, key = NIL, self._root, node.key
+            while cursor is not node:
+                assert cursor is not NIL
+                if cursor.key < key:
+                    result, cursor = cursor, cursor.right
+                else:
+                    cursor = cursor.left
         return result
 
     @override
     def successor(
         self, node: abcs.Node[KeyT, ValueT], /
     ) -> Node[KeyT, ValueT] | Nil:
+        result: Node[KeyT, ValueT] | Nil
         assert isinstance(node, Node), node
-        if node.right is NIL:
-            result = node.parent
-            while result is not NIL and node is result.right:
-                node, result = result, result.parent
-        else:
+        if node.right is not NIL:
             result = node.right
             while result.left is not NIL:
                 result = result.left
+        else:
+            result, cursor, key = NIL, self._root, node.key
+            while cursor is not node:
+                assert cursor is not NIL
+                if key < cursor.key:
+                    result, cursor = cursor, cursor.left
+                else:
+                    cursor = cursor.right
         return result
 
     @overload
@@ -188,165 +188,532 @@ class Tree(abcs.Tree[KeyT, ValueT]):
         values: Iterable[ValueT] | None = None,
         /,
     ) -> Tree[KeyT, KeyT] | Tree[KeyT, ValueT]:
-        keys = list(keys)
-        if not keys:
-            return cls(NIL)
-        if values is None:
-            keys = to_unique_sorted_values(keys)
-
-            def to_simple_node(
-                start_index: int, end_index: int
-            ) -> Node[KeyT, KeyT]:
-                middle_index = (start_index + end_index) // 2
-                key = keys[middle_index]
-                return Node(
-                    key,
-                    key,
-                    left=(
-                        to_simple_node(start_index, middle_index)
-                        if middle_index > start_index
-                        else NIL
-                    ),
-                    right=(
-                        to_simple_node(middle_index + 1, end_index)
-                        if middle_index < end_index - 1
-                        else NIL
-                    ),
-                )
+        return cls._from_unique_sorted_components(
+            *to_unique_sorted_components(keys, values)
+        )
 
-            return cast(type[Tree[KeyT, KeyT]], cls)(
-                to_simple_node(0, len(keys))
-            )
-        items = to_unique_sorted_items(keys, list(values))
+    @overload
+    @classmethod
+    def from_sorted(
+        cls,
+        keys: Iterable[KeyT],
+        values: None = ...,
+        /,
+        *,
+        assume_unique: bool = ...,
+    ) -> Tree[KeyT, KeyT]: ...
 
-        def to_complex_node(
-            start_index: int, end_index: int, /
-        ) -> Node[KeyT, ValueT]:
-            middle_index = (start_index + end_index) // 2
-            key, value = items[middle_index]
-            return Node(
-                key,
-                value,
-                left=(
-                    to_complex_node(start_index, middle_index)
-                    if middle_index > start_index
-                    else NIL
-                ),
-                right=(
-                    to_complex_node(middle_index + 1, end_index)
-                    if middle_index < end_index - 1
-                    else NIL
-                ),
-            )
+    @overload
+    @classmethod
+    def from_sorted(
+        cls,
+        keys: Iterable[KeyT],
+        values: Iterable[ValueT],
+        /,
+        *,
+        assume_unique: bool = ...,
+    ) -> Tree[KeyT, ValueT]: ...
 
-        return cast(type[Tree[KeyT, ValueT]], cls)(
-            to_complex_node(0, len(items))
+    @classmethod
+    def from_sorted(
+        cls: type[Tree[KeyT, KeyT]] | type[Tree[KeyT, ValueT]],
+        keys: Iterable[KeyT],
+        values: Iterable[ValueT] | None = None,
+        /,
+        *,
+        assume_unique: bool = False,
+    ) -> Tree[KeyT, KeyT] | Tree[KeyT, ValueT]:
+        return cls._from_unique_sorted_components(
+            *to_sorted_components(keys, values, assume_unique=assume_unique)
         )
 
+    @classmethod
+    def _from_unique_sorted_components(
+        cls, keys: Sequence[KeyT], values: Sequence[ValueT], /
+    ) -> Self:
+        return cls(_to_balanced_root(keys, values))
+
+    @override
+    def bisect_left(self, key: KeyT, /) -> int:
+        node, result = self._root, 0
+        while node is not NIL:
+            if node.key < key:
+                result += _to_size(node.left) + 1
+                node = node.right
+            else:
+                node = node.left
+        return result
+
+    @override
+    def bisect_right(self, key: KeyT, /) -> int:
+        node, result = self._root, 0
+        while node is not NIL:
+            if key < node.key:
+                node = node.left
+            else:
+                result += _to_size(node.left) + 1
+                node = node.right
+        return result
+
     @override
     def clear(self, /) -> None:
         self._root = NIL
+        self._version += 1
+
+    @override
+    def delete_range(
+        self,
+        lo: KeyT | None = None,
+        hi: KeyT | None = None,
+        /,
+        *,
+        inclusive: tuple[bool, bool] = (True, False),
+    ) -> Self:
+        is_lo_inclusive, is_hi_inclusive = inclusive
+        lower, rest = (
+            (NIL, self._root)
+            if lo is None
+            else self._split_by(
+                self._root, lo, is_inclusive=not is_lo_inclusive
+            )
+        )
+        middle, upper = (
+            (rest, NIL)
+            if hi is None
+            else self._split_by(rest, hi, is_inclusive=is_hi_inclusive)
+        )
+        self._root = self._concatenate(lower, upper)
+        self._version += 1
+        return type(self)(middle)
 
     @override
     def insert(self, key: KeyT, value: ValueT, /) -> Node[KeyT, ValueT]:
-        parent = self.root
+        parent = self._root
         if parent is NIL:
             node = self._root = Node(key, value)
+            self._version += 1
             return node
+        # the last node which key is not greater than the given one
+        # is checked for equality only once the leaf is reached
+        candidate: Node[KeyT, ValueT] | Nil
+        ancestors, candidate = [], NIL
         while True:
+            ancestors.append(parent)
             if key < parent.key:
                 if parent.left is NIL:
-                    node = Node(key, value)
-                    parent.left = node
+                    if candidate is not NIL and not candidate.key < key:
+                        return candidate
+                    node = parent.left = Node(key, value)
                     break
                 parent = parent.left
-            elif parent.key < key:
+            else:
                 if parent.right is NIL:
-                    node = Node(key, value)
-                    parent.right = node
+                    if not parent.key < key:
+                        return parent
+                    node = parent.right = Node(key, value)
                     break
-                parent = parent.right
-            else:
-                return parent
-        self._rebalance(node.parent)
+                candidate, parent = parent, parent.right
+        self._rebalance(ancestors)
+        self._version += 1
         return node
 
+    @override
+    def intersect(self, other: Self, /) -> Self:
+        if not isinstance(other, Tree) or other is self:
+            return super().intersect(other)
+        # recursion goes over the lower tree
+        # so the result is not higher than any of operands
+        root = (
+            self._intersect(self._root, other._root, prefer_base=True)
+            if _to_height(self._root) <= _to_height(other._root)
+            else self._intersect(other._root, self._root, prefer_base=False)
+        )
+        self._root = other._root = NIL
+        self._version += 1
+        other._version += 1
+        return type(self)(root)
+
+    @override
+    def join(self, other: Self, /) -> Self:
+        if not isinstance(other, Tree):
+            return super().join(other)
+        left, right = self._root, other._root
+        if left is NIL:
+            root = right
+        elif right is NIL:
+            root = left
+        else:
+            max_node = left
+            while max_node.right is not NIL:
+                max_node = max_node.right
+            min_node = right
+            while min_node.left is not NIL:
+                min_node = min_node.left
+            if not max_node.key < min_node.key:
+                raise ValueError(
+                    'Keys of the tree should be less '
+                    'than keys of the other one.'
+                )
+            rest, last = self._split_last(left)
+            root = self._join(rest, last, right)
+        self._root = other._root = NIL
+        self._version += 1
+        other._version += 1
+        return type(self)(root)
+
     @override
     def remove(self, node: abcs.Node[KeyT, ValueT], /) -> None:
         assert isinstance(node, Node), node
+        self._version += 1
+        ancestors = self._to_ancestors(node)
+        parent = ancestors[-1] if ancestors else NIL
         if node.left is NIL:
-            imbalanced_node = node.parent
-            self._transplant(node, node.right)
+            self._replace_child(parent, node, node.right)
         elif node.right is NIL:
-            imbalanced_node = node.parent
-            self._transplant(node, node.left)
+            self._replace_child(parent, node, node.left)
         else:
-            successor = node.right
+            successor, successor_ancestors = node.right, []
             while successor.left is not NIL:
+                successor_ancestors.append(successor)
                 successor = successor.left
-            if successor.parent is node:
-                imbalanced_node = successor
-            else:
-                imbalanced_node = successor.parent
-                self._transplant(successor, successor.right)
+            if successor_ancestors:
+                successor_ancestors[-1].left = successor.right
                 successor.right = node.right
-            self._transplant(node, successor)
-            successor.left, successor.left.parent = node.left, successor
-        self._rebalance(imbalanced_node)
+            successor.left = node.left
+            self._replace_child(parent, node, successor)
+            ancestors.append(successor)
+            ancestors.extend(successor_ancestors)
+        self._rebalance(ancestors)
 
-    def _rebalance(self, node: Node[KeyT, ValueT] | Nil) -> None:
-        while node is not NIL:
-            _update_height(node)
-            if node.balance_factor > 1:
-                assert node.left is not NIL
-                if node.left.balance_factor < 0:
-                    self._rotate_left(node.left)
-                self._rotate_right(node)
-            elif node.balance_factor < -1:
-                assert node.right is not NIL
-                if node.right.balance_factor > 0:
-                    self._rotate_right(node.right)
-                self._rotate_left(node)
-            node = node.parent
-
-    def _rotate_left(self, node: Node[KeyT, ValueT], /) -> None:
-        replacement = node.right
-        assert replacement is not NIL
-        self._transplant(node, replacement)
-        node.right, replacement.left = replacement.left, node
-        _update_height(node)
-        _update_height(replacement)
+    @override
+    def select(self, index: int, /) -> Node[KeyT, ValueT] | Nil:
+        node = self._root
+        if not 0 <= index < _to_size(node):
+            return NIL
+        while True:
+            assert node is not NIL
+            left_size = _to_size(node.left)
+            if index < left_size:
+                node = node.left
+            elif index > left_size:
+                index -= left_size + 1
+                node = node.right
+            else:
+                return node
 
-    def _rotate_right(self, node: Node[KeyT, ValueT], /) -> None:
-        replacement = node.left
-        assert replacement is not NIL
-        self._transplant(node, replacement)
-        node.left, replacement.right = replacement.right, node
-        _update_height(node)
-        _update_height(replacement)
+    @override
+    def split(self, key: KeyT, /) -> tuple[Self, Self]:
+        lower, found, upper = self._split(self._root, key)
+        if found is not NIL:
+            upper = self._join(NIL, found, upper)
+        self._root = NIL
+        self._version += 1
+        return type(self)(lower), type(self)(upper)
+
+    @override
+    def subtract(self, other: Self, /) -> Self:
+        if not isinstance(other, Tree) or other is self:
+            return super().subtract(other)
+        root = self._subtract(self._root, other._root)
+        self._root = other._root = NIL
+        self._version += 1
+        other._version += 1
+        return type(self)(root)
+
+    @override
+    def symmetric_subtract(self, other: Self, /) -> Self:
+        if not isinstance(other, Tree) or other is self:
+            return super().symmetric_subtract(other)
+        root = self._symmetric_subtract(self._root, other._root)
+        self._root = other._root = NIL
+        self._version += 1
+        other._version += 1
+        return type(self)(root)
+
+    @override
+    def unite(self, other: Self, /) -> Self:
+        if not isinstance(other, Tree) or other is self:
+            return super().unite(other)
+        root = self._unite(self._root, other._root)
+        self._root = other._root = NIL
+        self._version += 1
+        other._version += 1
+        return type(self)(root)
+
+    @classmethod
+    def _concatenate(
+        cls, left: Node[KeyT, ValueT] | Nil, right: Node[KeyT, ValueT] | Nil, /
+    ) -> Node[KeyT, ValueT] | Nil:
+        if left is NIL:
+            return right
+        rest, last = cls._split_last(left)
+        return cls._join(rest, last, right)
+
+    @classmethod
+    def _intersect(
+        cls,
+        base: Node[KeyT, ValueT] | Nil,
+        other: Node[KeyT, ValueT] | Nil,
+        /,
+        *,
+        prefer_base: bool,
+    ) -> Node[KeyT, ValueT] | Nil:
+        if base is NIL or other is NIL:
+            return NIL
+        left, right = base.left, base.right
+        lower, found, upper = cls._split(other, base.key)
+        left = cls._intersect(left, lower, prefer_base=prefer_base)
+        right = cls._intersect(right, upper, prefer_base=prefer_base)
+        if found is NIL:
+            return cls._concatenate(left, right)
+        return cls._join(left, base if prefer_base else found, right)
+
+    @classmethod
+    def _join(
+        cls,
+        left: Node[KeyT, ValueT] | Nil,
+        node: Node[KeyT, ValueT],
+        right: Node[KeyT, ValueT] | Nil,
+        /,
+    ) -> Node[KeyT, ValueT]:
+        if _to_height(left) > _to_height(right) + 1:
+            assert left is not NIL
+            return cls._join_right(left, node, right)
+        if _to_height(right) > _to_height(left) + 1:
+            assert right is not NIL
+            return cls._join_left(left, node, right)
+        node.left, node.right = left, right
+        _update_metadata(node)
+        return node
+
+    @classmethod
+    def _join_left(
+        cls,
+        left: Node[KeyT, ValueT] | Nil,
+        node: Node[KeyT, ValueT],
+        right: Node[KeyT, ValueT],
+        /,
+    ) -> Node[KeyT, ValueT]:
+        if _to_height(right.left) <= _to_height(left) + 1:
+            node.left, node.right = left, right.left
+            _update_metadata(node)
+            right.left = (
+                node
+                if node.height <= _to_height(right.right) + 1
+                else cls._rotated_left(node)
+            )
+        else:
+            assert right.left is not NIL
+            right.left = cls._join_left(left, node, right.left)
+        _update_metadata(right)
+        return (
+            right
+            if right.left.height <= _to_height(right.right) + 1
+            else cls._rotated_right(right)
+        )
+
+    @classmethod
+    def _join_right(
+        cls,
+        left: Node[KeyT, ValueT],
+        node: Node[KeyT, ValueT],
+        right: Node[KeyT, ValueT] | Nil,
+        /,
+    ) -> Node[KeyT, ValueT]:
+        if _to_height(left.right) <= _to_height(right) + 1:
+            node.left, node.right = left.right, right
+            _update_metadata(node)
+            left.right = (
+                node
+                if node.height <= _to_height(left.left) + 1
+                else cls._rotated_right(node)
+            )
+        else:
+            assert left.right is not NIL
+            left.right = cls._join_right(left.right, node, right)
+        _update_metadata(left)
+        return (
+            left
+            if left.right.height <= _to_height(left.left) + 1
+            else cls._rotated_left(left)
+        )
+
+    def _rebalance(self, path: list[Node[KeyT, ValueT]], /) -> None:
+        to_balanced = self._to_balanced
+        while path:
+            node = path.pop()
+            replacement = to_balanced(node)
+            if replacement is not node:
+                self._replace_child(
+                    path[-1] if path else NIL, node, replacement
+                )
 
-    def _transplant(
+    def _replace_child(
         self,
+        parent: Node[KeyT, ValueT] | Nil,
         origin: Node[KeyT, ValueT],
         replacement: Node[KeyT, ValueT] | Nil,
         /,
     ) -> None:
-        parent = origin.parent
         if parent is NIL:
             self._root = replacement
-            _set_parent(replacement, NIL)
         elif origin is parent.left:
             parent.left = replacement
         else:
             parent.right = replacement
 
+    @staticmethod
+    def _rotated_left(node: Node[KeyT, ValueT], /) -> Node[KeyT, ValueT]:
+        replacement = node.right
+        assert replacement is not NIL
+        node.right, replacement.left = replacement.left, node
+        _update_metadata(node)
+        _update_metadata(replacement)
+        return replacement
+
+    @staticmethod
+    def _rotated_right(node: Node[KeyT, ValueT], /) -> Node[KeyT, ValueT]:
+        replacement = node.left
+        assert replacement is not NIL
+        node.left, replacement.right = replacement.right, node
+        _update_metadata(node)
+        _update_metadata(replacement)
+        return replacement
+
+    @classmethod
+    def _split(
+        cls, node: Node[KeyT, ValueT] | Nil, key: KeyT, /
+    ) -> tuple[
+        Node[KeyT, ValueT] | Nil,
+        Node[KeyT, ValueT] | Nil,
+        Node[KeyT, ValueT] | Nil,
+    ]:
+        if node is NIL:
+            return NIL, NIL, NIL
+        left, right = node.left, node.right
+        if key < node.key:
+            lower, found, upper = cls._split(left, key)
+            return lower, found, cls._join(upper, node, right)
+        if node.key < key:
+            lower, found, upper = cls._split(right, key)
+            return cls._join(left, node, lower), found, upper
+        return left, node, right
+
+    @classmethod
+    def _split_by(
+        cls,
+        node: Node[KeyT, ValueT] | Nil,
+        key: KeyT,
+        /,
+        *,
+        is_inclusive: bool,
+    ) -> tuple[Node[KeyT, ValueT] | Nil, Node[KeyT, ValueT] | Nil]:
+        # node with the key goes to the lower part if it is inclusive
+        lower, found, upper = cls._split(node, key)
+        if found is not NIL:
+            if is_inclusive:
+                lower = cls._join(lower, found, NIL)
+            else:
+                upper = cls._join(NIL, found, upper)
+        return lower, upper
+
+    @classmethod
+    def _split_last(
+        cls, node: Node[KeyT, ValueT], /
+    ) -> tuple[Node[KeyT, ValueT] | Nil, Node[KeyT, ValueT]]:
+        if node.right is NIL:
+            return node.left, node
+        rest, last = cls._split_last(node.right)
+        return cls._join(node.left, node, rest), last
+
+    @classmethod
+    def _subtract(
+        cls,
+        minuend: Node[KeyT, ValueT] | Nil,
+        subtrahend: Node[KeyT, ValueT] | Nil,
+        /,
+    ) -> Node[KeyT, ValueT] | Nil:
+        if minuend is NIL or subtrahend is NIL:
+            return minuend
+        left, right = minuend.left, minuend.right
+        lower, found, upper = cls._split(subtrahend, minuend.key)
+        left, right = cls._subtract(left, lower), cls._subtract(right, upper)
+        if found is NIL:
+            return cls._join(left, minuend, right)
+        return cls._concatenate(left, right)
+
+    @classmethod
+    def _symmetric_subtract(
+        cls,
+        first: Node[KeyT, ValueT] | Nil,
+        second: Node[KeyT, ValueT] | Nil,
+        /,
+    ) -> Node[KeyT, ValueT] | Nil:
+        if first is NIL:
+            return second
+        if second is NIL:
+            return first
+        left, right = first.left, first.right
+        lower, found, upper = cls._split(second, first.key)
+        left = cls._symmetric_subtract(left, lower)
+        right = cls._symmetric_subtract(right, upper)
+        if found is NIL:
+            return cls._join(left, first, right)
+        return cls._concatenate(left, right)
+
+    def _to_ancestors(
+        self, node: Node[KeyT, ValueT], /
+    ) -> list[Node[KeyT, ValueT]]:
+        result, cursor, key = [], self._root, node.key
+        while cursor is not node:
+            assert cursor is not NIL
+            result.append(cursor)
+            cursor = cursor.left if key < cursor.key else cursor.right
+        return result
+
+    @classmethod
+    def _to_balanced(cls, node: Node[KeyT, ValueT], /) -> Node[KeyT, ValueT]:
+        _update_metadata(node)
+        if node.balance_factor > 1:
+            assert node.left is not NIL
+            if node.left.balance_factor < 0:
+                node.left = cls._rotated_left(node.left)
+            return cls._rotated_right(node)
+        if node.balance_factor < -1:
+            assert node.right is not NIL
+            if node.right.balance_factor > 0:
+                node.right = cls._rotated_right(node.right)
+            return cls._rotated_left(node)
+        return node
+
+    @classmethod
+    def _unite(
+        cls,
+        first: Node[KeyT, ValueT] | Nil,
+        second: Node[KeyT, ValueT] | Nil,
+        /,
+    ) -> Node[KeyT, ValueT] | Nil:
+        if first is NIL:
+            return second
+        if second is NIL:
+            return first
+        left, right = first.left, first.right
+        lower, _, upper = cls._split(second, first.key)
+        return cls._join(
+            cls._unite(left, lower), first, cls._unite(right, upper)
+        )
+
     _root: Node[KeyT, ValueT] | Nil
 
-    __slots__ = ('_root',)
+    __slots__ = '_root', '_version'
 
     @override
     def __copy__(self, /) -> Self:
-        return type(self)(copy.deepcopy(self._root))
+        return type(self)(abcs.clone_subtree(self._root, _clone_node))
 
     def __init__(self, root: Node[KeyT, ValueT] | Nil, /) -> None:
-        self._root = root
+        self._root, self._version = root, 0
+
+    @override
+    def __len__(self, /) -> int:
+        return _to_size(self._root)
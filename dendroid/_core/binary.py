@@ -1,8 +1,7 @@
 from __future__ import annotations
 
-import copy
-from collections.abc import Iterable
-from typing import Generic, cast, overload
+from collections.abc import Iterable, Sequence
+from typing import Generic, overload
 
 from reprit.base import generate_repr
 from typing_extensions import Self, override
@@ -10,11 +9,7 @@ from typing_extensions import Self, override
 from . import abcs
 from .hints import Item, KeyT, ValueT
 from .nil import NIL, Nil
-from .utils import (
-    are_keys_equal,
-    to_unique_sorted_items,
-    to_unique_sorted_values,
-)
+from .utils import to_sorted_components, to_unique_sorted_components
 
 
 class Node(abcs.HasCustomRepr, Generic[KeyT, ValueT]):
@@ -22,38 +17,12 @@ class Node(abcs.HasCustomRepr, Generic[KeyT, ValueT]):
     def item(self, /) -> Item[KeyT, ValueT]:
         return self.key, self.value
 
-    @property
-    def key(self, /) -> KeyT:
-        return self._key
-
-    @property
-    def left(self, /) -> Self | Nil:
-        return self._left
-
-    @left.setter
-    def left(self, value: Self | Nil, /) -> None:
-        self._left = value
-
-    @property
-    def right(self, /) -> Self | Nil:
-        return self._right
-
-    @right.setter
-    def right(self, value: Self | Nil) -> None:
-        self._right = value
+    key: KeyT
+    left: Self | Nil
+    right: Self | Nil
+    value: ValueT
 
-    @property
-    def value(self, /) -> ValueT:
-        return self._value
-
-    @value.setter
-    def value(self, value: ValueT) -> None:
-        self._value = value
-
-    _left: Self | Nil
-    _right: Self | Nil
-
-    __slots__ = '_key', '_left', '_right', '_value'
+    __slots__ = 'key', 'left', 'right', 'value'
 
     def __init__(
         self,
@@ -64,16 +33,42 @@ class Node(abcs.HasCustomRepr, Generic[KeyT, ValueT]):
         left: Self | Nil = NIL,
         right: Self | Nil = NIL,
     ) -> None:
-        self._key, self._value, self._left, self._right = (
-            key,
-            value,
-            left,
-            right,
-        )
+        self.key, self.value, self.left, self.right = (key, value, left, right)
 
     __repr__ = generate_repr(__init__)
 
 
+def _clone_node(node: Node[KeyT, ValueT], /) -> Node[KeyT, ValueT]:
+    return Node(node.key, node.value)
+
+
+def _to_balanced_root(
+    keys: Sequence[KeyT], values: Sequence[ValueT], /
+) -> Node[KeyT, ValueT] | Nil:
+    if not keys:
+        return NIL
+    nodes = list(map(Node, keys, values))
+    # subtrees are formed by bisection of nodes' ranges level by level,
+    # so nodes are linked without recursion
+    starts, ends = [0], [len(nodes)]
+    while starts:
+        next_starts: list[int] = []
+        next_ends: list[int] = []
+        for start_index, end_index in zip(starts, ends, strict=True):
+            middle_index = (start_index + end_index) // 2
+            node = nodes[middle_index]
+            if middle_index > start_index:
+                node.left = nodes[(start_index + middle_index) // 2]
+                next_starts.append(start_index)
+                next_ends.append(middle_index)
+            if middle_index < end_index - 1:
+                node.right = nodes[(middle_index + 1 + end_index) // 2]
+                next_starts.append(middle_index + 1)
+                next_ends.append(end_index)
+        starts, ends = next_starts, next_ends
+    return nodes[len(nodes) // 2]
+
+
 class Tree(abcs.Tree[KeyT, ValueT]):
     @overload
     @classmethod
@@ -85,7 +80,7 @@ class Tree(abcs.Tree[KeyT, ValueT]):
     @classmethod
     def from_components(
         cls, keys: Iterable[KeyT], values: Iterable[ValueT], /
-    ) -> Self: ...
+    ) -> Tree[KeyT, ValueT]: ...
 
     @classmethod
     def from_components(
@@ -94,94 +89,116 @@ class Tree(abcs.Tree[KeyT, ValueT]):
         values: Iterable[ValueT] | None = None,
         /,
     ) -> Tree[KeyT, KeyT] | Tree[KeyT, ValueT]:
-        keys = list(keys)
-        if not keys:
-            return cls(NIL)
-        if values is None:
-            keys = to_unique_sorted_values(keys)
-
-            def to_simple_node(
-                start_index: int, end_index: int, /
-            ) -> Node[KeyT, KeyT]:
-                middle_index = (start_index + end_index) // 2
-                key = keys[middle_index]
-                return Node(
-                    key,
-                    key,
-                    left=(
-                        to_simple_node(start_index, middle_index)
-                        if middle_index > start_index
-                        else NIL
-                    ),
-                    right=(
-                        to_simple_node(middle_index + 1, end_index)
-                        if middle_index < end_index - 1
-                        else NIL
-                    ),
-                )
-
-            return cast(type[Tree[KeyT, KeyT]], cls)(
-                to_simple_node(0, len(keys))
-            )
-        items = to_unique_sorted_items(keys, tuple(values))
-
-        def to_complex_node(
-            start_index: int, end_index: int, /
-        ) -> Node[KeyT, ValueT]:
-            middle_index = (start_index + end_index) // 2
-            key, value = items[middle_index]
-            return Node(
-                key,
-                value,
-                left=(
-                    to_complex_node(start_index, middle_index)
-                    if middle_index > start_index
-                    else NIL
-                ),
-                right=(
-                    to_complex_node(middle_index + 1, end_index)
-                    if middle_index < end_index - 1
-                    else NIL
-                ),
-            )
-
-        return cast(type[Tree[KeyT, ValueT]], cls)(
-            to_complex_node(0, len(items))
+        return cls._from_unique_sorted_components(
+            *to_unique_sorted_components(keys, values)
+        )
+
+    @overload
+    @classmethod
+    def from_sorted(
+        cls,
+        keys: Iterable[KeyT],
+        values: None = ...,
+        /,
+        *,
+        assume_unique: bool = ...,
+    ) -> Tree[KeyT, KeyT]: ...
+
+    @overload
+    @classmethod
+    def from_sorted(
+        cls,
+        keys: Iterable[KeyT],
+        values: Iterable[ValueT],
+        /,
+        *,
+        assume_unique: bool = ...,
+    ) -> Tree[KeyT, ValueT]: ...
+
+    @classmethod
+    def from_sorted(
+        cls: type[Tree[KeyT, KeyT]] | type[Tree[KeyT, ValueT]],
+        keys: Iterable[KeyT],
+        values: Iterable[ValueT] | None = None,
+        /,
+        *,
+        assume_unique: bool = False,
+    ) -> Tree[KeyT, KeyT] | Tree[KeyT, ValueT]:
+        return cls._from_unique_sorted_components(
+            *to_sorted_components(keys, values, assume_unique=assume_unique)
         )
 
+    @classmethod
+    def _from_unique_sorted_components(
+        cls, keys: Sequence[KeyT], values: Sequence[ValueT], /
+    ) -> Self:
+        return cls(_to_balanced_root(keys, values), len(keys))
+
     @property
     def root(self, /) -> Node[KeyT, ValueT] | Nil:
         return self._root
 
+    @property
+    @override
+    def version(self, /) -> int:
+        return self._version
+
     @override
     def clear(self, /) -> None:
-        self._root = NIL
+        self._root, self._size = NIL, 0
+        self._version += 1
+
+    @override
+    def count_range(
+        self,
+        lo: KeyT | None = None,
+        hi: KeyT | None = None,
+        /,
+        *,
+        inclusive: tuple[bool, bool] = (True, False),
+    ) -> int:
+        # nodes do not store sizes of subtrees,
+        # so counting takes time linear in the number of nodes in the range
+        return sum(1 for _ in self.irange(lo, hi, inclusive=inclusive))
 
     @override
     def insert(self, key: KeyT, value: ValueT, /) -> Node[KeyT, ValueT]:
         parent = self._root
         if parent is NIL:
             node = self._root = Node(key, value)
+            self._size += 1
+            self._version += 1
             return node
+        # the last node which key is not greater than the given one
+        # is checked for equality only once the leaf is reached
+        candidate: Node[KeyT, ValueT] | Nil = NIL
         while True:
             if key < parent.key:
                 if parent.left is NIL:
+                    if candidate is not NIL and not candidate.key < key:
+                        return candidate
                     node = parent.left = Node(key, value)
+                    self._size += 1
+                    self._version += 1
                     return node
                 parent = parent.left
-            elif parent.key < key:
+            else:
                 if parent.right is NIL:
+                    if not parent.key < key:
+                        return parent
                     node = parent.right = Node(key, value)
+                    self._size += 1
+                    self._version += 1
                     return node
-                parent = parent.right
-            else:
-                return parent
+                candidate, parent = parent, parent.right
 
     @override
     def popmax(self, /) -> Node[KeyT, ValueT] | Nil:
         node = self._root
         if node is NIL:
             return node
+        self._size -= 1
+        self._version += 1
         if node.right is NIL:
             self._root = node.left
             return node
@@ -197,6 +214,8 @@ class Tree(abcs.Tree[KeyT, ValueT]):
         node = self._root
         if node is NIL:
             return node
+        self._size -= 1
+        self._version += 1
         if node.left is NIL:
             self._root = node.right
             return node
@@ -232,8 +251,11 @@ class Tree(abcs.Tree[KeyT, ValueT]):
         assert isinstance(_node, Node), _node
         node: Node[KeyT, ValueT] = _node
         assert self._root is not NIL
+        self._size -= 1
+        self._version += 1
+        # removed node belongs to the tree, so it is found by identity
         parent, key = self._root, node.key
-        if are_keys_equal(key, parent.key):
+        if parent is node:
             if parent.left is NIL:
                 self._root = parent.right
             else:
@@ -261,7 +283,7 @@ class Tree(abcs.Tree[KeyT, ValueT]):
             if key < parent.key:
                 # search in left subtree
                 assert parent.left is not NIL
-                if are_keys_equal(key, parent.left.key):
+                if parent.left is _node:
                     # remove `parent.left`
                     cursor = parent.left.left
                     if cursor is NIL:
@@ -290,7 +312,7 @@ class Tree(abcs.Tree[KeyT, ValueT]):
             # search in right subtree
             else:
                 assert parent.right is not NIL
-                if are_keys_equal(key, parent.right.key):
+                if parent.right is _node:
                     # remove `parent.right`
                     cursor = parent.right.left
                     if cursor is NIL:
@@ -338,12 +360,20 @@ class Tree(abcs.Tree[KeyT, ValueT]):
         return result
 
     _root: Node[KeyT, ValueT] | Nil
+    _size: int
+    _version: int
 
-    __slots__ = ('_root',)
+    __slots__ = '_root', '_size', '_version'
 
     @override
     def __copy__(self, /) -> Self:
-        return type(self)(copy.deepcopy(self._root))
+        return type(self)(
+            abcs.clone_subtree(self._root, _clone_node), self._size
+        )
+
+    def __init__(self, root: Node[KeyT, ValueT] | Nil, size: int, /) -> None:
+        self._root, self._size, self._version = root, size, 0
 
-    def __init__(self, root: Node[KeyT, ValueT] | Nil, /) -> None:
-        self._root = root
+    @override
+    def __len__(self, /) -> int:
+        return self._size
@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+from typing import Any
+
+from . import keyed, mirrored
+from .abcs import Tree
+from .hints import KeyT, ValueT
+
+
+def to_backend(
+    tree: Tree[KeyT, ValueT],
+    cls: type[Tree[Any, Any]],
+    /,
+    values: Sequence[Any] | None = None,
+) -> Tree[KeyT, ValueT]:
+    """
+    Constructs tree of given class with the same items & adapters
+    by walking given tree in order, so it takes linear time.
+
+    Values (if given) replace ones of the tree preserving its order.
+    """
+    if isinstance(tree, mirrored.Tree):
+        return mirrored.Tree(
+            to_backend(
+                tree.tree, cls, None if values is None else values[::-1]
+            )
+        )
+    if isinstance(tree, keyed.Tree):
+        # entries are mutable, so they should not be shared
+        entries = [
+            keyed.Node(entry.key, entry.value) for entry in tree.tree.values
+        ]
+        return keyed.Tree(to_backend(tree.tree, cls, entries), tree.key)
+    return cls.from_sorted(
+        tree.keys,
+        tree.values if values is None else values,
+        assume_unique=True,
+    )
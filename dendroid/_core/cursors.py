@@ -0,0 +1,278 @@
+from __future__ import annotations
+
+from typing import Any, Generic
+
+from . import keyed, mirrored, ranged
+from .abcs import Node, Tree, TreeWrapper
+from .hints import KeyT, Order, ValueT
+from .nil import NIL
+
+
+class Cursor(Generic[KeyT, ValueT]):
+    """
+    Position in a collection which moves between neighbouring keys
+    in amortized constant time by keeping the path to its node,
+    so nodes are not searched for from the root on each move.
+
+    Moves which have nowhere to go return ``False``
+    leaving the cursor where it was.
+
+    Structural changes of the collection
+    (including lookups in splay trees, since they restructure them)
+    are detected, so the path gets rebuilt from the key of the cursor
+    in logarithmic time on the next access:
+    if the key has been removed, ``key`` & ``value`` raise ``KeyError``,
+    while ``next`` & ``prev`` move to its nearest remaining neighbours.
+    """
+
+    @property
+    def key(self, /) -> KeyT:
+        node = self._to_node()
+        result: KeyT = node.value.key if self._is_keyed else node.key
+        return result
+
+    @property
+    def value(self, /) -> ValueT:
+        node = self._to_node()
+        result: ValueT = node.value.value if self._is_keyed else node.value
+        return result
+
+    def first(self, /) -> bool:
+        """Moves to the first key returning whether the cursor has moved."""
+        return self._seek(None, is_forward=not self._is_reversed)
+
+    def last(self, /) -> bool:
+        """Moves to the last key returning whether the cursor has moved."""
+        return self._seek(None, is_forward=self._is_reversed)
+
+    def next(self, /) -> bool:
+        """Moves to the next key returning whether the cursor has moved."""
+        return self._move(is_forward=not self._is_reversed)
+
+    def prev(self, /) -> bool:
+        """
+        Moves to the previous key returning whether the cursor has moved.
+        """
+        return self._move(is_forward=self._is_reversed)
+
+    def seek(self, key: Any, /) -> bool:
+        """
+        Moves to the first key not less than the given one
+        returning whether the cursor has moved.
+        """
+        return self._seek(
+            key if self._order is None else self._order(key),
+            is_forward=not self._is_reversed,
+        )
+
+    __slots__ = (
+        '_base',
+        '_hi',
+        '_inclusive',
+        '_is_keyed',
+        '_is_positioned',
+        '_is_reversed',
+        '_key',
+        '_lo',
+        '_order',
+        '_path',
+        '_tree',
+        '_version',
+        '_wrapper',
+    )
+
+    def __init__(
+        self,
+        _wrapper: TreeWrapper[Any, ValueT],
+        /,
+        *,
+        order: Order[Any, KeyT] | None = None,
+    ) -> None:
+        self._wrapper, self._order = _wrapper, order
+        self._path: list[Node[Any, Any]] = []
+        self._key: Any = None
+        self._is_positioned = False
+        self._unwrap()
+
+    def __bool__(self, /) -> bool:
+        """Checks if the cursor is at some key."""
+        return self._is_positioned
+
+    def _is_key_in_range(self, key: Any, /) -> bool:
+        lo, hi = self._lo, self._hi
+        is_lo_inclusive, is_hi_inclusive = self._inclusive
+        return (
+            lo is None or (not key < lo if is_lo_inclusive else lo < key)
+        ) and (hi is None or (not hi < key if is_hi_inclusive else key < hi))
+
+    def _is_key_before_end(self, key: Any, /, *, is_forward: bool) -> bool:
+        # only the bound in the direction of a move can be crossed by it
+        if is_forward:
+            hi = self._hi
+            return hi is None or (
+                not hi < key if self._inclusive[1] else key < hi
+            )
+        lo = self._lo
+        return lo is None or (not key < lo if self._inclusive[0] else lo < key)
+
+    def _move(self, /, *, is_forward: bool) -> bool:
+        if not self._is_positioned:
+            return False
+        path = self._path
+        if (
+            self._wrapper._tree is not self._tree  # ruff: ignore[private-member-access]
+            or self._base.version != self._version
+            or not path
+        ):
+            self._unwrap()
+            # the path is rebuilt from the key, which can be removed by now
+            path = _to_path(
+                self._base.root,
+                self._key,
+                is_forward=is_forward,
+                is_strict=True,
+            )
+            if not path or not self._is_key_before_end(
+                path[-1].key, is_forward=is_forward
+            ):
+                return False
+            self._path, self._key = path, path[-1].key
+            return True
+        node = path[-1]
+        child = node.right if is_forward else node.left
+        if child is not NIL:
+            size = len(path)
+            _descend(path, child, is_forward=is_forward)
+            if not self._is_key_before_end(
+                path[-1].key, is_forward=is_forward
+            ):
+                del path[size:]
+                return False
+        else:
+            # ancestors are skipped until the one left in the direction
+            index = len(path) - 1
+            if is_forward:
+                while index and path[index - 1].right is path[index]:
+                    index -= 1
+            else:
+                while index and path[index - 1].left is path[index]:
+                    index -= 1
+            if not index or not self._is_key_before_end(
+                path[index - 1].key, is_forward=is_forward
+            ):
+                return False
+            del path[index:]
+        self._key = path[-1].key
+        return True
+
+    def _seek(self, key: Any, /, *, is_forward: bool) -> bool:
+        self._synchronize()
+        bound, is_bound_inclusive = (
+            (self._lo, self._inclusive[0])
+            if is_forward
+            else (self._hi, self._inclusive[1])
+        )
+        is_strict = False
+        # keys before the range are replaced by its bound
+        if bound is not None and (
+            key is None
+            or (key < bound if is_forward else bound < key)
+            or (
+                not is_bound_inclusive
+                and not (bound < key if is_forward else key < bound)
+            )
+        ):
+            key, is_strict = bound, not is_bound_inclusive
+        root = self._base.root
+        path: list[Node[Any, Any]]
+        if key is None:
+            path = []
+            _descend(path, root, is_forward=is_forward)
+        else:
+            path = _to_path(
+                root, key, is_forward=is_forward, is_strict=is_strict
+            )
+        if not path or not self._is_key_in_range(path[-1].key):
+            return False
+        self._path, self._key, self._is_positioned = path, path[-1].key, True
+        return True
+
+    def _synchronize(self, /) -> bool:
+        # returns whether the path is still valid
+        tree = self._wrapper._tree  # ruff: ignore[private-member-access]
+        if tree is self._tree and self._base.version == self._version:
+            return True
+        self._unwrap()
+        return False
+
+    def _to_node(self, /) -> Node[Any, Any]:
+        if not self._is_positioned:
+            raise KeyError('Cursor is not at any key.')
+        if not self._synchronize() or not self._path:
+            key = self._key
+            path = _to_path(
+                self._base.root, key, is_forward=True, is_strict=False
+            )
+            if not path or key < path[-1].key:
+                raise KeyError('Key of the cursor has been removed.')
+            self._path = path
+        return self._path[-1]
+
+    def _unwrap(self, /) -> None:
+        # adapters are replaced by the state of the cursor,
+        # so it walks nodes of the underlying tree directly
+        tree: Tree[Any, Any]
+        tree = self._tree = self._wrapper._tree  # ruff: ignore[private-member-access]
+        self._is_keyed = self._is_reversed = False
+        self._lo = self._hi = None
+        self._inclusive = (True, True)
+        while True:
+            if isinstance(tree, keyed.Tree):
+                self._is_keyed, self._order = True, tree.key
+            elif isinstance(tree, mirrored.Tree):
+                self._is_reversed = not self._is_reversed
+            elif isinstance(tree, ranged.Tree):
+                self._lo, self._hi, self._inclusive = (
+                    tree.lo,
+                    tree.hi,
+                    tree.inclusive,
+                )
+            else:
+                break
+            tree = tree.tree
+        self._base, self._version, self._path = tree, tree.version, []
+
+
+def _descend(
+    path: list[Node[Any, Any]], node: Any, /, *, is_forward: bool
+) -> None:
+    if is_forward:
+        while node is not NIL:
+            path.append(node)
+            node = node.left
+    else:
+        while node is not NIL:
+            path.append(node)
+            node = node.right
+
+
+def _to_path(
+    root: Any, key: Any, /, *, is_forward: bool, is_strict: bool
+) -> list[Node[Any, Any]]:
+    # path to the first node with a key after the given one
+    # (or equal to it if not strict) in the direction
+    path: list[Node[Any, Any]] = []
+    node, size = root, 0
+    while node is not NIL:
+        path.append(node)
+        if is_forward:
+            if not key < node.key if is_strict else node.key < key:
+                node = node.right
+            else:
+                size, node = len(path), node.left
+        elif not node.key < key if is_strict else key < node.key:
+            node = node.left
+        else:
+            size, node = len(path), node.right
+    del path[size:]
+    return path
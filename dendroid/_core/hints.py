@@ -8,7 +8,13 @@ class Ordered(Protocol):
     def __lt__(self, other: Self, /) -> bool: ...
 
 
+class Summable(Protocol):
+    def __add__(self, other: Self, /) -> Self: ...
+
+
 KeyT = TypeVar('KeyT', bound=Ordered)
+ResultT = TypeVar('ResultT', bound=Any)
+SummableT = TypeVar('SummableT', bound=Summable)
 ValueT = TypeVar('ValueT', bound=Any)
 Order: TypeAlias = Callable[[ValueT], KeyT]
 Item: TypeAlias = tuple[KeyT, ValueT]
@@ -0,0 +1,342 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from functools import wraps
+from typing import Any, cast
+
+from reprit.base import generate_repr
+
+from . import array_avl, keyed, mirrored, ranged, red_black, splay
+from .abcs import HasCustomRepr, Tree, restore_tree
+from .hints import KeyT, ValueT
+from .nil import NIL, Nil
+
+
+class Counters(HasCustomRepr):
+    """Counts of operations performed by an instrumented tree."""
+
+    def reset(self, /) -> None:
+        self.allocations = self.comparisons = self.recolourings = 0
+        self.rotations = self.splays = self.visits = self.weakrefs = 0
+
+    __slots__ = (
+        'allocations',
+        'comparisons',
+        'recolourings',
+        'rotations',
+        'splays',
+        'visits',
+        'weakrefs',
+    )
+
+    def __init__(
+        self,
+        /,
+        *,
+        allocations: int = 0,
+        comparisons: int = 0,
+        recolourings: int = 0,
+        rotations: int = 0,
+        splays: int = 0,
+        visits: int = 0,
+        weakrefs: int = 0,
+    ) -> None:
+        self.allocations, self.comparisons = allocations, comparisons
+        self.recolourings, self.rotations = recolourings, rotations
+        self.splays, self.visits, self.weakrefs = splays, visits, weakrefs
+
+    __repr__ = generate_repr(__init__)
+
+
+def instrument(tree: Tree[KeyT, ValueT], /) -> Counters:
+    """
+    Makes given tree count operations it performs & returns the counters.
+
+    Tree class is replaced with a subclass of its own
+    which overrides rotations & allocations of nodes,
+    so trees which are not instrumented do not pay for it.
+    Key comparisons & visits are counted by descending from the root
+    to keys being looked up right before the lookup itself,
+    so keys are compared only with each other, one level at a time.
+    """
+    # adapters delegate to the underlying tree
+    while isinstance(tree, keyed.Tree | mirrored.Tree | ranged.Tree):
+        tree = cast('Tree[KeyT, ValueT]', tree.tree)
+    cls = type(tree)
+    if issubclass(cls, _Instrumented):
+        return cls.counters
+    counters = Counters()
+    tree.__class__ = cls = _to_instrumented_class(cls, counters)
+    cls._instrument_internals(tree)
+    return counters
+
+
+class _Instrumented:
+    counters: Counters
+
+    __slots__ = ()
+
+
+def _count_calls(
+    function: Callable[..., Any], counters: Counters, field: str, /
+) -> Callable[..., Any]:
+    @wraps(function)
+    def counting(*args: Any, **kwargs: Any) -> Any:
+        setattr(counters, field, getattr(counters, field) + 1)
+        return function(*args, **kwargs)
+
+    return counting
+
+
+def _instrument_storage(
+    storage: array_avl.Storage[Any, Any], counters: Counters, /
+) -> None:
+    cls = type(storage)
+    if issubclass(cls, _Instrumented):
+        return
+
+    def allocate(
+        self: array_avl.Storage[Any, Any], key: Any, value: Any, /
+    ) -> int:
+        counters.allocations += 1
+        return cls.allocate(self, key, value)
+
+    def node_at(
+        self: array_avl.Storage[Any, Any], index: int, /
+    ) -> array_avl.Node[Any, Any]:
+        if index not in self.handles:
+            counters.weakrefs += 1
+        return cls.node_at(self, index)
+
+    storage.__class__ = type(
+        cls.__name__,
+        (cls, _Instrumented),
+        {
+            '__module__': cls.__module__,
+            '__qualname__': cls.__qualname__,
+            '__slots__': (),
+            'allocate': allocate,
+            'counters': counters,
+            'node_at': node_at,
+            'rotated_left': _count_calls(
+                cls.rotated_left, counters, 'rotations'
+            ),
+            'rotated_right': _count_calls(
+                cls.rotated_right, counters, 'rotations'
+            ),
+        },
+    )
+
+
+def _to_instrumented_class(
+    cls: type[Tree[KeyT, ValueT]], counters: Counters, /
+) -> type[Any]:
+    # lookups nested in another one are not counted again
+    is_looking_up = False
+
+    def look_up(
+        self: Any,
+        method: Callable[..., Any],
+        keys: tuple[Any, ...],
+        /,
+        *args: Any,
+        **kwargs: Any,
+    ) -> Any:
+        nonlocal is_looking_up
+        if is_looking_up or not keys:
+            return method(self, *args, **kwargs)
+        for key in keys:
+            if key is not None:
+                _count_descent(self, key, counters)
+        is_looking_up = True
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            is_looking_up = False
+
+    def instrument_method(
+        name: str, /, *, keys_count: int = 0
+    ) -> Callable[..., Any]:
+        method = getattr(cls, name)
+
+        @wraps(method)
+        def instrumented(self: Any, /, *args: Any, **kwargs: Any) -> Any:
+            result = look_up(self, method, args[:keys_count], *args, **kwargs)
+            # internals like storage can get replaced, e.g. on clearing
+            self._instrument_internals()
+            return result
+
+        return instrumented
+
+    namespace: dict[str, Any] = {
+        name: instrument_method(name, keys_count=1)
+        for name in (
+            'bisect_left',
+            'bisect_right',
+            'find',
+            'infimum',
+            'pop',
+            'split',
+            'supremum',
+        )
+    }
+    namespace.update(
+        (name, instrument_method(name))
+        for name in (
+            'clear',
+            'intersect',
+            'join',
+            'max',
+            'min',
+            'popmax',
+            'popmin',
+            'predecessor',
+            'remove',
+            'select',
+            'subtract',
+            'successor',
+            'symmetric_subtract',
+            'unite',
+        )
+    )
+    namespace.update(
+        (name, instrument_method(name, keys_count=2))
+        for name in ('count_range', 'delete_range', 'irange')
+        # splay trees look up the start of iteration by splaying
+        if not (name == 'irange' and issubclass(cls, splay.Tree))
+    )
+
+    @wraps(cls.insert)
+    def insert(self: Any, key: KeyT, value: ValueT, /) -> Any:
+        size = len(self)
+        result = look_up(self, cls.insert, (key,), key, value)
+        # array-based nodes are allocated by storage
+        if len(self) > size and not isinstance(self, array_avl.Tree):
+            counters.allocations += 1
+        self._instrument_internals()
+        return result
+
+    def copy(self: Tree[KeyT, ValueT], /) -> Tree[KeyT, ValueT]:
+        result = cls.__copy__(self)
+        counters.allocations += len(result)
+        return result
+
+    def instrument_internals(self: Tree[KeyT, ValueT], /) -> None:
+        if isinstance(self, array_avl.Tree):
+            _instrument_storage(self._storage, counters)
+
+    def reduce(self: Tree[KeyT, ValueT], /) -> Any:
+        # instrumented classes are created on the fly & cannot be pickled,
+        # so the tree is restored as a plain one
+        return restore_tree, (cls, self.keys, self.values)
+
+    namespace.update(
+        {
+            '__copy__': copy,
+            '__module__': cls.__module__,
+            '__qualname__': cls.__qualname__,
+            '__reduce__': reduce,
+            '__slots__': (),
+            '_instrument_internals': instrument_internals,
+            'counters': counters,
+            'insert': insert,
+        }
+    )
+    namespace.update(
+        (
+            name,
+            staticmethod(
+                _count_calls(getattr(cls, name), counters, 'rotations')
+            ),
+        )
+        for name in (
+            '_rotate_left',
+            '_rotate_right',
+            '_rotated_left',
+            '_rotated_right',
+        )
+        if hasattr(cls, name)
+    )
+    if issubclass(cls, red_black.Tree):
+        namespace['_remove_node_fixup'] = _count_recolourings(
+            cls._remove_node_fixup, counters
+        )
+        namespace['_restore'] = _count_recolourings(cls._restore, counters)
+    elif issubclass(cls, splay.Tree):
+
+        def splay_(self: splay.Tree[KeyT, ValueT], key: KeyT, /) -> None:
+            counters.splays += 1
+            # splays of keys of nodes are descents of their own
+            if not is_looking_up:
+                _count_descent(self, key, counters)
+            cls._splay(self, key)
+
+        namespace['_splay'] = splay_
+    return type(cls.__name__, (cls, _Instrumented), namespace)
+
+
+def _count_descent(
+    tree: Tree[KeyT, ValueT], key: KeyT, counters: Counters, /
+) -> None:
+    if isinstance(tree, array_avl.Tree):
+        # indices are followed to not create handles of nodes
+        storage = tree._storage  # ruff: ignore[private-member-access]
+        keys, lefts, rights = storage.keys, storage.lefts, storage.rights
+        index = storage.root
+        while index != array_avl.NIL_INDEX:
+            counters.visits += 1
+            counters.comparisons += 1
+            if key < keys[index]:
+                index = lefts[index]
+                continue
+            counters.comparisons += 1
+            if keys[index] < key:
+                index = rights[index]
+            else:
+                break
+        return
+    node = tree.root
+    while node is not NIL:
+        counters.visits += 1
+        counters.comparisons += 1
+        if key < node.key:
+            node = node.left
+            continue
+        counters.comparisons += 1
+        if node.key < key:
+            node = node.right
+        else:
+            break
+
+
+def _count_recolourings(
+    method: Callable[..., None], counters: Counters, /
+) -> Callable[..., None]:
+    @wraps(method)
+    def counting(
+        self: red_black.Tree[Any, Any],
+        node: red_black.Node[Any, Any] | Nil,
+        ancestors: list[red_black.Node[Any, Any]],
+        /,
+        *args: Any,
+    ) -> None:
+        # fixups only recolour nodes within two levels below the path
+        neighbourhood = list(
+            dict.fromkeys(
+                candidate
+                for path_node in [*ancestors, node]
+                if path_node is not NIL
+                for child in (path_node, path_node.left, path_node.right)
+                if child is not NIL
+                for candidate in (child, child.left, child.right)
+                if candidate is not NIL
+            )
+        )
+        colours = [candidate.is_black for candidate in neighbourhood]
+        method(self, node, ancestors, *args)
+        counters.recolourings += sum(
+            candidate.is_black is not is_black
+            for candidate, is_black in zip(neighbourhood, colours, strict=True)
+        )
+
+    return counting
@@ -0,0 +1,342 @@
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator, Sequence
+from itertools import starmap
+from typing import Any, Generic
+
+from reprit.base import generate_repr
+from typing_extensions import Self, override
+
+from . import abcs
+from .hints import Item, KeyT, Order, ValueT
+from .nil import NIL, Nil
+from .utils import to_sequence
+
+
+class Node(abcs.HasCustomRepr, Generic[KeyT, ValueT]):
+    """
+    Entry stored as a value of the underlying tree node
+    which key is the sort key of the entry's one.
+
+    Entries do not reference each other,
+    since the structure belongs to the underlying tree.
+    """
+
+    @property
+    def item(self, /) -> Item[KeyT, ValueT]:
+        return self.key, self.value
+
+    @property
+    def left(self, /) -> Self | Nil:
+        return NIL
+
+    @left.setter
+    def left(self, _node: Self | Nil) -> None:
+        raise AttributeError('Entries are not linked')
+
+    @property
+    def right(self, /) -> Self | Nil:
+        return NIL
+
+    @right.setter
+    def right(self, _node: Self | Nil) -> None:
+        raise AttributeError('Entries are not linked')
+
+    __slots__ = 'key', 'value'
+
+    def __init__(self, key: KeyT, value: ValueT, /) -> None:
+        self.key, self.value = key, value
+
+    __repr__ = generate_repr(__init__)
+
+
+class Tree(abcs.Tree[KeyT, ValueT], Generic[KeyT, ValueT]):
+    """
+    Tree which orders keys by a key function
+    storing computed sort keys in the underlying tree once per key.
+    """
+
+    @property
+    def key(self, /) -> Order[KeyT, Any]:
+        return self._key
+
+    @property
+    @override
+    def keys(self, /) -> Sequence[KeyT]:
+        return [entry.key for entry in self._tree.values]
+
+    @property
+    @override
+    def root(self, /) -> Node[KeyT, ValueT] | Nil:
+        return _to_entry(self._tree.root)
+
+    @property
+    def tree(self, /) -> abcs.Tree[Any, Node[KeyT, ValueT]]:
+        return self._tree
+
+    @property
+    @override
+    def values(self, /) -> Sequence[ValueT]:
+        return [entry.value for entry in self._tree.values]
+
+    @property
+    @override
+    def version(self, /) -> int:
+        return self._tree.version
+
+    @override
+    def bisect_left(self, key: KeyT, /) -> int:
+        return self._tree.bisect_left(self._key(key))
+
+    @override
+    def bisect_right(self, key: KeyT, /) -> int:
+        return self._tree.bisect_right(self._key(key))
+
+    @override
+    def clear(self, /) -> None:
+        self._tree.clear()
+
+    @override
+    def count_range(
+        self,
+        lo: KeyT | None = None,
+        hi: KeyT | None = None,
+        /,
+        *,
+        inclusive: tuple[bool, bool] = (True, False),
+    ) -> int:
+        return self._tree.count_range(
+            None if lo is None else self._key(lo),
+            None if hi is None else self._key(hi),
+            inclusive=inclusive,
+        )
+
+    @override
+    def delete_range(
+        self,
+        lo: KeyT | None = None,
+        hi: KeyT | None = None,
+        /,
+        *,
+        inclusive: tuple[bool, bool] = (True, False),
+    ) -> Self:
+        return type(self)(
+            self._tree.delete_range(
+                None if lo is None else self._key(lo),
+                None if hi is None else self._key(hi),
+                inclusive=inclusive,
+            ),
+            self._key,
+        )
+
+    @override
+    def find(self, key: KeyT, /) -> Node[KeyT, ValueT] | Nil:
+        return _to_entry(self._tree.find(self._key(key)))
+
+    @override
+    def from_components(  # type: ignore[override]
+        self, keys: Iterable[KeyT], values: Iterable[ValueT] | None = None, /
+    ) -> Tree[KeyT, Any]:
+        keys = list(keys)
+        items_values: Iterable[Any] = keys if values is None else values
+        entries = list(starmap(Node, zip(keys, items_values, strict=True)))
+        return Tree(
+            self._tree.from_components(map(self._key, keys), entries),
+            self._key,
+        )
+
+    @override
+    def from_sorted(  # type: ignore[override]
+        self,
+        keys: Iterable[KeyT],
+        values: Iterable[ValueT] | None = None,
+        /,
+        *,
+        assume_unique: bool = False,
+    ) -> Tree[KeyT, Any]:
+        keys = to_sequence(keys)
+        items_values: Iterable[Any] = keys if values is None else values
+        entries = list(starmap(Node, zip(keys, items_values, strict=True)))
+        return Tree(
+            self._tree.from_sorted(
+                map(self._key, keys), entries, assume_unique=assume_unique
+            ),
+            self._key,
+        )
+
+    @override
+    def infimum(self, key: KeyT, /) -> Node[KeyT, ValueT] | Nil:
+        return _to_entry(self._tree.infimum(self._key(key)))
+
+    @override
+    def insert(self, key: KeyT, value: ValueT, /) -> Node[KeyT, ValueT]:
+        # insertion returns the node with the entry if it is already present
+        return self._tree.insert(self._key(key), Node(key, value)).value
+
+    @override
+    def intersect(self, other: Self, /) -> Self:
+        similar: Self = self._to_similar(other)
+        return type(self)(self._tree.intersect(similar._tree), self._key)
+
+    @override
+    def irange(
+        self,
+        lo: KeyT | None = None,
+        hi: KeyT | None = None,
+        /,
+        *,
+        inclusive: tuple[bool, bool] = (True, False),
+        reverse: bool = False,
+    ) -> Iterator[Node[KeyT, ValueT]]:
+        for node in self._tree.irange(
+            None if lo is None else self._key(lo),
+            None if hi is None else self._key(hi),
+            inclusive=inclusive,
+            reverse=reverse,
+        ):
+            yield node.value
+
+    @override
+    def join(self, other: Self, /) -> Self:
+        similar: Self = self._to_similar(other)
+        return type(self)(self._tree.join(similar._tree), self._key)
+
+    @override
+    def max(self, /) -> Node[KeyT, ValueT] | Nil:
+        return _to_entry(self._tree.max())
+
+    @override
+    def min(self, /) -> Node[KeyT, ValueT] | Nil:
+        return _to_entry(self._tree.min())
+
+    @override
+    def pop(self, key: KeyT, /) -> Node[KeyT, ValueT] | Nil:
+        return _to_entry(self._tree.pop(self._key(key)))
+
+    @override
+    def popmax(self, /) -> Node[KeyT, ValueT] | Nil:
+        return _to_entry(self._tree.popmax())
+
+    @override
+    def popmin(self, /) -> Node[KeyT, ValueT] | Nil:
+        return _to_entry(self._tree.popmin())
+
+    @override
+    def predecessor(
+        self, node: abcs.Node[KeyT, ValueT], /
+    ) -> Node[KeyT, ValueT] | Nil:
+        return _to_entry(self._tree.predecessor(self._to_tree_node(node)))
+
+    @override
+    def remove(self, node: abcs.Node[KeyT, ValueT], /) -> None:
+        self._tree.remove(self._to_tree_node(node))
+
+    @override
+    def select(self, index: int, /) -> Node[KeyT, ValueT] | Nil:
+        return _to_entry(self._tree.select(index))
+
+    @override
+    def split(self, key: KeyT, /) -> tuple[Self, Self]:
+        lower, upper = self._tree.split(self._key(key))
+        return type(self)(lower, self._key), type(self)(upper, self._key)
+
+    @override
+    def subtract(self, other: Self, /) -> Self:
+        similar: Self = self._to_similar(other)
+        return type(self)(self._tree.subtract(similar._tree), self._key)
+
+    @override
+    def successor(
+        self, node: abcs.Node[KeyT, ValueT], /
+    ) -> Node[KeyT, ValueT] | Nil:
+        return _to_entry(self._tree.successor(self._to_tree_node(node)))
+
+    @override
+    def supremum(self, key: KeyT, /) -> Node[KeyT, ValueT] | Nil:
+        return _to_entry(self._tree.supremum(self._key(key)))
+
+    @override
+    def symmetric_subtract(self, other: Self, /) -> Self:
+        similar: Self = self._to_similar(other)
+        return type(self)(
+            self._tree.symmetric_subtract(similar._tree), self._key
+        )
+
+    @override
+    def unite(self, other: Self, /) -> Self:
+        similar: Self = self._to_similar(other)
+        return type(self)(self._tree.unite(similar._tree), self._key)
+
+    def _to_similar(self, other: Self, /) -> Self:
+        # sort keys of the other tree can be computed by another function,
+        # so its entries are rekeyed by the tree's one
+        if isinstance(other, Tree) and other.key == self._key:
+            return other
+        result = self.from_components(other.keys, other.values)
+        other.clear()
+        return result  # type: ignore[return-value]
+
+    def _to_tree_node(
+        self, entry: abcs.Node[KeyT, ValueT], /
+    ) -> abcs.Node[Any, Node[KeyT, ValueT]]:
+        # entries do not keep track of underlying nodes
+        # which can get relocated on removals
+        result = self._tree.find(self._key(entry.key))
+        assert result is not NIL, entry
+        return result
+
+    __slots__ = '_key', '_tree'
+
+    def __init__(
+        self,
+        _tree: abcs.Tree[Any, Node[KeyT, ValueT]],
+        key: Order[KeyT, Any],
+        /,
+    ) -> None:
+        self._key, self._tree = key, _tree
+
+    @override
+    def __bool__(self, /) -> bool:
+        return bool(self._tree)
+
+    @override
+    def __copy__(self, /) -> Self:
+        # entries are mutable, so they should not be shared
+        return type(self)(
+            self._tree.from_sorted(
+                self._tree.keys,
+                [Node(entry.key, entry.value) for entry in self._tree.values],
+                assume_unique=True,
+            ),
+            self._key,
+        )
+
+    @override
+    def __iter__(self, /) -> Iterator[Node[KeyT, ValueT]]:
+        for node in self._tree:
+            yield node.value
+
+    @override
+    def __len__(self, /) -> int:
+        return len(self._tree)
+
+    @override
+    def __reduce__(  # type: ignore[override]
+        self, /
+    ) -> tuple[
+        type[Self], tuple[abcs.Tree[Any, Node[KeyT, ValueT]], Order[KeyT, Any]]
+    ]:
+        return type(self), (self._tree, self._key)
+
+    __repr__ = generate_repr(__init__, with_module_name=True)
+
+    @override
+    def __reversed__(self, /) -> Iterator[Node[KeyT, ValueT]]:
+        for node in reversed(self._tree):
+            yield node.value
+
+
+def _to_entry(
+    node: abcs.Node[Any, Node[KeyT, ValueT]] | Nil, /
+) -> Node[KeyT, ValueT] | Nil:
+    return NIL if node is NIL else node.value
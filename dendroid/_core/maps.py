@@ -1,14 +1,22 @@
 from __future__ import annotations
 
-from collections.abc import Iterable, Iterator
+from collections.abc import Callable, Iterable, Iterator
+from itertools import starmap
 from typing import Any, Generic, cast, overload
 
 from reprit.base import generate_repr
 from typing_extensions import Self
 
+from . import keyed, mirrored
 from .abcs import HasCustomRepr, Node, Tree
-from .hints import Item, KeyT, ValueT
+from .conversion import to_backend
+from .cursors import Cursor
+from .hints import Item, KeyT, Order, ResultT, SummableT, ValueT
+from .instrumentation import Counters, instrument
 from .nil import NIL
+from .ranged import to_ranged
+from .stats import Stats, to_stats
+from .utils import to_sequence
 from .views import ItemsView, KeysView, ValuesView
 
 
@@ -57,6 +65,11 @@ class Map(HasCustomRepr, Generic[KeyT, ValueT]):
     def __len__(self, /) -> int:
         return len(self._tree)
 
+    def __reduce__(
+        self, /
+    ) -> tuple[type[Map[KeyT, ValueT]], tuple[Tree[KeyT, ValueT]]]:
+        return type(self), (self._tree,)
+
     def __reversed__(self, /) -> Iterator[KeyT]:
         for node in reversed(self._tree):
             yield node.key
@@ -64,6 +77,12 @@ class Map(HasCustomRepr, Generic[KeyT, ValueT]):
     def __setitem__(self, key: KeyT, value: ValueT, /) -> None:
         self._tree.insert(key, value).value = value
 
+    def bisect_left(self, key: KeyT, /) -> int:
+        return self._tree.bisect_left(key)
+
+    def bisect_right(self, key: KeyT, /) -> int:
+        return self._tree.bisect_right(key)
+
     def ceil(self, key: KeyT, /) -> ValueT:
         return self._ceil_node(key).value
 
@@ -73,6 +92,49 @@ class Map(HasCustomRepr, Generic[KeyT, ValueT]):
     def clear(self, /) -> None:
         self._tree.clear()
 
+    def count_range(
+        self,
+        lo: KeyT | None = None,
+        hi: KeyT | None = None,
+        /,
+        *,
+        inclusive: tuple[bool, bool] = (True, False),
+    ) -> int:
+        return self._tree.count_range(lo, hi, inclusive=inclusive)
+
+    def cursor(self, key: KeyT | None = None, /) -> Cursor[KeyT, ValueT]:
+        """
+        Returns cursor at the first key not less than the given one
+        (or at the first key at all if it is not given).
+        """
+        result: Cursor[KeyT, ValueT] = Cursor(self)
+        if key is None:
+            result.first()
+        else:
+            result.seek(key)
+        return result
+
+    def delete_range(
+        self,
+        lo: KeyT | None = None,
+        hi: KeyT | None = None,
+        /,
+        *,
+        inclusive: tuple[bool, bool] = (True, False),
+    ) -> Map[KeyT, ValueT]:
+        return Map(self._tree.delete_range(lo, hi, inclusive=inclusive))
+
+    def filter(
+        self, predicate: Callable[[KeyT, ValueT], bool], /
+    ) -> Map[KeyT, ValueT]:
+        keys, values = [], []
+        for node in self._tree:
+            if predicate(node.key, node.value):
+                keys.append(node.key)
+                values.append(node.value)
+        # traversal is ordered, so the tree is built without sorting
+        return Map(self._tree.from_sorted(keys, values, assume_unique=True))
+
     def floor(self, key: KeyT, /) -> ValueT:
         return self._floor_node(key).value
 
@@ -88,12 +150,52 @@ class Map(HasCustomRepr, Generic[KeyT, ValueT]):
             else default
         )
 
+    def increment(
+        self: Map[KeyT, SummableT], key: KeyT, delta: SummableT, /
+    ) -> SummableT:
+        tree = self._tree
+        size = len(tree)
+        node = tree.insert(key, delta)
+        if len(tree) == size:
+            node.value += delta
+        return node.value
+
+    def instrument(self, /) -> Counters:
+        return instrument(self._tree)
+
+    def irange(
+        self,
+        lo: KeyT | None = None,
+        hi: KeyT | None = None,
+        /,
+        *,
+        inclusive: tuple[bool, bool] = (True, False),
+        reverse: bool = False,
+    ) -> Iterator[KeyT]:
+        for node in self._tree.irange(
+            lo, hi, inclusive=inclusive, reverse=reverse
+        ):
+            yield node.key
+
     def items(self, /) -> ItemsView[KeyT, ValueT]:
         return ItemsView(self._tree)
 
+    def join(self, other: Map[KeyT, ValueT], /) -> Map[KeyT, ValueT]:
+        return Map(self._tree.join(other._tree))
+
     def keys(self, /) -> KeysView[KeyT]:
         return KeysView(self._tree)
 
+    def map_values(
+        self, function: Callable[[ValueT], ResultT], /
+    ) -> Map[KeyT, ResultT]:
+        tree = cast('Tree[KeyT, Any]', self._tree)
+        return Map(
+            tree.from_sorted(
+                tree.keys, list(map(function, tree.values)), assume_unique=True
+            )
+        )
+
     def max(self, /) -> ValueT:
         return self._max_node().value
 
@@ -134,12 +236,18 @@ class Map(HasCustomRepr, Generic[KeyT, ValueT]):
     def popmaxitem(self, /) -> Item[KeyT, ValueT]:
         return self._popmax_node().item
 
+    def popmax_many(self, count: int, /) -> Map[KeyT, ValueT]:
+        return Map(self._tree.popmax_many(count))
+
     def popmin(self, /) -> ValueT:
         return self._popmin_node().value
 
     def popminitem(self, /) -> Item[KeyT, ValueT]:
         return self._popmin_node().item
 
+    def popmin_many(self, count: int, /) -> Map[KeyT, ValueT]:
+        return Map(self._tree.popmin_many(count))
+
     popitem = popminitem
 
     def prev(self, key: KeyT, /) -> ValueT:
@@ -148,6 +256,16 @@ class Map(HasCustomRepr, Generic[KeyT, ValueT]):
     def previtem(self, key: KeyT, /) -> Item[KeyT, ValueT]:
         return self._prev_node(key).item
 
+    def rank(self, key: KeyT, /) -> int:
+        self._find_node(key)
+        return self._tree.bisect_left(key)
+
+    def select(self, index: int, /) -> ValueT:
+        return self._select_node(index).value
+
+    def selectitem(self, index: int, /) -> Item[KeyT, ValueT]:
+        return self._select_node(index).item
+
     @overload
     def setdefault(
         self: Map[KeyT, ValueT | None], key: KeyT, default: None = ..., /
@@ -162,8 +280,23 @@ class Map(HasCustomRepr, Generic[KeyT, ValueT]):
         default: ValueT | None = None,
         /,
     ) -> ValueT | None:
-        node = self._tree.find(key)
-        return (self._tree.insert(key, default) if node is NIL else node).value
+        # insertion returns the node with the key if it is already present
+        return self._tree.insert(key, default).value
+
+    def stats(self, /) -> Stats:
+        return to_stats(self._tree)
+
+    def split(
+        self, key: KeyT, /
+    ) -> tuple[Map[KeyT, ValueT], Map[KeyT, ValueT]]:
+        lower, upper = self._tree.split(key)
+        return Map(lower), Map(upper)
+
+    def truncate_above(self, key: KeyT, /) -> Map[KeyT, ValueT]:
+        return self.delete_range(key, None, inclusive=(False, True))
+
+    def truncate_below(self, key: KeyT, /) -> Map[KeyT, ValueT]:
+        return self.delete_range(None, key)
 
     def update(
         self, other: Self | Iterable[Item[KeyT, ValueT]] = (), /
@@ -175,9 +308,30 @@ class Map(HasCustomRepr, Generic[KeyT, ValueT]):
         for key, value in items:
             self[key] = value
 
+    def upsert(
+        self,
+        key: KeyT,
+        function: Callable[[ValueT], ValueT],
+        default: ValueT,
+        /,
+    ) -> ValueT:
+        node = self._tree.insert(key, default)
+        node.value = result = function(node.value)
+        return result
+
     def values(self, /) -> ValuesView[ValueT]:
         return ValuesView(self._tree)
 
+    def view(
+        self,
+        lo: KeyT | None = None,
+        hi: KeyT | None = None,
+        /,
+        *,
+        inclusive: tuple[bool, bool] = (True, False),
+    ) -> Map[KeyT, ValueT]:
+        return Map(to_ranged(self._tree, lo, hi, inclusive=inclusive))
+
     def _ceil_node(self, key: KeyT, /) -> Node[KeyT, ValueT]:
         node = self._tree.supremum(key)
         if node is NIL:
@@ -231,3 +385,40 @@ class Map(HasCustomRepr, Generic[KeyT, ValueT]):
         if result is NIL:
             raise KeyError('Corresponds to minimum')
         return result
+
+    def _select_node(self, index: int, /) -> Node[KeyT, ValueT]:
+        result = self._tree.select(
+            index + len(self._tree) if index < 0 else index
+        )
+        if result is NIL:
+            raise IndexError('Map index out of range')
+        return result
+
+
+def convert_map(
+    cls: type[Tree[Any, Any]], map_: Map[KeyT, ValueT], /
+) -> Map[KeyT, ValueT]:
+    return Map(
+        to_backend(map_._tree, cls)  # ruff: ignore[private-member-access]
+    )
+
+
+def to_map(
+    cls: type[Tree[Any, Any]],
+    keys: Iterable[KeyT],
+    values: Iterable[ValueT],
+    /,
+    *,
+    key: Order[KeyT, Any] | None,
+    reverse: bool,
+) -> Map[KeyT, ValueT]:
+    if key is None:
+        tree: Tree[Any, Any] = cls.from_components(keys, values)
+    else:
+        keys = to_sequence(keys)
+        tree = cls.from_components(
+            map(key, keys), starmap(keyed.Node, zip(keys, values, strict=True))
+        )
+    if reverse:
+        tree = mirrored.Tree(tree)
+    return Map(tree if key is None else keyed.Tree(tree, key))
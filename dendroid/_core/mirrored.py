@@ -0,0 +1,270 @@
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator, Sequence
+from typing import Any, Generic
+
+from reprit.base import generate_repr
+from typing_extensions import Self, override
+
+from . import abcs
+from .hints import KeyT, ValueT
+from .nil import NIL, Nil
+from .utils import to_sequence
+
+
+class Tree(abcs.Tree[KeyT, ValueT], Generic[KeyT, ValueT]):
+    """
+    Tree which orders keys in descending order
+    by mirroring operations of the underlying tree,
+    so keys are compared as is without wrapping them.
+    """
+
+    @property
+    @override
+    def keys(self, /) -> Sequence[KeyT]:
+        result = list(self._tree.keys)
+        result.reverse()
+        return result
+
+    @property
+    @override
+    def root(self, /) -> abcs.Node[KeyT, ValueT] | Nil:
+        return self._tree.root
+
+    @property
+    def tree(self, /) -> abcs.Tree[KeyT, ValueT]:
+        return self._tree
+
+    @property
+    @override
+    def values(self, /) -> Sequence[ValueT]:
+        result = list(self._tree.values)
+        result.reverse()
+        return result
+
+    @property
+    @override
+    def version(self, /) -> int:
+        return self._tree.version
+
+    @override
+    def bisect_left(self, key: KeyT, /) -> int:
+        return len(self._tree) - self._tree.bisect_right(key)
+
+    @override
+    def bisect_right(self, key: KeyT, /) -> int:
+        return len(self._tree) - self._tree.bisect_left(key)
+
+    @override
+    def clear(self, /) -> None:
+        self._tree.clear()
+
+    @override
+    def count_range(
+        self,
+        lo: KeyT | None = None,
+        hi: KeyT | None = None,
+        /,
+        *,
+        inclusive: tuple[bool, bool] = (True, False),
+    ) -> int:
+        is_lo_inclusive, is_hi_inclusive = inclusive
+        return self._tree.count_range(
+            hi, lo, inclusive=(is_hi_inclusive, is_lo_inclusive)
+        )
+
+    @override
+    def delete_range(
+        self,
+        lo: KeyT | None = None,
+        hi: KeyT | None = None,
+        /,
+        *,
+        inclusive: tuple[bool, bool] = (True, False),
+    ) -> Self:
+        is_lo_inclusive, is_hi_inclusive = inclusive
+        return type(self)(
+            self._tree.delete_range(
+                hi, lo, inclusive=(is_hi_inclusive, is_lo_inclusive)
+            )
+        )
+
+    @override
+    def find(self, key: KeyT, /) -> abcs.Node[KeyT, ValueT] | Nil:
+        return self._tree.find(key)
+
+    # components are ordered by the underlying tree,
+    # so it is needed to construct a new one
+    @override
+    def from_components(  # type: ignore[override]
+        self, keys: Iterable[KeyT], values: Iterable[ValueT] | None = None, /
+    ) -> Tree[KeyT, Any]:
+        return Tree(self._tree.from_components(keys, values))
+
+    @override
+    def from_sorted(  # type: ignore[override]
+        self,
+        keys: Iterable[KeyT],
+        values: Iterable[ValueT] | None = None,
+        /,
+        *,
+        assume_unique: bool = False,
+    ) -> Tree[KeyT, Any]:
+        # keys are given in descending order
+        return Tree(
+            self._tree.from_sorted(
+                reversed(to_sequence(keys)),
+                None if values is None else reversed(to_sequence(values)),
+                assume_unique=assume_unique,
+            )
+        )
+
+    @override
+    def infimum(self, key: KeyT, /) -> abcs.Node[KeyT, ValueT] | Nil:
+        return self._tree.supremum(key)
+
+    @override
+    def insert(self, key: KeyT, value: ValueT, /) -> abcs.Node[KeyT, ValueT]:
+        return self._tree.insert(key, value)
+
+    @override
+    def intersect(self, other: Self, /) -> Self:
+        similar: Self = self._to_similar(other)
+        return type(self)(self._tree.intersect(similar._tree))
+
+    @override
+    def irange(
+        self,
+        lo: KeyT | None = None,
+        hi: KeyT | None = None,
+        /,
+        *,
+        inclusive: tuple[bool, bool] = (True, False),
+        reverse: bool = False,
+    ) -> Iterator[abcs.Node[KeyT, ValueT]]:
+        is_lo_inclusive, is_hi_inclusive = inclusive
+        return self._tree.irange(
+            hi,
+            lo,
+            inclusive=(is_hi_inclusive, is_lo_inclusive),
+            reverse=not reverse,
+        )
+
+    @override
+    def join(self, other: Self, /) -> Self:
+        similar: Self = self._to_similar(other)
+        return type(self)(similar._tree.join(self._tree))
+
+    @override
+    def max(self, /) -> abcs.Node[KeyT, ValueT] | Nil:
+        return self._tree.min()
+
+    @override
+    def min(self, /) -> abcs.Node[KeyT, ValueT] | Nil:
+        return self._tree.max()
+
+    @override
+    def pop(self, key: KeyT, /) -> abcs.Node[KeyT, ValueT] | Nil:
+        return self._tree.pop(key)
+
+    @override
+    def popmax(self, /) -> abcs.Node[KeyT, ValueT] | Nil:
+        return self._tree.popmin()
+
+    @override
+    def popmin(self, /) -> abcs.Node[KeyT, ValueT] | Nil:
+        return self._tree.popmax()
+
+    @override
+    def predecessor(
+        self, node: abcs.Node[KeyT, ValueT], /
+    ) -> abcs.Node[KeyT, ValueT] | Nil:
+        return self._tree.successor(node)
+
+    @override
+    def remove(self, node: abcs.Node[KeyT, ValueT], /) -> None:
+        self._tree.remove(node)
+
+    @override
+    def select(self, index: int, /) -> abcs.Node[KeyT, ValueT] | Nil:
+        size = len(self._tree)
+        return (
+            self._tree.select(size - 1 - index) if 0 <= index < size else NIL
+        )
+
+    @override
+    def split(self, key: KeyT, /) -> tuple[Self, Self]:
+        lower, upper = self._tree.split(key)
+        # node with the key itself goes to the upper part of the mirror
+        if (node := upper.min()) is not NIL and not key < node.key:
+            item_key, item_value = node.item
+            upper.remove(node)
+            lower.insert(item_key, item_value)
+        return type(self)(upper), type(self)(lower)
+
+    @override
+    def subtract(self, other: Self, /) -> Self:
+        similar: Self = self._to_similar(other)
+        return type(self)(self._tree.subtract(similar._tree))
+
+    @override
+    def successor(
+        self, node: abcs.Node[KeyT, ValueT], /
+    ) -> abcs.Node[KeyT, ValueT] | Nil:
+        return self._tree.predecessor(node)
+
+    @override
+    def supremum(self, key: KeyT, /) -> abcs.Node[KeyT, ValueT] | Nil:
+        return self._tree.infimum(key)
+
+    @override
+    def symmetric_subtract(self, other: Self, /) -> Self:
+        similar: Self = self._to_similar(other)
+        return type(self)(self._tree.symmetric_subtract(similar._tree))
+
+    @override
+    def unite(self, other: Self, /) -> Self:
+        similar: Self = self._to_similar(other)
+        return type(self)(self._tree.unite(similar._tree))
+
+    def _to_similar(self, other: Self, /) -> Self:
+        # nodes of a tree in ascending order cannot be merged
+        # with the mirrored ones, so the tree is rebuilt in descending order
+        if isinstance(other, Tree):
+            return other
+        result = self.from_components(other.keys, other.values)
+        other.clear()
+        return result
+
+    __slots__ = ('_tree',)
+
+    def __init__(self, _tree: abcs.Tree[KeyT, ValueT], /) -> None:
+        self._tree = _tree
+
+    @override
+    def __bool__(self, /) -> bool:
+        return bool(self._tree)
+
+    @override
+    def __copy__(self, /) -> Self:
+        return type(self)(self._tree.__copy__())
+
+    @override
+    def __iter__(self, /) -> Iterator[abcs.Node[KeyT, ValueT]]:
+        return reversed(self._tree)
+
+    @override
+    def __len__(self, /) -> int:
+        return len(self._tree)
+
+    @override
+    def __reduce__(  # type: ignore[override]
+        self, /
+    ) -> tuple[type[Self], tuple[abcs.Tree[KeyT, ValueT]]]:
+        return type(self), (self._tree,)
+
+    __repr__ = generate_repr(__init__, with_module_name=True)
+
+    @override
+    def __reversed__(self, /) -> Iterator[abcs.Node[KeyT, ValueT]]:
+        return iter(self._tree)
@@ -0,0 +1,397 @@
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator
+from typing import Any, Generic
+
+from reprit.base import generate_repr
+from typing_extensions import Self, override
+
+from . import abcs, keyed, mirrored
+from .hints import KeyT, ValueT
+from .nil import NIL, Nil
+
+
+class Tree(abcs.Tree[KeyT, ValueT], Generic[KeyT, ValueT]):
+    """
+    Tree which exposes nodes of the underlying tree
+    with keys between given bounds without copying them,
+    so changes of the underlying tree are reflected in it & vice versa.
+
+    Operations take logarithmic time (plus size of the output)
+    for trees with logarithmic ranking of keys.
+    """
+
+    @property
+    def hi(self, /) -> KeyT | None:
+        return self._hi
+
+    @property
+    def inclusive(self, /) -> tuple[bool, bool]:
+        return self._inclusive
+
+    @property
+    def lo(self, /) -> KeyT | None:
+        return self._lo
+
+    @property
+    @override
+    def root(self, /) -> abcs.Node[KeyT, ValueT] | Nil:
+        # common ancestor of nodes in the range,
+        # it is still linked to nodes out of the range
+        node = self._tree.root
+        while node is not NIL:
+            if self._is_key_before(node.key):
+                node = node.right
+            elif self._is_key_after(node.key):
+                node = node.left
+            else:
+                break
+        return node
+
+    @property
+    def tree(self, /) -> abcs.Tree[KeyT, ValueT]:
+        return self._tree
+
+    @property
+    @override
+    def version(self, /) -> int:
+        return self._tree.version
+
+    @override
+    def bisect_left(self, key: KeyT, /) -> int:
+        start, stop = self._to_span()
+        return min(max(self._tree.bisect_left(key), start), stop) - start
+
+    @override
+    def bisect_right(self, key: KeyT, /) -> int:
+        start, stop = self._to_span()
+        return min(max(self._tree.bisect_right(key), start), stop) - start
+
+    @override
+    def clear(self, /) -> None:
+        self._tree.delete_range(self._lo, self._hi, inclusive=self._inclusive)
+
+    @override
+    def count_range(
+        self,
+        lo: KeyT | None = None,
+        hi: KeyT | None = None,
+        /,
+        *,
+        inclusive: tuple[bool, bool] = (True, False),
+    ) -> int:
+        lo, hi, inclusive = self._narrow(lo, hi, inclusive)
+        return self._tree.count_range(lo, hi, inclusive=inclusive)
+
+    @override
+    def delete_range(  # type: ignore[override]
+        self,
+        lo: KeyT | None = None,
+        hi: KeyT | None = None,
+        /,
+        *,
+        inclusive: tuple[bool, bool] = (True, False),
+    ) -> abcs.Tree[KeyT, ValueT]:
+        lo, hi, inclusive = self._narrow(lo, hi, inclusive)
+        return self._tree.delete_range(lo, hi, inclusive=inclusive)
+
+    @override
+    def find(self, key: KeyT, /) -> abcs.Node[KeyT, ValueT] | Nil:
+        return self._tree.find(key) if self._is_key_in_range(key) else NIL
+
+    # ranges are not preserved by constructed trees
+    @override
+    def from_components(  # type: ignore[override]
+        self, keys: Iterable[KeyT], values: Iterable[ValueT] | None = None, /
+    ) -> abcs.Tree[KeyT, Any]:
+        return self._tree.from_components(keys, values)
+
+    @override
+    def from_sorted(  # type: ignore[override]
+        self,
+        keys: Iterable[KeyT],
+        values: Iterable[ValueT] | None = None,
+        /,
+        *,
+        assume_unique: bool = False,
+    ) -> abcs.Tree[KeyT, Any]:
+        return self._tree.from_sorted(
+            keys, values, assume_unique=assume_unique
+        )
+
+    @override
+    def infimum(self, key: KeyT, /) -> abcs.Node[KeyT, ValueT] | Nil:
+        if self._is_key_after(key):
+            return self.max()
+        node = self._tree.infimum(key)
+        return NIL if node is NIL or self._is_key_before(node.key) else node
+
+    @override
+    def insert(self, key: KeyT, value: ValueT, /) -> abcs.Node[KeyT, ValueT]:
+        if not self._is_key_in_range(key):
+            raise ValueError(f'Key {key!r} is out of range.')
+        return self._tree.insert(key, value)
+
+    @override
+    def irange(
+        self,
+        lo: KeyT | None = None,
+        hi: KeyT | None = None,
+        /,
+        *,
+        inclusive: tuple[bool, bool] = (True, False),
+        reverse: bool = False,
+    ) -> Iterator[abcs.Node[KeyT, ValueT]]:
+        lo, hi, inclusive = self._narrow(lo, hi, inclusive)
+        return self._tree.irange(lo, hi, inclusive=inclusive, reverse=reverse)
+
+    @override
+    def max(self, /) -> abcs.Node[KeyT, ValueT] | Nil:
+        hi, tree = self._hi, self._tree
+        if hi is None:
+            node = tree.max()
+        else:
+            node = tree.infimum(hi)
+            if node is not NIL and not (
+                self._is_hi_inclusive or node.key < hi
+            ):
+                node = tree.predecessor(node)
+        return NIL if node is NIL or self._is_key_before(node.key) else node
+
+    @override
+    def min(self, /) -> abcs.Node[KeyT, ValueT] | Nil:
+        lo, tree = self._lo, self._tree
+        if lo is None:
+            node = tree.min()
+        else:
+            node = tree.supremum(lo)
+            if node is not NIL and not (
+                self._is_lo_inclusive or lo < node.key
+            ):
+                node = tree.successor(node)
+        return NIL if node is NIL or self._is_key_after(node.key) else node
+
+    def narrow(
+        self,
+        lo: KeyT | None,
+        hi: KeyT | None,
+        /,
+        *,
+        inclusive: tuple[bool, bool],
+    ) -> Tree[KeyT, ValueT]:
+        """
+        Returns tree over the same underlying tree
+        with the range narrowed by given bounds.
+        """
+        lo, hi, inclusive = self._narrow(lo, hi, inclusive)
+        return Tree(self._tree, lo, hi, inclusive=inclusive)
+
+    @override
+    def pop(self, key: KeyT, /) -> abcs.Node[KeyT, ValueT] | Nil:
+        return self._tree.pop(key) if self._is_key_in_range(key) else NIL
+
+    @override
+    def popmax(self, /) -> abcs.Node[KeyT, ValueT] | Nil:
+        node = self.max()
+        if node is not NIL:
+            self._tree.remove(node)
+        return node
+
+    @override
+    def popmin(self, /) -> abcs.Node[KeyT, ValueT] | Nil:
+        node = self.min()
+        if node is not NIL:
+            self._tree.remove(node)
+        return node
+
+    @override
+    def predecessor(
+        self, node: abcs.Node[KeyT, ValueT], /
+    ) -> abcs.Node[KeyT, ValueT] | Nil:
+        result = self._tree.predecessor(node)
+        return (
+            NIL if result is NIL or self._is_key_before(result.key) else result
+        )
+
+    @override
+    def remove(self, node: abcs.Node[KeyT, ValueT], /) -> None:
+        self._tree.remove(node)
+
+    @override
+    def select(self, index: int, /) -> abcs.Node[KeyT, ValueT] | Nil:
+        start, stop = self._to_span()
+        return (
+            self._tree.select(start + index)
+            if 0 <= index < stop - start
+            else NIL
+        )
+
+    @override
+    def successor(
+        self, node: abcs.Node[KeyT, ValueT], /
+    ) -> abcs.Node[KeyT, ValueT] | Nil:
+        result = self._tree.successor(node)
+        return (
+            NIL if result is NIL or self._is_key_after(result.key) else result
+        )
+
+    @override
+    def supremum(self, key: KeyT, /) -> abcs.Node[KeyT, ValueT] | Nil:
+        if self._is_key_before(key):
+            return self.min()
+        node = self._tree.supremum(key)
+        return NIL if node is NIL or self._is_key_after(node.key) else node
+
+    @property
+    def _is_hi_inclusive(self, /) -> bool:
+        return self._inclusive[1]
+
+    @property
+    def _is_lo_inclusive(self, /) -> bool:
+        return self._inclusive[0]
+
+    def _is_key_after(self, key: KeyT, /) -> bool:
+        hi = self._hi
+        return hi is not None and (
+            hi < key if self._is_hi_inclusive else not key < hi
+        )
+
+    def _is_key_before(self, key: KeyT, /) -> bool:
+        lo = self._lo
+        return lo is not None and (
+            key < lo if self._is_lo_inclusive else not lo < key
+        )
+
+    def _is_key_in_range(self, key: KeyT, /) -> bool:
+        return not (self._is_key_before(key) or self._is_key_after(key))
+
+    def _narrow(
+        self, lo: KeyT | None, hi: KeyT | None, inclusive: tuple[bool, bool], /
+    ) -> tuple[KeyT | None, KeyT | None, tuple[bool, bool]]:
+        is_lo_inclusive, is_hi_inclusive = inclusive
+        if lo is None or (self._lo is not None and lo < self._lo):
+            lo, is_lo_inclusive = self._lo, self._is_lo_inclusive
+        elif self._lo is not None and not self._lo < lo:
+            is_lo_inclusive = is_lo_inclusive and self._is_lo_inclusive
+        if hi is None or (self._hi is not None and self._hi < hi):
+            hi, is_hi_inclusive = self._hi, self._is_hi_inclusive
+        elif self._hi is not None and not hi < self._hi:
+            is_hi_inclusive = is_hi_inclusive and self._is_hi_inclusive
+        return lo, hi, (is_lo_inclusive, is_hi_inclusive)
+
+    def _to_span(self, /) -> tuple[int, int]:
+        # positions of the first node in the range
+        # & of the first node after it in the underlying tree
+        lo, hi, tree = self._lo, self._hi, self._tree
+        start = (
+            0
+            if lo is None
+            else (
+                tree.bisect_left(lo)
+                if self._is_lo_inclusive
+                else tree.bisect_right(lo)
+            )
+        )
+        stop = (
+            len(tree)
+            if hi is None
+            else (
+                tree.bisect_right(hi)
+                if self._is_hi_inclusive
+                else tree.bisect_left(hi)
+            )
+        )
+        return start, max(start, stop)
+
+    __slots__ = '_hi', '_inclusive', '_lo', '_tree'
+
+    def __init__(
+        self,
+        _tree: abcs.Tree[KeyT, ValueT],
+        lo: KeyT | None,
+        hi: KeyT | None,
+        /,
+        *,
+        inclusive: tuple[bool, bool],
+    ) -> None:
+        self._tree, self._lo, self._hi, self._inclusive = (
+            _tree,
+            lo,
+            hi,
+            inclusive,
+        )
+
+    @override
+    def __bool__(self, /) -> bool:
+        return self.min() is not NIL
+
+    @override
+    def __copy__(self, /) -> Self:
+        # copies do not depend on the underlying tree
+        return self._tree.from_sorted(  # type: ignore[return-value]
+            self.keys, self.values, assume_unique=True
+        )
+
+    @override
+    def __iter__(self, /) -> Iterator[abcs.Node[KeyT, ValueT]]:
+        return self.irange()
+
+    @override
+    def __len__(self, /) -> int:
+        return self.count_range()
+
+    @override
+    def __reduce__(self, /) -> tuple[Any, tuple[Any, ...]]:
+        # only nodes in the range get serialized
+        return abcs.restore_tree, (type(self._tree), self.keys, self.values)
+
+    __repr__ = generate_repr(__init__, with_module_name=True)
+
+    @override
+    def __reversed__(self, /) -> Iterator[abcs.Node[KeyT, ValueT]]:
+        return self.irange(reverse=True)
+
+
+def to_ranged(
+    tree: abcs.Tree[KeyT, ValueT],
+    lo: KeyT | None,
+    hi: KeyT | None,
+    /,
+    *,
+    inclusive: tuple[bool, bool],
+) -> abcs.Tree[KeyT, ValueT]:
+    """
+    Returns live view of given tree with keys between given bounds.
+
+    Ranges are applied below adapters,
+    so bounds are compared in the same way as keys of the underlying tree
+    & nested ranges get narrowed instead of being stacked.
+    """
+    if isinstance(tree, keyed.Tree):
+        key = tree.key
+        return keyed.Tree(
+            to_ranged(
+                tree.tree,
+                None if lo is None else key(lo),
+                None if hi is None else key(hi),
+                inclusive=inclusive,
+            ),
+            key,
+        )
+    if isinstance(tree, mirrored.Tree):
+        is_lo_inclusive, is_hi_inclusive = inclusive
+        return mirrored.Tree(
+            to_ranged(
+                tree.tree, hi, lo, inclusive=(is_hi_inclusive, is_lo_inclusive)
+            )
+        )
+    if isinstance(tree, Tree):
+        return tree.narrow(lo, hi, inclusive=inclusive)
+    return Tree(tree, lo, hi, inclusive=inclusive)
+
+
+def is_ranged(tree: abcs.Tree[Any, Any], /) -> bool:
+    """Checks if given tree is a view of the other tree."""
+    while isinstance(tree, keyed.Tree | mirrored.Tree):
+        tree = tree.tree
+    return isinstance(tree, Tree)
@@ -1,10 +1,8 @@
 from __future__ import annotations
 
-import copy
-import weakref
-from collections.abc import Iterable
+from collections.abc import Iterable, Sequence
 from reprlib import recursive_repr
-from typing import Any, Generic, cast, overload
+from typing import Any, Generic, overload
 
 from reprit.base import generate_repr
 from typing_extensions import Self, override
@@ -13,11 +11,9 @@ from . import abcs
 from .hints import Item, KeyT, ValueT
 from .nil import NIL, Nil
 from .utils import (
-    dereference_maybe,
-    maybe_weakref,
     to_balanced_tree_height,
-    to_unique_sorted_items,
-    to_unique_sorted_values,
+    to_sorted_components,
+    to_unique_sorted_components,
 )
 
 
@@ -26,57 +22,12 @@ class Node(abcs.HasCustomRepr, Generic[KeyT, ValueT]):
     def item(self, /) -> Item[KeyT, ValueT]:
         return self.key, self.value
 
-    @property
-    def key(self, /) -> KeyT:
-        return self._key
-
-    @property
-    def left(self, /) -> Self | Nil:
-        return self._left
-
-    @left.setter
-    def left(self, value: Self | Nil, /) -> None:
-        self._left = value
-        _set_parent(value, self)
-
-    @property
-    def parent(self, /) -> Self | Nil:
-        return dereference_maybe(self._parent)
-
-    @parent.setter
-    def parent(self, value: Self | Nil, /) -> None:
-        self._parent = maybe_weakref(value)
-
-    @property
-    def right(self, /) -> Self | Nil:
-        return self._right
+    key: KeyT
+    left: Self | Nil
+    right: Self | Nil
+    value: ValueT
 
-    @right.setter
-    def right(self, value: Self | Nil, /) -> None:
-        self._right = value
-        _set_parent(value, self)
-
-    @property
-    def value(self, /) -> ValueT:
-        return self._value
-
-    @value.setter
-    def value(self, value: ValueT) -> None:
-        self._value = value
-
-    _left: Self | Nil
-    _right: Self | Nil
-    _parent: weakref.ref[Self] | Nil
-
-    __slots__ = (
-        '__weakref__',
-        '_key',
-        '_left',
-        '_parent',
-        '_right',
-        '_value',
-        'is_black',
-    )
+    __slots__ = 'is_black', 'key', 'left', 'right', 'size', 'value'
 
     def __init__(
         self,
@@ -87,55 +38,111 @@ class Node(abcs.HasCustomRepr, Generic[KeyT, ValueT]):
         is_black: bool,
         left: Self | Nil = NIL,
         right: Self | Nil = NIL,
-        parent: Self | Nil = NIL,
     ) -> None:
-        self._key, self._value, self.is_black = key, value, is_black
-        self.left, self.right, self.parent = left, right, parent
+        self.key, self.value, self.is_black = key, value, is_black
+        self.left, self.right = left, right
+        self.size = _to_size(left) + _to_size(right) + 1
 
     __repr__ = recursive_repr()(generate_repr(__init__))
 
     def __getstate__(self, /) -> tuple[Any, ...]:
         return (
-            self._key,
+            self.key,
             self.value,
             self.is_black,
-            self.parent,
+            self.size,
             self.left,
             self.right,
         )
 
     def __setstate__(self, state: tuple[Any, ...]) -> None:
         (
-            self._key,
-            self._value,
+            self.key,
+            self.value,
             self.is_black,
-            self.parent,
-            self._left,
-            self._right,
+            self.size,
+            self.left,
+            self.right,
         ) = state
 
 
-def _set_parent(
-    node: Node[KeyT, ValueT] | Nil, parent: Node[KeyT, ValueT] | Nil
-) -> None:
-    if node is not NIL:
-        node.parent = parent
-
-
 def _set_black(node: Node[KeyT, ValueT] | Nil, /) -> None:
     if node is not NIL:
         node.is_black = True
 
 
-def _is_left_child(node: Node[KeyT, ValueT], /) -> bool:
-    parent = node.parent
-    return parent is not NIL and parent.left is node
-
-
 def _is_node_black(node: Node[KeyT, ValueT] | Nil, /) -> bool:
     return node is NIL or node.is_black
 
 
+def _to_size(node: Node[KeyT, ValueT] | Nil, /) -> int:
+    return 0 if node is NIL else node.size
+
+
+def _update_size(node: Node[KeyT, ValueT], /) -> None:
+    node.size = _to_size(node.left) + _to_size(node.right) + 1
+
+
+def _to_black_height(node: Node[KeyT, ValueT] | Nil, /) -> int:
+    result = 0
+    while node is not NIL:
+        result += node.is_black
+        node = node.left
+    return result
+
+
+def _to_children_black_height(
+    node: Node[KeyT, ValueT], black_height: int, /
+) -> int:
+    return black_height - node.is_black
+
+
+def _clone_node(node: Node[KeyT, ValueT], /) -> Node[KeyT, ValueT]:
+    result = Node(node.key, node.value, is_black=node.is_black)
+    result.size = node.size
+    return result
+
+
+def _to_root(node: Node[KeyT, ValueT] | Nil, /) -> Node[KeyT, ValueT] | Nil:
+    _set_black(node)
+    return node
+
+
+def _to_balanced_root(
+    keys: Sequence[KeyT], values: Sequence[ValueT], /
+) -> Node[KeyT, ValueT] | Nil:
+    if not keys:
+        return NIL
+    nodes = [
+        Node(key, value, is_black=True)
+        for key, value in zip(keys, values, strict=True)
+    ]
+    # subtrees are formed by bisection of nodes' ranges level by level,
+    # so nodes are linked without recursion
+    starts, ends = [0], [len(nodes)]
+    # the lowest non-root level is coloured red to balance black heights
+    depth, height = 0, to_balanced_tree_height(len(nodes))
+    while starts:
+        next_starts: list[int] = []
+        next_ends: list[int] = []
+        for start_index, end_index in zip(starts, ends, strict=True):
+            middle_index = (start_index + end_index) // 2
+            node = nodes[middle_index]
+            node.is_black = depth != height or depth == 0
+            node.size = end_index - start_index
+            if middle_index > start_index:
+                node.left = nodes[(start_index + middle_index) // 2]
+                next_starts.append(start_index)
+                next_ends.append(middle_index)
+            if middle_index < end_index - 1:
+                node.right = nodes[(middle_index + 1 + end_index) // 2]
+                next_starts.append(middle_index + 1)
+                next_ends.append(end_index)
+        starts, ends = next_starts, next_ends
+        depth += 1
+    return nodes[len(nodes) // 2]
+
+
 class Tree(abcs.Tree[KeyT, ValueT]):
     @overload
     @classmethod
@@ -147,117 +154,168 @@ class Tree(abcs.Tree[KeyT, ValueT]):
     @classmethod
     def from_components(
         cls, keys: Iterable[KeyT], values: Iterable[ValueT], /
-    ) -> Self: ...
+    ) -> Tree[KeyT, ValueT]: ...
 
     @classmethod
     def from_components(
         cls: type[Tree[KeyT, KeyT]] | type[Tree[KeyT, ValueT]],
-        _keys: Iterable[KeyT],
+        keys: Iterable[KeyT],
         values: Iterable[ValueT] | None = None,
         /,
     ) -> Tree[KeyT, KeyT] | Tree[KeyT, ValueT]:
-        keys = list(_keys)
-        if not keys:
-            return cls(NIL)
-        if values is None:
-            keys = to_unique_sorted_values(keys)
-
-            def to_simple_node(
-                start_index: int,
-                end_index: int,
-                depth: int,
-                height: int = to_balanced_tree_height(len(keys)),
-                /,
-            ) -> Node[KeyT, KeyT]:
-                middle_index = (start_index + end_index) // 2
-                key = keys[middle_index]
-                return Node(
-                    key,
-                    key,
-                    is_black=depth != height,
-                    left=(
-                        to_simple_node(start_index, middle_index, depth + 1)
-                        if middle_index > start_index
-                        else NIL
-                    ),
-                    right=(
-                        to_simple_node(middle_index + 1, end_index, depth + 1)
-                        if middle_index < end_index - 1
-                        else NIL
-                    ),
-                )
+        return cls._from_unique_sorted_components(
+            *to_unique_sorted_components(keys, values)
+        )
 
-            simple_root = to_simple_node(0, len(keys), 0)
-            simple_root.is_black = True
-            return cast(type[Tree[KeyT, KeyT]], cls)(simple_root)
-        items = to_unique_sorted_items(keys, tuple(values))
-
-        def to_complex_node(
-            start_index: int,
-            end_index: int,
-            depth: int,
-            height: int = to_balanced_tree_height(len(items)),
-            /,
-        ) -> Node[KeyT, ValueT]:
-            middle_index = (start_index + end_index) // 2
-            key, value = items[middle_index]
-            return Node(
-                key,
-                value,
-                is_black=depth != height,
-                left=(
-                    to_complex_node(start_index, middle_index, depth + 1)
-                    if middle_index > start_index
-                    else NIL
-                ),
-                right=(
-                    to_complex_node(middle_index + 1, end_index, depth + 1)
-                    if middle_index < end_index - 1
-                    else NIL
-                ),
-            )
+    @overload
+    @classmethod
+    def from_sorted(
+        cls,
+        keys: Iterable[KeyT],
+        values: None = ...,
+        /,
+        *,
+        assume_unique: bool = ...,
+    ) -> Tree[KeyT, KeyT]: ...
 
-        complex_root = to_complex_node(0, len(items), 0)
-        complex_root.is_black = True
-        return cast(type[Tree[KeyT, ValueT]], cls)(complex_root)
+    @overload
+    @classmethod
+    def from_sorted(
+        cls,
+        keys: Iterable[KeyT],
+        values: Iterable[ValueT],
+        /,
+        *,
+        assume_unique: bool = ...,
+    ) -> Tree[KeyT, ValueT]: ...
+
+    @classmethod
+    def from_sorted(
+        cls: type[Tree[KeyT, KeyT]] | type[Tree[KeyT, ValueT]],
+        keys: Iterable[KeyT],
+        values: Iterable[ValueT] | None = None,
+        /,
+        *,
+        assume_unique: bool = False,
+    ) -> Tree[KeyT, KeyT] | Tree[KeyT, ValueT]:
+        return cls._from_unique_sorted_components(
+            *to_sorted_components(keys, values, assume_unique=assume_unique)
+        )
+
+    @classmethod
+    def _from_unique_sorted_components(
+        cls, keys: Sequence[KeyT], values: Sequence[ValueT], /
+    ) -> Self:
+        return cls(_to_balanced_root(keys, values))
 
     @property
     @override
     def root(self, /) -> Node[KeyT, ValueT] | Nil:
         return self._root
 
+    @property
+    @override
+    def version(self, /) -> int:
+        return self._version
+
+    @override
+    def bisect_left(self, key: KeyT, /) -> int:
+        node, result = self._root, 0
+        while node is not NIL:
+            if node.key < key:
+                result += _to_size(node.left) + 1
+                node = node.right
+            else:
+                node = node.left
+        return result
+
+    @override
+    def bisect_right(self, key: KeyT, /) -> int:
+        node, result = self._root, 0
+        while node is not NIL:
+            if key < node.key:
+                node = node.left
+            else:
+                result += _to_size(node.left) + 1
+                node = node.right
+        return result
+
     @override
     def clear(self, /) -> None:
         self._root = NIL
+        self._version += 1
+
+    @override
+    def delete_range(
+        self,
+        lo: KeyT | None = None,
+        hi: KeyT | None = None,
+        /,
+        *,
+        inclusive: tuple[bool, bool] = (True, False),
+    ) -> Self:
+        is_lo_inclusive, is_hi_inclusive = inclusive
+        root = self._root
+        black_height = _to_black_height(root)
+        lower, lower_black_height, rest, rest_black_height = (
+            (NIL, 0, root, black_height)
+            if lo is None
+            else self._split_by(
+                root, black_height, lo, is_inclusive=not is_lo_inclusive
+            )
+        )
+        middle, _, upper, upper_black_height = (
+            (rest, rest_black_height, NIL, 0)
+            if hi is None
+            else self._split_by(
+                rest, rest_black_height, hi, is_inclusive=is_hi_inclusive
+            )
+        )
+        root, _ = self._concatenate(
+            lower, lower_black_height, upper, upper_black_height
+        )
+        self._root = _to_root(root)
+        self._version += 1
+        return type(self)(_to_root(middle))
 
     @override
     def predecessor(
         self, node: abcs.Node[KeyT, ValueT], /
     ) -> Node[KeyT, ValueT] | Nil:
-        assert isinstance(node, Node)
-        if node.left is NIL:
-            result = node.parent
-            while result is not NIL and node is result.left:
-                node, result = result, result.parent
-        else:
+        result: Node[KeyT, ValueT] | Nil
+        assert isinstance(node, Node), node
+        if node.left is not NIL:
             result = node.left
             while result.right is not NIL:
                 result = result.right
+        else:
+            result, cursor, key = NIL, self._root, node.key
+            while cursor is not node:
+                assert cursor is not NIL
+                if cursor.key < key:
+                    result, cursor = cursor, cursor.right
+                else:
+                    cursor = cursor.left
         return result
 
     @override
     def successor(
         self, node: abcs.Node[KeyT, ValueT], /
     ) -> Node[KeyT, ValueT] | Nil:
+        result: Node[KeyT, ValueT] | Nil
         assert isinstance(node, Node), node
-        if node.right is NIL:
-            result = node.parent
-            while result is not NIL and node is result.right:
-                node, result = result, result.parent
-        else:
+        if node.right is not NIL:
             result = node.right
             while result.left is not NIL:
                 result = result.left
+        else:
+            result, cursor, key = NIL, self._root, node.key
+            while cursor is not node:
+                assert cursor is not NIL
+                if key < cursor.key:
+                    result, cursor = cursor, cursor.left
+                else:
+                    cursor = cursor.right
         return result
 
     @override
@@ -265,198 +323,729 @@ class Tree(abcs.Tree[KeyT, ValueT]):
         parent = self._root
         if parent is NIL:
             node = self._root = Node(key, value, is_black=True)
+            self._version += 1
             return node
+        # the last node which key is not greater than the given one
+        # is checked for equality only once the leaf is reached
+        candidate: Node[KeyT, ValueT] | Nil
+        ancestors, candidate = [], NIL
         while True:
+            ancestors.append(parent)
             if key < parent.key:
                 if parent.left is NIL:
-                    node = Node(key, value, is_black=False)
-                    parent.left = node
+                    if candidate is not NIL and not candidate.key < key:
+                        return candidate
+                    node = parent.left = Node(key, value, is_black=False)
                     break
                 parent = parent.left
-            elif parent.key < key:
+            else:
                 if parent.right is NIL:
-                    node = Node(key, value, is_black=False)
-                    parent.right = node
+                    if not parent.key < key:
+                        return parent
+                    node = parent.right = Node(key, value, is_black=False)
                     break
-                parent = parent.right
-            else:
-                return parent
-        self._restore(node)
+                candidate, parent = parent, parent.right
+        for ancestor in ancestors:
+            ancestor.size += 1
+        self._restore(node, ancestors)
+        self._version += 1
         return node
 
+    @override
+    def intersect(self, other: Self, /) -> Self:
+        if not isinstance(other, Tree) or other is self:
+            return super().intersect(other)
+        root, other_root = self._root, other._root
+        # recursion goes over the smaller tree
+        # so the result is not larger than any of operands
+        root, _ = (
+            self._intersect(
+                root,
+                _to_black_height(root),
+                other_root,
+                _to_black_height(other_root),
+                prefer_base=True,
+            )
+            if _to_size(root) <= _to_size(other_root)
+            else self._intersect(
+                other_root,
+                _to_black_height(other_root),
+                root,
+                _to_black_height(root),
+                prefer_base=False,
+            )
+        )
+        self._root = other._root = NIL
+        self._version += 1
+        other._version += 1
+        return type(self)(_to_root(root))
+
+    @override
+    def join(self, other: Self, /) -> Self:
+        if not isinstance(other, Tree):
+            return super().join(other)
+        left, right = self._root, other._root
+        if left is NIL:
+            root = right
+        elif right is NIL:
+            root = left
+        else:
+            max_node = left
+            while max_node.right is not NIL:
+                max_node = max_node.right
+            min_node = right
+            while min_node.left is not NIL:
+                min_node = min_node.left
+            if not max_node.key < min_node.key:
+                raise ValueError(
+                    'Keys of the tree should be less '
+                    'than keys of the other one.'
+                )
+            rest, rest_black_height, last = self._split_last(
+                left, _to_black_height(left)
+            )
+            root, _ = self._join(
+                rest, rest_black_height, last, right, _to_black_height(right)
+            )
+        self._root = other._root = NIL
+        self._version += 1
+        other._version += 1
+        return type(self)(_to_root(root))
+
     @override
     def remove(self, node: abcs.Node[KeyT, ValueT], /) -> None:
         assert isinstance(node, Node), node
-        successor, is_node_black = node, node.is_black
-        if successor.left is NIL:
-            (
-                successor_child,
-                successor_child_parent,
-                is_successor_child_left,
-            ) = (successor.right, successor.parent, _is_left_child(successor))
-            self._transplant(successor, successor_child)
-        elif successor.right is NIL:
-            (
-                successor_child,
-                successor_child_parent,
-                is_successor_child_left,
-            ) = (successor.left, successor.parent, _is_left_child(successor))
-            self._transplant(successor, successor_child)
+        self._version += 1
+        ancestors = self._to_ancestors(node)
+        parent = ancestors[-1] if ancestors else NIL
+        if node.left is NIL or node.right is NIL:
+            is_removed_black = node.is_black
+            child = node.right if node.left is NIL else node.left
+            is_child_left = parent is not NIL and parent.left is node
+            self._replace_child(parent, node, child)
         else:
-            assert node.right is not NIL
-            successor = node.right
+            successor, successor_ancestors = node.right, []
             while successor.left is not NIL:
+                successor_ancestors.append(successor)
                 successor = successor.left
-            is_node_black = successor.is_black
-            successor_child, is_successor_child_left = successor.right, False
-            if successor.parent is node:
-                successor_child_parent = successor
-            else:
-                is_successor_child_left = _is_left_child(successor)
-                successor_child_parent = successor.parent
-                self._transplant(successor, successor.right)
+            is_removed_black, child = successor.is_black, successor.right
+            if successor_ancestors:
+                successor_ancestors[-1].left = child
                 successor.right = node.right
-            self._transplant(node, successor)
-            assert node.left is not NIL
-            node.left.parent = successor
+                is_child_left = True
+            else:
+                is_child_left = False
             successor.left, successor.is_black = node.left, node.is_black
-        if is_node_black:
-            self._remove_node_fixup(
-                successor_child,
-                successor_child_parent,
-                is_successor_child_left,
-            )
+            self._replace_child(parent, node, successor)
+            ancestors.append(successor)
+            ancestors.extend(successor_ancestors)
+        for ancestor in reversed(ancestors):
+            _update_size(ancestor)
+        if is_removed_black:
+            self._remove_node_fixup(child, ancestors, is_child_left)
 
-    def _restore(self, node: Node[KeyT, ValueT], /) -> None:
-        while not _is_node_black(node.parent):
-            parent = node.parent
-            assert parent is not NIL
-            grandparent = parent.parent
-            assert grandparent is not NIL
-            if parent is grandparent.left:
-                uncle = grandparent.right
-                if _is_node_black(uncle):
-                    if node is parent.right:
-                        self._rotate_left(parent)
-                        node, parent = parent, node
-                    parent.is_black, grandparent.is_black = True, False
-                    self._rotate_right(grandparent)
-                else:
-                    assert uncle is not NIL
-                    parent.is_black = uncle.is_black = True
-                    grandparent.is_black = False
-                    node = grandparent
+    @override
+    def select(self, index: int, /) -> Node[KeyT, ValueT] | Nil:
+        node = self._root
+        if not 0 <= index < _to_size(node):
+            return NIL
+        while True:
+            assert node is not NIL
+            left_size = _to_size(node.left)
+            if index < left_size:
+                node = node.left
+            elif index > left_size:
+                index -= left_size + 1
+                node = node.right
             else:
-                uncle = grandparent.left
-                if _is_node_black(uncle):
-                    if node is parent.left:
-                        self._rotate_right(parent)
-                        node, parent = parent, node
-                    parent.is_black, grandparent.is_black = True, False
-                    self._rotate_left(grandparent)
-                else:
-                    assert uncle is not NIL
-                    parent.is_black = uncle.is_black = True
-                    grandparent.is_black = False
-                    node = grandparent
-        assert self._root is not NIL
-        self._root.is_black = True
+                return node
+
+    @override
+    def split(self, key: KeyT, /) -> tuple[Self, Self]:
+        root = self._root
+        lower, _, found, upper, upper_black_height = self._split(
+            root, _to_black_height(root), key
+        )
+        if found is not NIL:
+            upper, _ = self._join(NIL, 0, found, upper, upper_black_height)
+        self._root = NIL
+        self._version += 1
+        return type(self)(_to_root(lower)), type(self)(_to_root(upper))
+
+    @override
+    def subtract(self, other: Self, /) -> Self:
+        if not isinstance(other, Tree) or other is self:
+            return super().subtract(other)
+        root, other_root = self._root, other._root
+        root, _ = self._subtract(
+            root,
+            _to_black_height(root),
+            other_root,
+            _to_black_height(other_root),
+        )
+        self._root = other._root = NIL
+        self._version += 1
+        other._version += 1
+        return type(self)(_to_root(root))
+
+    @override
+    def symmetric_subtract(self, other: Self, /) -> Self:
+        if not isinstance(other, Tree) or other is self:
+            return super().symmetric_subtract(other)
+        root, other_root = self._root, other._root
+        root, _ = self._symmetric_subtract(
+            root,
+            _to_black_height(root),
+            other_root,
+            _to_black_height(other_root),
+        )
+        self._root = other._root = NIL
+        self._version += 1
+        other._version += 1
+        return type(self)(_to_root(root))
+
+    @override
+    def unite(self, other: Self, /) -> Self:
+        if not isinstance(other, Tree) or other is self:
+            return super().unite(other)
+        root, other_root = self._root, other._root
+        # recursion goes over the larger tree
+        # so the smaller one gets split
+        root, _ = (
+            self._unite(
+                root,
+                _to_black_height(root),
+                other_root,
+                _to_black_height(other_root),
+                prefer_base=True,
+            )
+            if _to_size(root) >= _to_size(other_root)
+            else self._unite(
+                other_root,
+                _to_black_height(other_root),
+                root,
+                _to_black_height(root),
+                prefer_base=False,
+            )
+        )
+        self._root = other._root = NIL
+        self._version += 1
+        other._version += 1
+        return type(self)(_to_root(root))
+
+    @classmethod
+    def _concatenate(
+        cls,
+        left: Node[KeyT, ValueT] | Nil,
+        left_black_height: int,
+        right: Node[KeyT, ValueT] | Nil,
+        right_black_height: int,
+        /,
+    ) -> tuple[Node[KeyT, ValueT] | Nil, int]:
+        if left is NIL:
+            return right, right_black_height
+        rest, rest_black_height, last = cls._split_last(
+            left, left_black_height
+        )
+        return cls._join(
+            rest, rest_black_height, last, right, right_black_height
+        )
+
+    @classmethod
+    def _intersect(
+        cls,
+        base: Node[KeyT, ValueT] | Nil,
+        base_black_height: int,
+        other: Node[KeyT, ValueT] | Nil,
+        other_black_height: int,
+        /,
+        *,
+        prefer_base: bool,
+    ) -> tuple[Node[KeyT, ValueT] | Nil, int]:
+        if base is NIL or other is NIL:
+            return NIL, 0
+        left, right = base.left, base.right
+        children_black_height = _to_children_black_height(
+            base, base_black_height
+        )
+        lower, lower_black_height, found, upper, upper_black_height = (
+            cls._split(other, other_black_height, base.key)
+        )
+        left, left_black_height = cls._intersect(
+            left,
+            children_black_height,
+            lower,
+            lower_black_height,
+            prefer_base=prefer_base,
+        )
+        right, right_black_height = cls._intersect(
+            right,
+            children_black_height,
+            upper,
+            upper_black_height,
+            prefer_base=prefer_base,
+        )
+        if found is NIL:
+            return cls._concatenate(
+                left, left_black_height, right, right_black_height
+            )
+        return cls._join(
+            left,
+            left_black_height,
+            base if prefer_base else found,
+            right,
+            right_black_height,
+        )
+
+    @classmethod
+    def _join(
+        cls,
+        left: Node[KeyT, ValueT] | Nil,
+        left_black_height: int,
+        node: Node[KeyT, ValueT],
+        right: Node[KeyT, ValueT] | Nil,
+        right_black_height: int,
+        /,
+    ) -> tuple[Node[KeyT, ValueT], int]:
+        if left_black_height > right_black_height:
+            assert left is not NIL
+            result = cls._join_right(
+                left, left_black_height, node, right, right_black_height
+            )
+            if not result.is_black and not _is_node_black(result.right):
+                result.is_black = True
+                return result, left_black_height + 1
+            return result, left_black_height
+        if right_black_height > left_black_height:
+            assert right is not NIL
+            result = cls._join_left(
+                left, left_black_height, node, right, right_black_height
+            )
+            if not result.is_black and not _is_node_black(result.left):
+                result.is_black = True
+                return result, right_black_height + 1
+            return result, right_black_height
+        node.left, node.right = left, right
+        node.is_black = not (_is_node_black(left) and _is_node_black(right))
+        _update_size(node)
+        return node, left_black_height + node.is_black
+
+    @classmethod
+    def _join_left(
+        cls,
+        left: Node[KeyT, ValueT] | Nil,
+        left_black_height: int,
+        node: Node[KeyT, ValueT],
+        right: Node[KeyT, ValueT] | Nil,
+        right_black_height: int,
+        /,
+    ) -> Node[KeyT, ValueT]:
+        if _is_node_black(right) and right_black_height == left_black_height:
+            node.left, node.right, node.is_black = left, right, False
+            _update_size(node)
+            return node
+        assert right is not NIL
+        right.left = cls._join_left(
+            left,
+            left_black_height,
+            node,
+            right.left,
+            _to_children_black_height(right, right_black_height),
+        )
+        _update_size(right)
+        if (
+            right.is_black
+            and not _is_node_black(right.left)
+            and not _is_node_black(right.left.left)
+        ):
+            assert right.left.left is not NIL
+            right.left.left.is_black = True
+            return cls._rotated_right(right)
+        return right
+
+    @classmethod
+    def _join_right(
+        cls,
+        left: Node[KeyT, ValueT] | Nil,
+        left_black_height: int,
+        node: Node[KeyT, ValueT],
+        right: Node[KeyT, ValueT] | Nil,
+        right_black_height: int,
+        /,
+    ) -> Node[KeyT, ValueT]:
+        if _is_node_black(left) and left_black_height == right_black_height:
+            node.left, node.right, node.is_black = left, right, False
+            _update_size(node)
+            return node
+        assert left is not NIL
+        left.right = cls._join_right(
+            left.right,
+            _to_children_black_height(left, left_black_height),
+            node,
+            right,
+            right_black_height,
+        )
+        _update_size(left)
+        if (
+            left.is_black
+            and not _is_node_black(left.right)
+            and not _is_node_black(left.right.right)
+        ):
+            assert left.right.right is not NIL
+            left.right.right.is_black = True
+            return cls._rotated_left(left)
+        return left
 
     def _remove_node_fixup(
         self,
         node: Node[KeyT, ValueT] | Nil,
-        parent: Node[KeyT, ValueT] | Nil,
+        ancestors: list[Node[KeyT, ValueT]],
         is_left_child: bool,  # ruff: ignore[boolean-type-hint-positional-argument]
         /,
     ) -> None:
-        while node is not self._root and _is_node_black(node):
-            assert parent is not NIL
+        while ancestors and _is_node_black(node):
+            parent = ancestors[-1]
+            grandparent = ancestors[-2] if len(ancestors) > 1 else NIL
             if is_left_child:
                 sibling = parent.right
                 assert sibling is not NIL
-                if not _is_node_black(sibling):
+                if not sibling.is_black:
                     sibling.is_black, parent.is_black = True, False
-                    self._rotate_left(parent)
-                    sibling = parent.right
-                assert sibling is not NIL
+                    self._replace_child(
+                        grandparent, parent, self._rotated_left(parent)
+                    )
+                    ancestors.insert(-1, sibling)
+                    grandparent, sibling = sibling, parent.right
+                    assert sibling is not NIL
                 if _is_node_black(sibling.left) and _is_node_black(
                     sibling.right
                 ):
                     sibling.is_black = False
-                    node, parent = parent, parent.parent
-                    is_left_child = _is_left_child(node)
+                    node = ancestors.pop()
+                    is_left_child = grandparent is not NIL and (
+                        grandparent.left is node
+                    )
                 else:
                     if _is_node_black(sibling.right):
                         assert sibling.left is not NIL
                         sibling.left.is_black, sibling.is_black = True, False
-                        self._rotate_right(sibling)
-                        sibling = parent.right
-                    assert sibling is not NIL
+                        sibling = parent.right = self._rotated_right(sibling)
                     sibling.is_black, parent.is_black = parent.is_black, True
                     _set_black(sibling.right)
-                    self._rotate_left(parent)
-                    node = self._root
+                    self._replace_child(
+                        grandparent, parent, self._rotated_left(parent)
+                    )
+                    return
             else:
                 sibling = parent.left
-                if not _is_node_black(sibling):
-                    assert sibling is not NIL
-                    sibling.is_black, parent.is_black = True, False
-                    self._rotate_right(parent)
-                    sibling = parent.left
                 assert sibling is not NIL
+                if not sibling.is_black:
+                    sibling.is_black, parent.is_black = True, False
+                    self._replace_child(
+                        grandparent, parent, self._rotated_right(parent)
+                    )
+                    ancestors.insert(-1, sibling)
+                    grandparent, sibling = sibling, parent.left
+                    assert sibling is not NIL
                 if _is_node_black(sibling.left) and _is_node_black(
                     sibling.right
                 ):
                     sibling.is_black = False
-                    node, parent = parent, parent.parent
-                    is_left_child = _is_left_child(node)
+                    node = ancestors.pop()
+                    is_left_child = grandparent is not NIL and (
+                        grandparent.left is node
+                    )
                 else:
                     if _is_node_black(sibling.left):
                         assert sibling.right is not NIL
                         sibling.right.is_black, sibling.is_black = True, False
-                        self._rotate_left(sibling)
-                        sibling = parent.left
-                    assert sibling is not NIL
+                        sibling = parent.left = self._rotated_left(sibling)
                     sibling.is_black, parent.is_black = parent.is_black, True
                     _set_black(sibling.left)
-                    self._rotate_right(parent)
-                    node = self._root
+                    self._replace_child(
+                        grandparent, parent, self._rotated_right(parent)
+                    )
+                    return
         _set_black(node)
 
-    def _rotate_left(self, node: Node[KeyT, ValueT]) -> None:
-        replacement = node.right
-        assert replacement is not NIL
-        self._transplant(node, replacement)
-        node.right, replacement.left = replacement.left, node
-
-    def _rotate_right(self, node: Node[KeyT, ValueT]) -> None:
-        replacement = node.left
-        assert replacement is not NIL
-        self._transplant(node, replacement)
-        node.left, replacement.right = replacement.right, node
-
-    def _transplant(
+    def _replace_child(
         self,
+        parent: Node[KeyT, ValueT] | Nil,
         origin: Node[KeyT, ValueT],
         replacement: Node[KeyT, ValueT] | Nil,
         /,
     ) -> None:
-        parent = origin.parent
         if parent is NIL:
             self._root = replacement
-            _set_parent(replacement, NIL)
         elif origin is parent.left:
             parent.left = replacement
         else:
             parent.right = replacement
 
+    def _restore(
+        self, node: Node[KeyT, ValueT], ancestors: list[Node[KeyT, ValueT]], /
+    ) -> None:
+        while ancestors and not ancestors[-1].is_black:
+            parent = ancestors.pop()
+            # red node is not a root, so it has a parent
+            grandparent = ancestors.pop()
+            great_grandparent = ancestors[-1] if ancestors else NIL
+            if parent is grandparent.left:
+                uncle = grandparent.right
+                if _is_node_black(uncle):
+                    if node is parent.right:
+                        grandparent.left = self._rotated_left(parent)
+                        node, parent = parent, node
+                    parent.is_black, grandparent.is_black = True, False
+                    self._replace_child(
+                        great_grandparent,
+                        grandparent,
+                        self._rotated_right(grandparent),
+                    )
+                    break
+                assert uncle is not NIL
+            else:
+                uncle = grandparent.left
+                if _is_node_black(uncle):
+                    if node is parent.left:
+                        grandparent.right = self._rotated_right(parent)
+                        node, parent = parent, node
+                    parent.is_black, grandparent.is_black = True, False
+                    self._replace_child(
+                        great_grandparent,
+                        grandparent,
+                        self._rotated_left(grandparent),
+                    )
+                    break
+                assert uncle is not NIL
+            parent.is_black = uncle.is_black = True
+            grandparent.is_black = False
+            node = grandparent
+        assert self._root is not NIL
+        self._root.is_black = True
+
+    @staticmethod
+    def _rotated_left(node: Node[KeyT, ValueT], /) -> Node[KeyT, ValueT]:
+        replacement = node.right
+        assert replacement is not NIL
+        node.right, replacement.left = replacement.left, node
+        _update_size(node)
+        _update_size(replacement)
+        return replacement
+
+    @staticmethod
+    def _rotated_right(node: Node[KeyT, ValueT], /) -> Node[KeyT, ValueT]:
+        replacement = node.left
+        assert replacement is not NIL
+        node.left, replacement.right = replacement.right, node
+        _update_size(node)
+        _update_size(replacement)
+        return replacement
+
+    @classmethod
+    def _split(
+        cls, node: Node[KeyT, ValueT] | Nil, black_height: int, key: KeyT, /
+    ) -> tuple[
+        Node[KeyT, ValueT] | Nil,
+        int,
+        Node[KeyT, ValueT] | Nil,
+        Node[KeyT, ValueT] | Nil,
+        int,
+    ]:
+        if node is NIL:
+            return NIL, 0, NIL, NIL, 0
+        left, right = node.left, node.right
+        children_black_height = _to_children_black_height(node, black_height)
+        if key < node.key:
+            lower, lower_black_height, found, upper, upper_black_height = (
+                cls._split(left, children_black_height, key)
+            )
+            upper, upper_black_height = cls._join(
+                upper, upper_black_height, node, right, children_black_height
+            )
+        elif node.key < key:
+            lower, lower_black_height, found, upper, upper_black_height = (
+                cls._split(right, children_black_height, key)
+            )
+            lower, lower_black_height = cls._join(
+                left, children_black_height, node, lower, lower_black_height
+            )
+        else:
+            lower, found, upper = left, node, right
+            lower_black_height = upper_black_height = children_black_height
+        return lower, lower_black_height, found, upper, upper_black_height
+
+    @classmethod
+    def _split_by(
+        cls,
+        node: Node[KeyT, ValueT] | Nil,
+        black_height: int,
+        key: KeyT,
+        /,
+        *,
+        is_inclusive: bool,
+    ) -> tuple[Node[KeyT, ValueT] | Nil, int, Node[KeyT, ValueT] | Nil, int]:
+        # node with the key goes to the lower part if it is inclusive
+        lower, lower_black_height, found, upper, upper_black_height = (
+            cls._split(node, black_height, key)
+        )
+        if found is not NIL:
+            if is_inclusive:
+                lower, lower_black_height = cls._join(
+                    lower, lower_black_height, found, NIL, 0
+                )
+            else:
+                upper, upper_black_height = cls._join(
+                    NIL, 0, found, upper, upper_black_height
+                )
+        return lower, lower_black_height, upper, upper_black_height
+
+    @classmethod
+    def _split_last(
+        cls, node: Node[KeyT, ValueT], black_height: int, /
+    ) -> tuple[Node[KeyT, ValueT] | Nil, int, Node[KeyT, ValueT]]:
+        children_black_height = _to_children_black_height(node, black_height)
+        if node.right is NIL:
+            return node.left, children_black_height, node
+        rest, rest_black_height, last = cls._split_last(
+            node.right, children_black_height
+        )
+        rest, rest_black_height = cls._join(
+            node.left, children_black_height, node, rest, rest_black_height
+        )
+        return rest, rest_black_height, last
+
+    @classmethod
+    def _subtract(
+        cls,
+        minuend: Node[KeyT, ValueT] | Nil,
+        minuend_black_height: int,
+        subtrahend: Node[KeyT, ValueT] | Nil,
+        subtrahend_black_height: int,
+        /,
+    ) -> tuple[Node[KeyT, ValueT] | Nil, int]:
+        if minuend is NIL or subtrahend is NIL:
+            return minuend, minuend_black_height
+        left, right = minuend.left, minuend.right
+        children_black_height = _to_children_black_height(
+            minuend, minuend_black_height
+        )
+        lower, lower_black_height, found, upper, upper_black_height = (
+            cls._split(subtrahend, subtrahend_black_height, minuend.key)
+        )
+        left, left_black_height = cls._subtract(
+            left, children_black_height, lower, lower_black_height
+        )
+        right, right_black_height = cls._subtract(
+            right, children_black_height, upper, upper_black_height
+        )
+        if found is NIL:
+            return cls._join(
+                left, left_black_height, minuend, right, right_black_height
+            )
+        return cls._concatenate(
+            left, left_black_height, right, right_black_height
+        )
+
+    @classmethod
+    def _symmetric_subtract(
+        cls,
+        first: Node[KeyT, ValueT] | Nil,
+        first_black_height: int,
+        second: Node[KeyT, ValueT] | Nil,
+        second_black_height: int,
+        /,
+    ) -> tuple[Node[KeyT, ValueT] | Nil, int]:
+        if first is NIL:
+            return second, second_black_height
+        if second is NIL:
+            return first, first_black_height
+        left, right = first.left, first.right
+        children_black_height = _to_children_black_height(
+            first, first_black_height
+        )
+        lower, lower_black_height, found, upper, upper_black_height = (
+            cls._split(second, second_black_height, first.key)
+        )
+        left, left_black_height = cls._symmetric_subtract(
+            left, children_black_height, lower, lower_black_height
+        )
+        right, right_black_height = cls._symmetric_subtract(
+            right, children_black_height, upper, upper_black_height
+        )
+        if found is NIL:
+            return cls._join(
+                left, left_black_height, first, right, right_black_height
+            )
+        return cls._concatenate(
+            left, left_black_height, right, right_black_height
+        )
+
+    def _to_ancestors(
+        self, node: Node[KeyT, ValueT], /
+    ) -> list[Node[KeyT, ValueT]]:
+        result, cursor, key = [], self._root, node.key
+        while cursor is not node:
+            assert cursor is not NIL
+            result.append(cursor)
+            cursor = cursor.left if key < cursor.key else cursor.right
+        return result
+
+    @classmethod
+    def _unite(
+        cls,
+        base: Node[KeyT, ValueT] | Nil,
+        base_black_height: int,
+        other: Node[KeyT, ValueT] | Nil,
+        other_black_height: int,
+        /,
+        *,
+        prefer_base: bool,
+    ) -> tuple[Node[KeyT, ValueT] | Nil, int]:
+        if base is NIL:
+            return other, other_black_height
+        if other is NIL:
+            return base, base_black_height
+        left, right = base.left, base.right
+        children_black_height = _to_children_black_height(
+            base, base_black_height
+        )
+        lower, lower_black_height, found, upper, upper_black_height = (
+            cls._split(other, other_black_height, base.key)
+        )
+        left, left_black_height = cls._unite(
+            left,
+            children_black_height,
+            lower,
+            lower_black_height,
+            prefer_base=prefer_base,
+        )
+        right, right_black_height = cls._unite(
+            right,
+            children_black_height,
+            upper,
+            upper_black_height,
+            prefer_base=prefer_base,
+        )
+        return cls._join(
+            left,
+            left_black_height,
+            base if prefer_base or found is NIL else found,
+            right,
+            right_black_height,
+        )
+
     _root: Node[KeyT, ValueT] | Nil
 
-    __slots__ = ('_root',)
+    __slots__ = '_root', '_version'
 
     @override
     def __copy__(self, /) -> Self:
-        return type(self)(copy.deepcopy(self._root))
+        return type(self)(abcs.clone_subtree(self._root, _clone_node))
 
-    def __init__(self, root: Node[KeyT, ValueT] | Nil) -> None:
-        self._root = root
+    def __init__(self, root: Node[KeyT, ValueT] | Nil, /) -> None:
+        self._root, self._version = root, 0
+
+    @override
+    def __len__(self, /) -> int:
+        return _to_size(self._root)
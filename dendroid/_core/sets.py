@@ -1,18 +1,44 @@
 from __future__ import annotations
 
 from abc import abstractmethod
-from collections.abc import Iterable, Iterator
-from typing import Any, Generic
+from collections.abc import Callable, Iterable, Iterator
+from copy import copy
+from functools import partial
+from typing import Any, Generic, TypeVar
 
 from reprit.base import generate_repr
-from typing_extensions import Self, override
+from typing_extensions import Self, TypeIs, override
 
-from .abcs import HasCustomRepr, MutableSet, Tree, TreeWrapper
+from . import mirrored, ranged
+from .abcs import AbstractSet, HasCustomRepr, MutableSet, Tree, TreeWrapper
+from .conversion import to_backend
+from .cursors import Cursor
 from .hints import KeyT, Order, ValueT
+from .instrumentation import Counters, instrument
 from .nil import NIL
+from .stats import Stats, to_stats
+from .utils import is_size_negligible, to_sequence
 
 
 class BaseSet(TreeWrapper[Any, ValueT], MutableSet[ValueT]):
+    @property
+    @abstractmethod
+    def _tree(self, /) -> Tree[Any, ValueT]:
+        raise NotImplementedError
+
+    @_tree.setter
+    @abstractmethod
+    def _tree(self, value: Tree[Any, ValueT], /) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def bisect_left(self, value: ValueT, /) -> int:
+        """Returns number of values less than the given one."""
+
+    @abstractmethod
+    def bisect_right(self, value: ValueT, /) -> int:
+        """Returns number of values not greater than the given one."""
+
     @abstractmethod
     def ceil(self, value: ValueT, /) -> ValueT:
         """Returns first value not less than the given one."""
@@ -20,10 +46,79 @@ class BaseSet(TreeWrapper[Any, ValueT], MutableSet[ValueT]):
     def clear(self, /) -> None:
         self._tree.clear()
 
+    @abstractmethod
+    def count_range(
+        self,
+        lo: ValueT | None = None,
+        hi: ValueT | None = None,
+        /,
+        *,
+        inclusive: tuple[bool, bool] = (True, False),
+    ) -> int:
+        """Returns number of values between given bounds."""
+
+    @abstractmethod
+    def cursor(self, value: ValueT | None = None, /) -> Cursor[Any, ValueT]:
+        """
+        Returns cursor at the first value not less than the given one
+        (or at the first value at all if it is not given).
+        """
+
+    @abstractmethod
+    def delete_range(
+        self,
+        lo: ValueT | None = None,
+        hi: ValueT | None = None,
+        /,
+        *,
+        inclusive: tuple[bool, bool] = (True, False),
+    ) -> Self:
+        """
+        Removes values between given bounds & returns set with them.
+        """
+
+    def filter(self, predicate: Callable[[ValueT], bool], /) -> Self:
+        """Returns set with values satisfying given predicate."""
+        tree = self._tree
+        keys, values = [], []
+        for node in tree:
+            if predicate(node.value):
+                keys.append(node.key)
+                values.append(node.value)
+        # traversal is ordered, so the tree is built without sorting
+        return self._from_tree(
+            tree.from_sorted(keys, values, assume_unique=True)
+        )
+
     @abstractmethod
     def floor(self, value: ValueT, /) -> ValueT:
         """Returns first value not greater than the given one."""
 
+    def instrument(self, /) -> Counters:
+        """
+        Makes the set count operations it performs & returns the counters.
+        """
+        return instrument(self._tree)
+
+    @abstractmethod
+    def join(self, other: Self, /) -> Self:
+        """
+        Returns set with values of both sets
+        given that all values of the set are less than values of the other one.
+        """
+
+    @abstractmethod
+    def irange(
+        self,
+        lo: ValueT | None = None,
+        hi: ValueT | None = None,
+        /,
+        *,
+        inclusive: tuple[bool, bool] = (True, False),
+        reverse: bool = False,
+    ) -> Iterator[ValueT]:
+        """Returns iterator over values between given bounds."""
+
     def max(self, /) -> ValueT:
         node = self._tree.max()
         if node is NIL:
@@ -47,12 +142,24 @@ class BaseSet(TreeWrapper[Any, ValueT], MutableSet[ValueT]):
             raise ValueError('Set is empty')
         return node.value
 
+    def popmax_many(self, count: int, /) -> Self:
+        """
+        Removes given number of the greatest values & returns set with them.
+        """
+        return self._from_tree(self._tree.popmax_many(count))
+
     def popmin(self, /) -> ValueT:
         node = self._tree.popmin()
         if node is NIL:
             raise ValueError('Set is empty')
         return node.value
 
+    def popmin_many(self, count: int, /) -> Self:
+        """
+        Removes given number of the least values & returns set with them.
+        """
+        return self._from_tree(self._tree.popmin_many(count))
+
     pop = popmin
 
     @abstractmethod
@@ -60,12 +167,128 @@ class BaseSet(TreeWrapper[Any, ValueT], MutableSet[ValueT]):
         """Returns last value lesser than the given one."""
         raise NotImplementedError
 
+    @abstractmethod
+    def rank(self, value: ValueT, /) -> int:
+        """Returns position of given value in ascending order."""
+        raise NotImplementedError
+
+    def stats(self, /) -> Stats:
+        """Returns shape & memory footprint of the set."""
+        return to_stats(self._tree)
+
+    @abstractmethod
+    def split(self, value: ValueT, /) -> tuple[Self, Self]:
+        """
+        Returns sets with values less than the given one
+        and with the rest of values.
+        """
+
+    def select(self, index: int, /) -> ValueT:
+        node = self._tree.select(
+            index + len(self._tree) if index < 0 else index
+        )
+        if node is NIL:
+            raise IndexError('Set index out of range')
+        return node.value
+
+    def truncate_above(self, value: ValueT, /) -> Self:
+        """
+        Removes values greater than the given one & returns set with them.
+        """
+        return self.delete_range(value, None, inclusive=(False, True))
+
+    def truncate_below(self, value: ValueT, /) -> Self:
+        """
+        Removes values less than the given one & returns set with them.
+        """
+        return self.delete_range(None, value)
+
+    @abstractmethod
+    def view(
+        self,
+        lo: ValueT | None = None,
+        hi: ValueT | None = None,
+        /,
+        *,
+        inclusive: tuple[bool, bool] = (True, False),
+    ) -> Self:
+        """
+        Returns live view of the set with values between given bounds.
+        """
+
+    @abstractmethod
+    def _from_tree(self, tree: Tree[Any, ValueT], /) -> Self:
+        """Constructs set of the same kind from given tree."""
+
+    def _is_in_place_similar(
+        self, other: AbstractSet[ValueT], /
+    ) -> TypeIs[Self]:
+        # views share nodes with other sets, so their trees are kept
+        return self._is_similar(other) and not ranged.is_ranged(self._tree)
+
+    @abstractmethod
+    def _is_similar(self, other: AbstractSet[ValueT], /) -> TypeIs[Self]:
+        """Checks if given set orders its values the same way as the set."""
+
     __slots__ = ()
 
+    def __and__(self, other: AbstractSet[ValueT], /) -> Self:
+        if not isinstance(other, AbstractSet):
+            return NotImplemented
+        if not self._is_similar(other) or len(self) <= len(other):
+            return self.filter(other.__contains__)
+        keys, values = [], []
+        for other_node in other._tree:
+            node = self._tree.find(other_node.key)
+            if node is not NIL:
+                keys.append(node.key)
+                values.append(node.value)
+        return self._from_tree(
+            self._tree.from_sorted(keys, values, assume_unique=True)
+        )
+
+    def __iand__(self, other: AbstractSet[ValueT], /) -> Self:
+        if not self._is_in_place_similar(other):
+            return super().__iand__(other)
+        if is_size_negligible(len(self), len(other)) or is_size_negligible(
+            len(other), len(self)
+        ):
+            self._tree = (self & other)._tree
+        else:
+            self._tree = self._tree.intersect(copy(other._tree))
+        return self
+
+    def __ior__(self, other: AbstractSet[ValueT], /) -> Self:
+        if not self._is_in_place_similar(other) or is_size_negligible(
+            len(other), len(self)
+        ):
+            return super().__ior__(other)
+        self._tree = self._tree.unite(copy(other._tree))
+        return self
+
+    def __isub__(self, other: AbstractSet[ValueT], /) -> Self:
+        if not self._is_in_place_similar(other) or is_size_negligible(
+            len(other), len(self)
+        ):
+            return super().__isub__(other)
+        if is_size_negligible(len(self), len(other)):
+            self._tree = (self - other)._tree
+        else:
+            self._tree = self._tree.subtract(copy(other._tree))
+        return self
+
     def __iter__(self, /) -> Iterator[ValueT]:
         for node in self._tree:
             yield node.value
 
+    def __ixor__(self, other: AbstractSet[ValueT], /) -> Self:
+        if not self._is_in_place_similar(other) or is_size_negligible(
+            len(other), len(self)
+        ):
+            return super().__ixor__(other)
+        self._tree = self._tree.symmetric_subtract(copy(other._tree))
+        return self
+
     def __len__(self, /) -> int:
         return len(self._tree)
 
@@ -73,6 +296,18 @@ class BaseSet(TreeWrapper[Any, ValueT], MutableSet[ValueT]):
         for node in reversed(self._tree):
             yield node.value
 
+    def __sub__(self, other: AbstractSet[ValueT], /) -> Self:
+        if not isinstance(other, AbstractSet):
+            return NotImplemented
+        return self.filter(partial(_not_contains, other))
+
+    def __xor__(self, other: AbstractSet[ValueT], /) -> Self:
+        if not self._is_similar(other):
+            return super().__xor__(other)
+        return self._from_tree(
+            copy(self._tree).symmetric_subtract(copy(other._tree))
+        )
+
 
 class Set(HasCustomRepr, BaseSet[ValueT]):
     @property
@@ -80,9 +315,25 @@ class Set(HasCustomRepr, BaseSet[ValueT]):
     def _tree(self, /) -> Tree[Any, ValueT]:
         return self.__tree
 
+    @_tree.setter
+    @override
+    def _tree(self, value: Tree[Any, ValueT], /) -> None:
+        self.__tree = value
+
     @override
-    def add(self, value: ValueT, /) -> None:
-        self.__tree.insert(value, value)
+    def add(self, value: ValueT, /) -> bool:
+        tree = self.__tree
+        size = len(tree)
+        tree.insert(value, value)
+        return len(tree) > size
+
+    @override
+    def bisect_left(self, value: ValueT, /) -> int:
+        return self.__tree.bisect_left(value)
+
+    @override
+    def bisect_right(self, value: ValueT, /) -> int:
+        return self.__tree.bisect_right(value)
 
     @override
     def ceil(self, value: ValueT, /) -> ValueT:
@@ -93,6 +344,39 @@ class Set(HasCustomRepr, BaseSet[ValueT]):
             )
         return node.value
 
+    @override
+    def count_range(
+        self,
+        lo: ValueT | None = None,
+        hi: ValueT | None = None,
+        /,
+        *,
+        inclusive: tuple[bool, bool] = (True, False),
+    ) -> int:
+        return self.__tree.count_range(lo, hi, inclusive=inclusive)
+
+    @override
+    def cursor(self, value: ValueT | None = None, /) -> Cursor[ValueT, ValueT]:
+        result: Cursor[ValueT, ValueT] = Cursor(self)
+        if value is None:
+            result.first()
+        else:
+            result.seek(value)
+        return result
+
+    @override
+    def delete_range(
+        self,
+        lo: ValueT | None = None,
+        hi: ValueT | None = None,
+        /,
+        *,
+        inclusive: tuple[bool, bool] = (True, False),
+    ) -> Self:
+        return type(self)(
+            self.__tree.delete_range(lo, hi, inclusive=inclusive)
+        )
+
     @override
     def discard(self, value: ValueT, /) -> None:
         node = self.__tree.find(value)
@@ -111,6 +395,25 @@ class Set(HasCustomRepr, BaseSet[ValueT]):
     def from_iterable(self, value: Iterable[KeyT], /) -> Set[KeyT]:
         return Set(self.__tree.from_components(value))
 
+    @override
+    def irange(
+        self,
+        lo: ValueT | None = None,
+        hi: ValueT | None = None,
+        /,
+        *,
+        inclusive: tuple[bool, bool] = (True, False),
+        reverse: bool = False,
+    ) -> Iterator[ValueT]:
+        for node in self.__tree.irange(
+            lo, hi, inclusive=inclusive, reverse=reverse
+        ):
+            yield node.value
+
+    @override
+    def join(self, other: Self, /) -> Self:
+        return type(self)(self.__tree.join(other._tree))
+
     @override
     def next(self, value: ValueT, /) -> ValueT:
         node = self.__tree.find(value)
@@ -131,12 +434,47 @@ class Set(HasCustomRepr, BaseSet[ValueT]):
             raise ValueError('Corresponds to minimum')
         return node.value
 
+    @override
+    def rank(self, value: ValueT, /) -> int:
+        if self.__tree.find(value) is NIL:
+            raise ValueError(f'{value!r} is not in set')
+        return self.__tree.bisect_left(value)
+
     @override
     def remove(self, value: ValueT, /) -> None:
         node = self.__tree.pop(value)
         if node is NIL:
             raise ValueError(f'{value!r} is not in set')
 
+    @override
+    def split(self, value: ValueT, /) -> tuple[Self, Self]:
+        lower, upper = self.__tree.split(value)
+        return type(self)(lower), type(self)(upper)
+
+    @override
+    def view(
+        self,
+        lo: ValueT | None = None,
+        hi: ValueT | None = None,
+        /,
+        *,
+        inclusive: tuple[bool, bool] = (True, False),
+    ) -> Self:
+        return type(self)(
+            ranged.to_ranged(self.__tree, lo, hi, inclusive=inclusive)
+        )
+
+    @override
+    def _from_tree(self, tree: Tree[Any, ValueT], /) -> Self:
+        return type(self)(tree)
+
+    @override
+    def _is_similar(self, other: AbstractSet[ValueT], /) -> TypeIs[Self]:
+        return isinstance(other, Set) and _are_ordered_alike(
+            self.__tree,
+            other._tree,  # ruff: ignore[private-member-access]
+        )
+
     __slots__ = ('__tree',)
 
     def __contains__(self, value: ValueT, /) -> bool:
@@ -148,6 +486,9 @@ class Set(HasCustomRepr, BaseSet[ValueT]):
     def __init__(self, _tree: Tree[Any, ValueT], /) -> None:
         self.__tree = _tree
 
+    def __reduce__(self, /) -> tuple[type[Self], tuple[Tree[Any, ValueT]]]:
+        return type(self), (self.__tree,)
+
     __repr__ = generate_repr(__init__)
 
 
@@ -161,8 +502,22 @@ class KeyedSet(HasCustomRepr, Generic[KeyT, ValueT], BaseSet[ValueT]):
     def _tree(self, /) -> Tree[KeyT, ValueT]:
         return self.__tree
 
-    def add(self, value: ValueT, /) -> None:
-        self.__tree.insert(self._key(value), value)
+    @_tree.setter
+    @override
+    def _tree(self, value: Tree[KeyT, ValueT], /) -> None:
+        self.__tree = value
+
+    def add(self, value: ValueT, /) -> bool:
+        tree = self.__tree
+        size = len(tree)
+        tree.insert(self._key(value), value)
+        return len(tree) > size
+
+    def bisect_left(self, value: ValueT, /) -> int:
+        return self.__tree.bisect_left(self._key(value))
+
+    def bisect_right(self, value: ValueT, /) -> int:
+        return self.__tree.bisect_right(self._key(value))
 
     def ceil(self, value: ValueT, /) -> ValueT:
         node = self.__tree.supremum(self._key(value))
@@ -172,6 +527,45 @@ class KeyedSet(HasCustomRepr, Generic[KeyT, ValueT], BaseSet[ValueT]):
             )
         return node.value
 
+    def count_range(
+        self,
+        lo: ValueT | None = None,
+        hi: ValueT | None = None,
+        /,
+        *,
+        inclusive: tuple[bool, bool] = (True, False),
+    ) -> int:
+        return self.__tree.count_range(
+            None if lo is None else self._key(lo),
+            None if hi is None else self._key(hi),
+            inclusive=inclusive,
+        )
+
+    def cursor(self, value: ValueT | None = None, /) -> Cursor[KeyT, ValueT]:
+        result = Cursor(self, order=self._key)
+        if value is None:
+            result.first()
+        else:
+            result.seek(value)
+        return result
+
+    def delete_range(
+        self,
+        lo: ValueT | None = None,
+        hi: ValueT | None = None,
+        /,
+        *,
+        inclusive: tuple[bool, bool] = (True, False),
+    ) -> Self:
+        return type(self)(
+            self.__tree.delete_range(
+                None if lo is None else self._key(lo),
+                None if hi is None else self._key(hi),
+                inclusive=inclusive,
+            ),
+            self._key,
+        )
+
     def discard(self, value: ValueT, /) -> None:
         node = self.__tree.find(self._key(value))
         if node is NIL:
@@ -193,6 +587,26 @@ class KeyedSet(HasCustomRepr, Generic[KeyT, ValueT], BaseSet[ValueT]):
             self._key,
         )
 
+    def irange(
+        self,
+        lo: ValueT | None = None,
+        hi: ValueT | None = None,
+        /,
+        *,
+        inclusive: tuple[bool, bool] = (True, False),
+        reverse: bool = False,
+    ) -> Iterator[ValueT]:
+        for node in self.__tree.irange(
+            None if lo is None else self._key(lo),
+            None if hi is None else self._key(hi),
+            inclusive=inclusive,
+            reverse=reverse,
+        ):
+            yield node.value
+
+    def join(self, other: Self, /) -> Self:
+        return type(self)(self.__tree.join(other._tree), self._key)
+
     def next(self, value: ValueT, /) -> ValueT:
         key = self._key(value)
         node = self.__tree.find(key)
@@ -213,11 +627,52 @@ class KeyedSet(HasCustomRepr, Generic[KeyT, ValueT], BaseSet[ValueT]):
             raise ValueError('Corresponds to minimum')
         return node.value
 
+    def rank(self, value: ValueT, /) -> int:
+        key = self._key(value)
+        if self.__tree.find(key) is NIL:
+            raise ValueError(f'{value!r} is not in set')
+        return self.__tree.bisect_left(key)
+
     def remove(self, value: ValueT, /) -> None:
         node = self.__tree.pop(self._key(value))
         if node is NIL:
             raise ValueError(f'{value!r} is not in set')
 
+    def split(self, value: ValueT, /) -> tuple[Self, Self]:
+        lower, upper = self.__tree.split(self._key(value))
+        return type(self)(lower, self._key), type(self)(upper, self._key)
+
+    def view(
+        self,
+        lo: ValueT | None = None,
+        hi: ValueT | None = None,
+        /,
+        *,
+        inclusive: tuple[bool, bool] = (True, False),
+    ) -> Self:
+        return type(self)(
+            ranged.to_ranged(
+                self.__tree,
+                None if lo is None else self._key(lo),
+                None if hi is None else self._key(hi),
+                inclusive=inclusive,
+            ),
+            self._key,
+        )
+
+    def _from_tree(self, tree: Tree[KeyT, ValueT], /) -> Self:
+        return type(self)(tree, self._key)
+
+    def _is_similar(self, other: AbstractSet[ValueT], /) -> TypeIs[Self]:
+        return (
+            isinstance(other, KeyedSet)
+            and other.key == self._key
+            and _are_ordered_alike(
+                self.__tree,
+                other._tree,  # ruff: ignore[private-member-access]
+            )
+        )
+
     __slots__ = '__tree', '_key'
 
     def __contains__(self, value: ValueT, /) -> bool:
@@ -233,4 +688,53 @@ class KeyedSet(HasCustomRepr, Generic[KeyT, ValueT], BaseSet[ValueT]):
     ) -> None:
         self._key, self.__tree = key, _tree
 
+    def __reduce__(
+        self, /
+    ) -> tuple[type[Self], tuple[Tree[KeyT, ValueT], Order[ValueT, KeyT]]]:
+        return type(self), (self.__tree, self._key)
+
     __repr__ = generate_repr(__init__)
+
+
+_BaseSetT = TypeVar('_BaseSetT', bound=BaseSet[Any])
+
+
+def convert_set(cls: type[Tree[Any, Any]], set_: _BaseSetT, /) -> _BaseSetT:
+    return set_._from_tree(  # ruff: ignore[private-member-access]
+        to_backend(
+            set_._tree,  # ruff: ignore[private-member-access]
+            cls,
+        )
+    )
+
+
+def to_keyed_set(
+    cls: type[Tree[Any, Any]],
+    values: Iterable[ValueT],
+    key: Order[ValueT, KeyT],
+    /,
+    *,
+    reverse: bool,
+) -> KeyedSet[KeyT, ValueT]:
+    values = to_sequence(values)
+    tree = cls.from_components(map(key, values), values)
+    return KeyedSet(mirrored.Tree(tree) if reverse else tree, key)
+
+
+def to_set(
+    cls: type[Tree[Any, Any]], values: Iterable[ValueT], /, *, reverse: bool
+) -> Set[ValueT]:
+    tree = cls.from_components(values)
+    return Set(mirrored.Tree(tree) if reverse else tree)
+
+
+def _are_ordered_alike(
+    tree: Tree[Any, Any], other_tree: Tree[Any, Any], /
+) -> bool:
+    return isinstance(tree, mirrored.Tree) is isinstance(
+        other_tree, mirrored.Tree
+    )
+
+
+def _not_contains(container: AbstractSet[ValueT], value: ValueT, /) -> bool:
+    return value not in container
@@ -1,34 +1,71 @@
 from __future__ import annotations
 
-import copy
-from collections.abc import Iterable, Iterator
-from typing import cast, overload
+from collections.abc import Iterable, Iterator, Sequence
+from typing import overload
 
 from typing_extensions import Self, override
 
 from . import abcs, binary
 from .hints import KeyT, ValueT
 from .nil import NIL, Nil
-from .utils import to_unique_sorted_items, to_unique_sorted_values
+from .utils import to_sorted_components, to_unique_sorted_components
 
 Node = binary.Node
+_clone_node = binary._clone_node  # ruff: ignore[private-member-access]
+
+
+def _to_balanced_root(
+    keys: Sequence[KeyT], values: Sequence[ValueT], /
+) -> Node[KeyT, ValueT] | Nil:
+    if not keys:
+        return NIL
+    nodes = list(map(Node, keys, values))
+    # subtrees are formed by bisection of nodes' ranges level by level,
+    # so nodes are linked without recursion
+    starts, ends = [0], [len(nodes)]
+    while starts:
+        next_starts: list[int] = []
+        next_ends: list[int] = []
+        for start_index, end_index in zip(starts, ends, strict=True):
+            middle_index = (start_index + end_index) // 2
+            node = nodes[middle_index]
+            if middle_index > start_index:
+                node.left = nodes[(start_index + middle_index) // 2]
+                next_starts.append(start_index)
+                next_ends.append(middle_index)
+            if middle_index < end_index - 1:
+                node.right = nodes[(middle_index + 1 + end_index) // 2]
+                next_starts.append(middle_index + 1)
+                next_ends.append(end_index)
+        starts, ends = next_starts, next_ends
+    return nodes[len(nodes) // 2]
+
+
+def _to_extreme(
+    node: Node[KeyT, ValueT], /, *, reverse: bool
+) -> Node[KeyT, ValueT]:
+    # the first node of the subtree in the direction
+    if reverse:
+        while node.right is not NIL:
+            node = node.right
+    else:
+        while node.left is not NIL:
+            node = node.left
+    return node
 
 
 class Tree(abcs.Tree[KeyT, ValueT]):
     @overload
     @classmethod
     def from_components(
-        cls: type[Tree[KeyT, KeyT]],
-        keys: Iterable[KeyT],
-        values: None = ...,
-        /,
+        cls, keys: Iterable[KeyT], values: None = ..., /
     ) -> Tree[KeyT, KeyT]: ...
 
     @overload
     @classmethod
     def from_components(
         cls, keys: Iterable[KeyT], values: Iterable[ValueT], /
-    ) -> Self: ...
+    ) -> Tree[KeyT, ValueT]: ...
 
     @classmethod
     def from_components(
@@ -37,69 +74,78 @@ class Tree(abcs.Tree[KeyT, ValueT]):
         values: Iterable[ValueT] | None = None,
         /,
     ) -> Tree[KeyT, KeyT] | Tree[KeyT, ValueT]:
-        keys = list(keys)
-        if not keys:
-            return cls(NIL)
-        if values is None:
-            keys = to_unique_sorted_values(keys)
-
-            def to_simple_node(
-                start_index: int, end_index: int
-            ) -> Node[KeyT, KeyT]:
-                middle_index = (start_index + end_index) // 2
-                key = keys[middle_index]
-                return Node(
-                    key,
-                    key,
-                    left=(
-                        to_simple_node(start_index, middle_index)
-                        if middle_index > start_index
-                        else NIL
-                    ),
-                    right=(
-                        to_simple_node(middle_index + 1, end_index)
-                        if middle_index < end_index - 1
-                        else NIL
-                    ),
-                )
+        return cls._from_unique_sorted_components(
+            *to_unique_sorted_components(keys, values)
+        )
 
-            return cast(type[Tree[KeyT, KeyT]], cls)(
-                to_simple_node(0, len(keys))
-            )
-        items = to_unique_sorted_items(keys, tuple(values))
+    @overload
+    @classmethod
+    def from_sorted(
+        cls,
+        keys: Iterable[KeyT],
+        values: None = ...,
+        /,
+        *,
+        assume_unique: bool = ...,
+    ) -> Tree[KeyT, KeyT]: ...
 
-        def to_complex_node(
-            start_index: int, end_index: int, /
-        ) -> Node[KeyT, ValueT]:
-            middle_index = (start_index + end_index) // 2
-            key, value = items[middle_index]
-            return Node(
-                key,
-                value,
-                left=(
-                    to_complex_node(start_index, middle_index)
-                    if middle_index > start_index
-                    else NIL
-                ),
-                right=(
-                    to_complex_node(middle_index + 1, end_index)
-                    if middle_index < end_index - 1
-                    else NIL
-                ),
-            )
+    @overload
+    @classmethod
+    def from_sorted(
+        cls,
+        keys: Iterable[KeyT],
+        values: Iterable[ValueT],
+        /,
+        *,
+        assume_unique: bool = ...,
+    ) -> Tree[KeyT, ValueT]: ...
 
-        return cast(type[Tree[KeyT, ValueT]], cls)(
-            to_complex_node(0, len(items))
+    @classmethod
+    def from_sorted(
+        cls: type[Tree[KeyT, KeyT]] | type[Tree[KeyT, ValueT]],
+        keys: Iterable[KeyT],
+        values: Iterable[ValueT] | None = None,
+        /,
+        *,
+        assume_unique: bool = False,
+    ) -> Tree[KeyT, KeyT] | Tree[KeyT, ValueT]:
+        return cls._from_unique_sorted_components(
+            *to_sorted_components(keys, values, assume_unique=assume_unique)
         )
 
+    @classmethod
+    def _from_unique_sorted_components(
+        cls, keys: Sequence[KeyT], values: Sequence[ValueT], /
+    ) -> Self:
+        return cls(_to_balanced_root(keys, values), len(keys))
+
     @property
     @override
     def root(self, /) -> Node[KeyT, ValueT] | Nil:
         return self._root
 
+    @property
+    @override
+    def version(self, /) -> int:
+        return self._version
+
     @override
     def clear(self, /) -> None:
-        self._root = NIL
+        self._root, self._size = NIL, 0
+        self._version += 1
+
+    @override
+    def count_range(
+        self,
+        lo: KeyT | None = None,
+        hi: KeyT | None = None,
+        /,
+        *,
+        inclusive: tuple[bool, bool] = (True, False),
+    ) -> int:
+        # nodes do not store sizes of subtrees,
+        # so counting takes time linear in the number of nodes in the range
+        return sum(1 for _ in self.irange(lo, hi, inclusive=inclusive))
 
     @override
     def find(self, key: KeyT, /) -> Node[KeyT, ValueT] | Nil:
@@ -113,6 +159,8 @@ class Tree(abcs.Tree[KeyT, ValueT]):
     def insert(self, key: KeyT, value: ValueT, /) -> Node[KeyT, ValueT]:
         if self._root is NIL:
             node = self._root = Node(key, value)
+            self._size += 1
+            self._version += 1
             return node
         self._splay(key)
         if key < self._root.key:
@@ -120,13 +168,27 @@ class Tree(abcs.Tree[KeyT, ValueT]):
                 NIL,
                 Node(key, value, left=self._root.left, right=self._root),
             )
+            self._size += 1
         elif self._root.key < key:
             self._root.right, self._root = (
                 NIL,
                 Node(key, value, left=self._root, right=self._root.right),
             )
+            self._size += 1
         return self._root
 
+    @override
+    def irange(
+        self,
+        lo: KeyT | None = None,
+        hi: KeyT | None = None,
+        /,
+        *,
+        inclusive: tuple[bool, bool] = (True, False),
+        reverse: bool = False,
+    ) -> Iterator[Node[KeyT, ValueT]]:
+        return self._iterate(lo, hi, inclusive=inclusive, reverse=reverse)
+
     @override
     def max(self, /) -> Node[KeyT, ValueT] | Nil:
         node = self._root
@@ -225,9 +287,69 @@ class Tree(abcs.Tree[KeyT, ValueT]):
         node.left, replacement.right = replacement.right, node
         return replacement
 
+    def _iterate(
+        self,
+        lo: KeyT | None,
+        hi: KeyT | None,
+        /,
+        *,
+        inclusive: tuple[bool, bool],
+        reverse: bool,
+    ) -> Iterator[Node[KeyT, ValueT]]:
+        # tree can be implicitly changed during iteration
+        # (e.g. by simple lookup),
+        # so after that nodes left to visit are found anew
+        # by the last visited key instead of being collected at once
+        is_lo_inclusive, is_hi_inclusive = inclusive
+        start, is_start_inclusive, end, is_end_inclusive = (
+            (hi, is_hi_inclusive, lo, is_lo_inclusive)
+            if reverse
+            else (lo, is_lo_inclusive, hi, is_hi_inclusive)
+        )
+        queue = self._to_pending(
+            start, is_inclusive=is_start_inclusive, reverse=reverse
+        )
+        # long descents are not stored, instead their last node,
+        # which is the next one to visit, gets splayed to the root,
+        # so pending nodes take logarithmic memory
+        # while visiting k nodes takes amortized O(log n + k) time
+        limit = 2 * self._size.bit_length()
+        version = self._version
+        while queue:
+            node = queue.pop()
+            if end is not None and (
+                (node.key < end if is_end_inclusive else not end < node.key)
+                if reverse
+                else (
+                    end < node.key if is_end_inclusive else not node.key < end
+                )
+            ):
+                return
+            yield node
+            if self._version != version:
+                queue = self._to_pending(
+                    node.key, is_inclusive=False, reverse=reverse
+                )
+                limit = 2 * self._size.bit_length()
+                version = self._version
+                continue
+            child = node.left if reverse else node.right
+            while child is not NIL:
+                if len(queue) >= limit:
+                    self._splay(_to_extreme(child, reverse=reverse).key)
+                    root = self._root
+                    assert root is not NIL
+                    queue = [root]
+                    version = self._version
+                    break
+                queue.append(child)
+                child = child.right if reverse else child.left
+
     def _remove_root(self, /) -> None:
         root = self._root
         assert root is not NIL
+        self._size -= 1
+        self._version += 1
         if root.left is NIL:
             self._root = root.right
         else:
@@ -236,6 +358,34 @@ class Tree(abcs.Tree[KeyT, ValueT]):
             self._splay(root.key)
             self._root.right = right_root_child
 
+    def _to_pending(
+        self, key: KeyT | None, /, *, is_inclusive: bool, reverse: bool
+    ) -> list[Node[KeyT, ValueT]]:
+        # the first node after the key in the direction gets splayed,
+        # so it is the root which is the only pending ancestor,
+        # and search for it takes amortized logarithmic time
+        root = self._root
+        if root is NIL:
+            return []
+        if key is not None:
+            self._splay(key)
+            root = self._root
+            assert root is not NIL
+            if (
+                (not key < root.key if is_inclusive else root.key < key)
+                if reverse
+                else (not root.key < key if is_inclusive else key < root.key)
+            ):
+                return [root]
+            child = root.left if reverse else root.right
+            if child is NIL:
+                return []
+            root = child
+        self._splay(_to_extreme(root, reverse=reverse).key)
+        root = self._root
+        assert root is not NIL
+        return [root]
+
     def _splay(self, key: KeyT, /) -> None:
         next_root = self._root
         next_root_left_child = next_root_right_child = self._header
@@ -267,34 +417,33 @@ class Tree(abcs.Tree[KeyT, ValueT]):
         )
         next_root.left, next_root.right = self._header.right, self._header.left
         self._root = next_root
+        self._version += 1
 
     _header: Node[KeyT, ValueT]
     _root: Node[KeyT, ValueT] | Nil
+    _size: int
+    _version: int
 
-    __slots__ = '_header', '_root'
+    __slots__ = '_header', '_root', '_size', '_version'
 
     @override
     def __copy__(self, /) -> Self:
-        return type(self)(copy.deepcopy(self._root))
+        return type(self)(
+            abcs.clone_subtree(self._root, _clone_node), self._size
+        )
 
-    def __init__(self, root: Node[KeyT, ValueT] | Nil, /) -> None:
-        self._root = root
+    def __init__(self, root: Node[KeyT, ValueT] | Nil, size: int, /) -> None:
+        self._root, self._size, self._version = root, size, 0
         self._header = Node(NotImplemented, NotImplemented)
 
+    @override
+    def __len__(self, /) -> int:
+        return self._size
+
+    @override
     def __iter__(self, /) -> Iterator[Node[KeyT, ValueT]]:
-        # we are collecting all values at once
-        # because tree can be implicitly changed during iteration
-        # (e.g. by simple lookup)
-        # and cause infinite loops
-        return cast(
-            Iterator[Node[KeyT, ValueT]], iter(list(super().__iter__()))
-        )
+        return self._iterate(None, None, inclusive=(True, True), reverse=False)
 
+    @override
     def __reversed__(self, /) -> Iterator[Node[KeyT, ValueT]]:
-        # we are collecting all values at once
-        # because tree can be implicitly changed during iteration
-        # (e.g. by simple lookup)
-        # and cause infinite loops
-        return cast(
-            Iterator[Node[KeyT, ValueT]], iter(list(super().__reversed__()))
-        )
+        return self._iterate(None, None, inclusive=(True, True), reverse=True)
@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import sys
+from collections import Counter
+from typing import Any, cast
+
+from reprit.base import generate_repr
+
+from . import array_avl, avl, keyed, mirrored, ranged, red_black
+from .abcs import HasCustomRepr, Node, Tree
+from .hints import KeyT, ValueT
+from .nil import NIL, Nil
+
+
+class Stats(HasCustomRepr):
+    """Shape & memory footprint of a tree."""
+
+    @property
+    def bytes_per_node(self, /) -> float:
+        return self.total_bytes / self.size if self.size else 0.0
+
+    @property
+    def total_bytes(self, /) -> int:
+        return self.item_bytes + self.node_bytes + self.weakref_bytes
+
+    __slots__ = (
+        'balance_factors',
+        'colours',
+        'depths',
+        'height',
+        'item_bytes',
+        'node_bytes',
+        'size',
+        'weakref_bytes',
+    )
+
+    def __init__(
+        self,
+        size: int,
+        height: int,
+        depths: dict[int, int],
+        /,
+        *,
+        balance_factors: dict[int, int],
+        colours: dict[str, int],
+        item_bytes: int,
+        node_bytes: int,
+        weakref_bytes: int,
+    ) -> None:
+        self.size, self.height, self.depths = size, height, depths
+        self.balance_factors, self.colours = balance_factors, colours
+        self.item_bytes, self.node_bytes, self.weakref_bytes = (
+            item_bytes,
+            node_bytes,
+            weakref_bytes,
+        )
+
+    __repr__ = generate_repr(__init__)
+
+
+def to_stats(tree: Tree[KeyT, ValueT], /) -> Stats:
+    """
+    Collects shape & memory footprint of given tree by an iterative walk.
+
+    Memory of keys & values is measured shallowly
+    counting each object once.
+    """
+    # adapters delegate to the underlying tree
+    while isinstance(tree, keyed.Tree | mirrored.Tree | ranged.Tree):
+        tree = cast('Tree[KeyT, ValueT]', tree.tree)
+    if isinstance(tree, array_avl.Tree):
+        return _to_array_avl_stats(tree.storage)
+    balance_factors: Counter[int] = Counter()
+    colours: Counter[str] = Counter()
+    depths: Counter[int] = Counter()
+    items: dict[int, Any] = {}
+    node_bytes = 0
+    queue: list[tuple[Node[KeyT, ValueT] | Nil, int]] = [(tree.root, 0)]
+    while queue:
+        node, depth = queue.pop()
+        if node is NIL:
+            continue
+        depths[depth] += 1
+        node_bytes += sys.getsizeof(node)
+        items.setdefault(id(node.key), node.key)
+        items.setdefault(id(node.value), node.value)
+        if isinstance(node, avl.Node):
+            balance_factors[node.balance_factor] += 1
+        elif isinstance(node, red_black.Node):
+            colours['black' if node.is_black else 'red'] += 1
+        queue.extend(((node.left, depth + 1), (node.right, depth + 1)))
+    return Stats(
+        depths.total(),
+        max(depths, default=-1),
+        dict(sorted(depths.items())),
+        balance_factors=dict(sorted(balance_factors.items())),
+        colours=dict(sorted(colours.items())),
+        item_bytes=sum(map(sys.getsizeof, items.values())),
+        node_bytes=node_bytes,
+        weakref_bytes=0,
+    )
+
+
+def _to_array_avl_stats(storage: array_avl.Storage[Any, Any], /) -> Stats:
+    balance_factors: Counter[int] = Counter()
+    depths: Counter[int] = Counter()
+    items: dict[int, Any] = {}
+    heights, lefts, rights = storage.heights, storage.lefts, storage.rights
+    keys, values = storage.keys, storage.values
+    queue = [(storage.root, 0)]
+    while queue:
+        index, depth = queue.pop()
+        if index == array_avl.NIL_INDEX:
+            continue
+        depths[depth] += 1
+        items.setdefault(id(keys[index]), keys[index])
+        items.setdefault(id(values[index]), values[index])
+        balance_factors[heights[lefts[index]] - heights[rights[index]]] += 1
+        queue.extend(((lefts[index], depth + 1), (rights[index], depth + 1)))
+    # weak references to alive handles
+    references: dict[int, Any] = vars(storage.handles)['data']
+    return Stats(
+        depths.total(),
+        max(depths, default=-1),
+        dict(sorted(depths.items())),
+        balance_factors=dict(sorted(balance_factors.items())),
+        colours={},
+        item_bytes=sum(map(sys.getsizeof, items.values())),
+        # nodes are columns & their spare capacity
+        node_bytes=sum(
+            map(
+                sys.getsizeof,
+                (heights, keys, lefts, rights, storage.sizes, values),
+            )
+        ),
+        weakref_bytes=sys.getsizeof(references)
+        + sum(map(sys.getsizeof, references.values()))
+        + sum(map(sys.getsizeof, storage.handles.values())),
+    )
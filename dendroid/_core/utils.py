@@ -1,33 +1,10 @@
-import weakref
 from collections import deque
 from collections.abc import Iterable, Sequence
-from itertools import count, groupby
-from typing import Any, overload
-
-from typing_extensions import Self
+from itertools import count, islice
+from operator import itemgetter, lt
+from typing import Any
 
 from .hints import Item, KeyT, ValueT
-from .nil import NIL, Nil
-
-
-class AntisymmetricKeyIndex:
-    __slots__ = 'index', 'key'
-
-    def __init__(self, key_index: tuple[KeyT, int], /) -> None:
-        self.key, self.index = key_index
-
-    @overload
-    def __eq__(self, other: Self, /) -> bool: ...
-
-    @overload
-    def __eq__(self, other: Any, /) -> Any: ...
-
-    def __eq__(self, other: Any, /) -> Any:
-        return (
-            are_keys_equal(self.key, other.key)
-            if isinstance(other, AntisymmetricKeyIndex)
-            else NotImplemented
-        )
 
 
 def are_keys_equal(left: KeyT, right: KeyT, /) -> bool:
@@ -50,45 +27,155 @@ def capacity(iterable: Iterable[Any], /) -> int:
     return next(counter)
 
 
+def is_size_negligible(size: int, other_size: int, /) -> bool:
+    """
+    Checks if processing collection with given size element by element
+    is cheaper than joining it with a collection of other size.
+
+    >>> is_size_negligible(1, 100)
+    True
+    >>> is_size_negligible(100, 100)
+    False
+    """
+    return size * 8 < other_size
+
+
 def to_balanced_tree_height(size: int, /) -> int:
     return size.bit_length() - 1
 
 
-def dereference_maybe(
-    maybe_reference: weakref.ref[ValueT] | Nil, /
-) -> ValueT | Nil:
-    if maybe_reference is not NIL:
-        result = maybe_reference()
-        assert result is not None
-        return result
-    return maybe_reference
+def to_sorted_components(
+    keys: Iterable[KeyT],
+    values: Iterable[ValueT] | None,
+    /,
+    *,
+    assume_unique: bool,
+) -> tuple[Sequence[KeyT], Sequence[Any]]:
+    """
+    Returns already sorted keys without duplicates along with their values
+    (keys themselves if values are not given) in linear time.
+
+    >>> to_sorted_components([1, 1, 2, 3], 'abcd', assume_unique=False)
+    ([1, 2, 3], ['b', 'c', 'd'])
+    >>> to_sorted_components([2, 1], None, assume_unique=False)
+    Traceback (most recent call last):
+        ...
+    ValueError: Keys should be sorted.
+    """
+    keys = to_sequence(keys)
+    if values is None:
+        if assume_unique:
+            return keys, keys
+        if not is_non_decreasing(keys):
+            raise ValueError('Keys should be sorted.')
+        keys = deduplicate_sorted_values(keys)
+        return keys, keys
+    values = to_sequence(values)
+    if len(keys) != len(values):
+        raise ValueError('Keys & values should have the same length.')
+    if assume_unique:
+        return keys, values
+    if not is_non_decreasing(keys):
+        raise ValueError('Keys should be sorted.')
+    return deduplicate_sorted_components(keys, values)
+
+
+def to_unique_sorted_components(
+    keys: Iterable[KeyT], values: Iterable[ValueT] | None, /
+) -> tuple[Sequence[KeyT], Sequence[Any]]:
+    """
+    Returns keys sorted without duplicates along with their values
+    (keys themselves if values are not given)
+    preferring the last value for duplicate keys.
+
+    Sorting is skipped for already sorted keys.
+
+    >>> to_unique_sorted_components([3, 1, 2, 1], 'abcd')
+    ([1, 2, 3], ['d', 'c', 'a'])
+    >>> to_unique_sorted_components([3, 1, 2, 1], None)
+    ([1, 2, 3], [1, 2, 3])
+    """
+    if values is None:
+        result = to_unique_sorted_values(keys)
+        return result, result
+    keys = to_sequence(keys)
+    values = to_sequence(values)
+    if not is_non_decreasing(keys):
+        # sorting of indices is stable & does not allocate an item per key
+        order = sorted(range(len(keys)), key=keys.__getitem__)
+        keys = list(map(keys.__getitem__, order))
+        values = list(map(values.__getitem__, order))
+        del order
+    return deduplicate_sorted_components(keys, values)
+
+
+def to_unique_sorted_values(values: Iterable[ValueT], /) -> Sequence[ValueT]:
+    """
+    Returns values sorted without duplicates
+    preferring the first one of duplicates.
 
+    Sorting is skipped for already sorted values.
 
-def maybe_weakref(
-    object_: ValueT | Nil, /
-) -> weakref.ReferenceType[ValueT] | Nil:
-    return object_ if object_ is NIL else weakref.ref(object_)
+    >>> to_unique_sorted_values([3, 1, 2, 1])
+    [1, 2, 3]
+    """
+    values = to_sequence(values)
+    return deduplicate_sorted_values(
+        values if is_non_decreasing(values) else sorted(values)
+    )
 
 
-def to_unique_sorted_items(
+def deduplicate_sorted_components(
     keys: Sequence[KeyT], values: Sequence[ValueT], /
-) -> Sequence[Item[Any, ValueT]]:
-    return [
-        (index_key.key, values[-index_key.index])
-        for index_key, _ in groupby(
-            sorted([(key, -index) for index, key in enumerate(keys)]),
-            key=AntisymmetricKeyIndex,
-        )
-    ]
+) -> tuple[Sequence[KeyT], Sequence[ValueT]]:
+    if is_strictly_increasing(keys):
+        return keys, values
+    result_keys, result_values = [keys[0]], [values[0]]
+    for key, value in zip(
+        islice(keys, 1, None), islice(values, 1, None), strict=False
+    ):
+        if result_keys[-1] < key:
+            result_keys.append(key)
+            result_values.append(value)
+        else:
+            result_keys[-1], result_values[-1] = key, value
+    return result_keys, result_values
 
 
-def to_unique_sorted_values(values: list[ValueT], /) -> list[ValueT]:
-    values.sort()
-    return [value for value, _ in groupby(values)]
+def deduplicate_sorted_values(values: Sequence[ValueT], /) -> Sequence[ValueT]:
+    if is_strictly_increasing(values):
+        return values
+    result = [values[0]]
+    for value in islice(values, 1, None):
+        if result[-1] < value:
+            result.append(value)
+    return result
+
+
+def is_non_decreasing(values: Sequence[Any], /) -> bool:
+    return not any(map(lt, islice(values, 1, None), values))
+
+
+def is_strictly_increasing(values: Sequence[Any], /) -> bool:
+    return all(map(lt, values, islice(values, 1, None)))
 
 
 def split_items(
-    items: Sequence[tuple[KeyT, ValueT]], /
+    items: Iterable[Item[KeyT, ValueT]], /
 ) -> tuple[Sequence[KeyT], Sequence[ValueT]]:
-    keys, values = tuple(zip(*items, strict=False)) if items else ((), ())
+    if isinstance(items, Sequence):
+        # columns are gathered at C level without intermediate tuples
+        return (
+            list(map(itemgetter(0), items)),
+            list(map(itemgetter(1), items)),
+        )
+    keys: list[KeyT] = []
+    values: list[ValueT] = []
+    for key, value in items:
+        keys.append(key)
+        values.append(value)
     return keys, values
+
+
+def to_sequence(iterable: Iterable[ValueT], /) -> Sequence[ValueT]:
+    return iterable if isinstance(iterable, Sequence) else list(iterable)
@@ -1,12 +1,13 @@
 from __future__ import annotations
 
 from collections.abc import Collection, Iterable, Iterator, Set
+from copy import copy
 from typing import Any
 
 from reprit.base import generate_repr
 from typing_extensions import Self, override
 
-from . import abcs
+from . import abcs, keyed, mirrored
 from .hints import Item, KeyT, ValueT
 from .nil import NIL
 from .utils import split_items
@@ -18,8 +19,33 @@ class ItemsView(abcs.HasCustomRepr, abcs.AbstractSet[Item[KeyT, ValueT]]):
         keys, values = split_items(list(value))
         return type(self)(self._tree.from_components(keys, values))
 
+    def irange(
+        self,
+        lo: KeyT | None = None,
+        hi: KeyT | None = None,
+        /,
+        *,
+        inclusive: tuple[bool, bool] = (True, False),
+        reverse: bool = False,
+    ) -> Iterator[Item[KeyT, ValueT]]:
+        for node in self._tree.irange(
+            lo, hi, inclusive=inclusive, reverse=reverse
+        ):
+            yield node.item
+
     __slots__ = ('_tree',)
 
+    @override
+    def __and__(self, other: abcs.AbstractSet[Item[KeyT, ValueT]], /) -> Self:
+        if not isinstance(other, ItemsView) or len(self) <= len(other):
+            return super().__and__(other)
+        items = []
+        for other_node in other._tree:
+            node = self._tree.find(other_node.key)
+            if node is not NIL and node.value == other_node.value:
+                items.append(node.item)
+        return self.from_iterable(items)
+
     @override
     def __contains__(self, item: Item[KeyT, ValueT], /) -> bool:
         key, value = item
@@ -46,12 +72,47 @@ class ItemsView(abcs.HasCustomRepr, abcs.AbstractSet[Item[KeyT, ValueT]]):
 
 
 class KeysView(abcs.HasCustomRepr, abcs.AbstractSet[KeyT]):
+    def count_range(
+        self,
+        lo: KeyT | None = None,
+        hi: KeyT | None = None,
+        /,
+        *,
+        inclusive: tuple[bool, bool] = (True, False),
+    ) -> int:
+        return self._tree.count_range(lo, hi, inclusive=inclusive)
+
     @override
     def from_iterable(self, _value: Iterable[KeyT], /) -> KeysView[KeyT]:
         return KeysView(self._tree.from_components(_value))
 
+    def irange(
+        self,
+        lo: KeyT | None = None,
+        hi: KeyT | None = None,
+        /,
+        *,
+        inclusive: tuple[bool, bool] = (True, False),
+        reverse: bool = False,
+    ) -> Iterator[KeyT]:
+        for node in self._tree.irange(
+            lo, hi, inclusive=inclusive, reverse=reverse
+        ):
+            yield node.key
+
     __slots__ = ('_tree',)
 
+    @override
+    def __and__(self, other: abcs.AbstractSet[KeyT], /) -> Self:
+        if not isinstance(other, KeysView) or len(self) <= len(other):
+            return super().__and__(other)
+        keys = []
+        for other_node in other._tree:
+            node = self._tree.find(other_node.key)
+            if node is not NIL:
+                keys.append(node.key)
+        return type(self)(self._tree.from_components(keys))
+
     @override
     def __contains__(self, key: KeyT, /) -> bool:
         return self._tree.find(key) is not NIL
@@ -74,6 +135,15 @@ class KeysView(abcs.HasCustomRepr, abcs.AbstractSet[KeyT]):
         for node in reversed(self._tree):
             yield node.key
 
+    @override
+    def __xor__(self, other: abcs.AbstractSet[KeyT], /) -> Self:
+        return (
+            type(self)(copy(self._tree).symmetric_subtract(copy(other._tree)))
+            if isinstance(other, KeysView)
+            and _are_adapted_alike(self._tree, other._tree)
+            else super().__xor__(other)
+        )
+
 
 class ValuesView(abcs.HasCustomRepr, abcs.Collection[ValueT]):
     __slots__ = ('_tree',)
@@ -101,6 +171,25 @@ class ValuesView(abcs.HasCustomRepr, abcs.Collection[ValueT]):
             yield node.value
 
 
+def _are_adapted_alike(
+    tree: abcs.Tree[Any, Any], other_tree: abcs.Tree[Any, Any], /
+) -> bool:
+    # nodes can be combined only if both trees order keys the same way
+    while True:
+        if isinstance(tree, keyed.Tree):
+            if not (
+                isinstance(other_tree, keyed.Tree)
+                and other_tree.key == tree.key
+            ):
+                return False
+        elif isinstance(tree, mirrored.Tree):
+            if not isinstance(other_tree, mirrored.Tree):
+                return False
+        else:
+            return not isinstance(other_tree, keyed.Tree | mirrored.Tree)
+        tree, other_tree = tree.tree, other_tree.tree
+
+
 Set.register(ItemsView)  # pyright: ignore[reportAttributeAccessIssue]
 Set.register(KeysView)  # pyright: ignore[reportAttributeAccessIssue]
 Collection.register(ItemsView)  # pyright: ignore[reportAttributeAccessIssue]
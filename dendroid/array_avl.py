@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+from collections.abc import Iterable as _Iterable
+from typing import Any as _Any, overload as _overload
+
+from ._core.array_avl import Tree as _Tree
+from ._core.hints import (
+    Item as _Item,
+    KeyT as _KeyT,
+    Order as _Order,
+    ValueT as _ValueT,
+)
+from ._core.maps import (
+    Map as _Map,
+    convert_map as _convert_map,
+    to_map as _to_map,
+)
+from ._core.sets import (
+    KeyedSet as _KeyedSet,
+    Set as _Set,
+    convert_set as _convert_set,
+    to_keyed_set as _to_keyed_set,
+    to_set as _to_set,
+)
+from ._core.utils import split_items as _split_items
+
+
+def map_(
+    *items: _Item[_KeyT, _ValueT],
+    key: _Order[_KeyT, _Any] | None = None,
+    reverse: bool = False,
+) -> _Map[_KeyT, _ValueT]:
+    return map_from_iterable(items, key=key, reverse=reverse)
+
+
+def map_from_columns(
+    keys: _Iterable[_KeyT],
+    values: _Iterable[_ValueT],
+    /,
+    *,
+    key: _Order[_KeyT, _Any] | None = None,
+    reverse: bool = False,
+) -> _Map[_KeyT, _ValueT]:
+    return _to_map(_Tree, keys, values, key=key, reverse=reverse)
+
+
+def map_from_iterable(
+    items: _Iterable[_Item[_KeyT, _ValueT]],
+    /,
+    *,
+    key: _Order[_KeyT, _Any] | None = None,
+    reverse: bool = False,
+) -> _Map[_KeyT, _ValueT]:
+    return _to_map(_Tree, *_split_items(items), key=key, reverse=reverse)
+
+
+def map_from_map(map_: _Map[_KeyT, _ValueT], /) -> _Map[_KeyT, _ValueT]:
+    return _convert_map(_Tree, map_)
+
+
+def map_from_sorted(
+    keys: _Iterable[_KeyT],
+    values: _Iterable[_ValueT],
+    /,
+    *,
+    assume_unique: bool = False,
+) -> _Map[_KeyT, _ValueT]:
+    return _Map(_Tree.from_sorted(keys, values, assume_unique=assume_unique))
+
+
+@_overload
+def set_(
+    *values: _ValueT, key: None = ..., reverse: bool = ...
+) -> _Set[_ValueT]: ...
+
+
+@_overload
+def set_(
+    *values: _ValueT, key: _Order[_ValueT, _KeyT], reverse: bool = ...
+) -> _KeyedSet[_KeyT, _ValueT]: ...
+
+
+def set_(
+    *values: _ValueT,
+    key: _Order[_ValueT, _KeyT] | None = None,
+    reverse: bool = False,
+) -> _KeyedSet[_KeyT, _ValueT] | _Set[_ValueT]:
+    return set_from_iterable(values, key=key, reverse=reverse)
+
+
+@_overload
+def set_from_iterable(
+    values: _Iterable[_ValueT], /, *, key: None = ..., reverse: bool = ...
+) -> _Set[_ValueT]: ...
+
+
+@_overload
+def set_from_iterable(
+    values: _Iterable[_ValueT],
+    /,
+    *,
+    key: _Order[_ValueT, _KeyT],
+    reverse: bool = ...,
+) -> _KeyedSet[_KeyT, _ValueT]: ...
+
+
+def set_from_iterable(
+    values: _Iterable[_ValueT],
+    /,
+    *,
+    key: _Order[_ValueT, _KeyT] | None = None,
+    reverse: bool = False,
+) -> _KeyedSet[_KeyT, _ValueT] | _Set[_ValueT]:
+    return (
+        _to_set(_Tree, values, reverse=reverse)
+        if key is None
+        else _to_keyed_set(_Tree, values, key, reverse=reverse)
+    )
+
+
+@_overload
+def set_from_set(set_: _Set[_ValueT], /) -> _Set[_ValueT]: ...
+
+
+@_overload
+def set_from_set(
+    set_: _KeyedSet[_KeyT, _ValueT], /
+) -> _KeyedSet[_KeyT, _ValueT]: ...
+
+
+def set_from_set(
+    set_: _KeyedSet[_KeyT, _ValueT] | _Set[_ValueT], /
+) -> _KeyedSet[_KeyT, _ValueT] | _Set[_ValueT]:
+    return _convert_set(_Tree, set_)
+
+
+def set_from_sorted(
+    values: _Iterable[_ValueT], /, *, assume_unique: bool = False
+) -> _Set[_ValueT]:
+    return _Set(_Tree.from_sorted(values, assume_unique=assume_unique))
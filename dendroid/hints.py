@@ -1,10 +1,18 @@
 from typing import TypeAlias as _TypeAlias
 
-from ._core import hints as _hints, maps as _maps, sets as _sets
+from ._core import (
+    hints as _hints,
+    instrumentation as _instrumentation,
+    maps as _maps,
+    sets as _sets,
+    stats as _stats,
+)
 from ._core.hints import KeyT as _KeyT, ValueT as _ValueT
 
+Counters: _TypeAlias = _instrumentation.Counters
 Item: _TypeAlias = _hints.Item[_KeyT, _ValueT]
 Map: _TypeAlias = _maps.Map[_KeyT, _ValueT]
 Order: _TypeAlias = _hints.Order[_ValueT, _KeyT]
 KeyedSet: _TypeAlias = _sets.KeyedSet[_KeyT, _ValueT]
 Set: _TypeAlias = _sets.Set[_ValueT]
+Stats: _TypeAlias = _stats.Stats
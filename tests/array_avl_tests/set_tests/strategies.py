@@ -0,0 +1,93 @@
+from functools import partial
+
+from hypothesis import strategies as st
+
+from dendroid import array_avl
+from tests.hints import KeyT, ValueT
+from tests.strategies import (
+    non_empty_value_sequence_with_order_strategy,
+    to_value_sequences_with_order_strategy,
+    value_sequence_with_order_strategy,
+    value_with_order_strategy_strategy,
+)
+from tests.utils import (
+    BaseSet,
+    ValueSequencePairWithOrder,
+    ValueSequenceWithOrder,
+    split_values_by_pivot,
+)
+
+
+def to_set(
+    values_list_with_order: ValueSequenceWithOrder[ValueT, KeyT], /
+) -> BaseSet[ValueT]:
+    values_list, order = values_list_with_order
+    return array_avl.set_(*values_list, key=order)
+
+
+set_strategy = st.builds(to_set, value_sequence_with_order_strategy)
+non_empty_set_strategy = st.builds(
+    to_set, non_empty_value_sequence_with_order_strategy
+)
+
+
+def to_set_with_value(
+    values_list_with_order: ValueSequenceWithOrder[ValueT, KeyT], /
+) -> tuple[BaseSet[ValueT], ValueT]:
+    values_list, order = values_list_with_order
+    *rest_values_list, value = values_list
+    return (array_avl.set_(*rest_values_list, key=order), value)
+
+
+set_with_value_strategy = st.builds(
+    to_set_with_value, non_empty_value_sequence_with_order_strategy
+)
+
+
+def to_ordered_set_pair(
+    values_list_with_order: ValueSequenceWithOrder[ValueT, KeyT], /
+) -> tuple[BaseSet[ValueT], BaseSet[ValueT]]:
+    lower_values, upper_values, order = split_values_by_pivot(
+        values_list_with_order
+    )
+    return (
+        array_avl.set_(*lower_values, key=order),
+        array_avl.set_(*upper_values, key=order),
+    )
+
+
+ordered_set_pair_strategy = st.builds(
+    to_ordered_set_pair, non_empty_value_sequence_with_order_strategy
+)
+
+
+def to_non_empty_set_with_their_value_strategy(
+    set_: BaseSet[ValueT], /
+) -> st.SearchStrategy[tuple[BaseSet[ValueT], ValueT]]:
+    return st.tuples(st.just(set_), st.sampled_from(list(set_)))
+
+
+non_empty_set_with_their_value_strategy = non_empty_set_strategy.flatmap(
+    to_non_empty_set_with_their_value_strategy
+)
+
+
+def to_set_pair(
+    value_sequences_pair_with_order: ValueSequencePairWithOrder[ValueT, KeyT],
+    /,
+) -> tuple[BaseSet[ValueT], BaseSet[ValueT]]:
+    (first_values_list, second_values_list), order = (
+        value_sequences_pair_with_order
+    )
+    return (
+        array_avl.set_(*first_values_list, key=order),
+        array_avl.set_(*second_values_list, key=order),
+    )
+
+
+set_pair_strategy = st.builds(
+    to_set_pair,
+    value_with_order_strategy_strategy.flatmap(
+        partial(to_value_sequences_with_order_strategy, sizes=[(0, None)] * 2)
+    ),
+)
@@ -0,0 +1,25 @@
+from hypothesis import given
+
+from tests.hints import ValueT
+from tests.utils import (
+    ArrayAvlTree,
+    BaseSet,
+    are_balance_factors_normalized,
+    are_nodes_heights_correct,
+    are_nodes_sizes_correct,
+)
+
+from . import strategies
+
+
+@given(strategies.set_with_value_strategy)
+def test_properties(set_with_value: tuple[BaseSet[ValueT], ValueT]) -> None:
+    set_, value = set_with_value
+
+    set_.discard(value)
+
+    tree = set_._tree
+    assert isinstance(tree, ArrayAvlTree)
+    assert are_nodes_sizes_correct(tree)
+    assert are_nodes_heights_correct(tree)
+    assert are_balance_factors_normalized(tree)
@@ -0,0 +1,27 @@
+from hypothesis import given
+
+from tests.hints import ValueT
+from tests.utils import (
+    ArrayAvlTree,
+    BaseSet,
+    are_balance_factors_normalized,
+    are_nodes_heights_correct,
+    are_nodes_sizes_correct,
+)
+
+from . import strategies
+
+
+@given(strategies.set_pair_strategy)
+def test_properties(
+    sets_pair: tuple[BaseSet[ValueT], BaseSet[ValueT]],
+) -> None:
+    left_set, right_set = sets_pair
+
+    left_set |= right_set
+
+    left_tree = left_set._tree
+    assert isinstance(left_tree, ArrayAvlTree)
+    assert are_nodes_sizes_correct(left_tree)
+    assert are_nodes_heights_correct(left_tree)
+    assert are_balance_factors_normalized(left_tree)
@@ -0,0 +1,31 @@
+from hypothesis import given
+
+from dendroid import array_avl, avl
+from tests import strategies
+from tests.hints import KeyT, ValueT
+from tests.utils import BaseSet, ValueSequenceWithOrder
+
+
+@given(strategies.value_sequence_with_order_strategy)
+def test_counters(
+    values_with_order: ValueSequenceWithOrder[ValueT, KeyT],
+) -> None:
+    values, order = values_with_order
+    array_avl_set: BaseSet[ValueT] = array_avl.set_(key=order)
+    avl_set: BaseSet[ValueT] = avl.set_(key=order)
+    array_avl_counters = array_avl_set.instrument()
+    avl_counters = avl_set.instrument()
+
+    for set_ in (array_avl_set, avl_set):
+        for value in values:
+            set_.add(value)
+        for value in values[::2]:
+            set_.discard(value)
+        if set_:
+            set_.popmin()
+        if set_:
+            set_.popmax()
+
+    assert array_avl_counters.rotations == avl_counters.rotations
+    assert array_avl_counters.allocations == avl_counters.allocations
+    assert array_avl_counters.comparisons == avl_counters.comparisons
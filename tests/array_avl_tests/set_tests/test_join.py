@@ -0,0 +1,27 @@
+from hypothesis import given
+
+from tests.hints import ValueT
+from tests.utils import (
+    ArrayAvlTree,
+    BaseSet,
+    are_balance_factors_normalized,
+    are_nodes_heights_correct,
+    are_nodes_sizes_correct,
+)
+
+from . import strategies
+
+
+@given(strategies.ordered_set_pair_strategy)
+def test_properties(
+    sets_pair: tuple[BaseSet[ValueT], BaseSet[ValueT]],
+) -> None:
+    first, second = sets_pair
+
+    result = first.join(second)
+
+    tree = result._tree
+    assert isinstance(tree, ArrayAvlTree)
+    assert are_nodes_sizes_correct(tree)
+    assert are_nodes_heights_correct(tree)
+    assert are_balance_factors_normalized(tree)
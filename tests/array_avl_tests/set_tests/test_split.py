@@ -0,0 +1,26 @@
+from hypothesis import given
+
+from tests.hints import ValueT
+from tests.utils import (
+    ArrayAvlTree,
+    BaseSet,
+    are_balance_factors_normalized,
+    are_nodes_heights_correct,
+    are_nodes_sizes_correct,
+)
+
+from . import strategies
+
+
+@given(strategies.set_with_value_strategy)
+def test_properties(set_with_value: tuple[BaseSet[ValueT], ValueT]) -> None:
+    set_, value = set_with_value
+
+    result = set_.split(value)
+
+    for part in result:
+        tree = part._tree
+        assert isinstance(tree, ArrayAvlTree)
+        assert are_nodes_sizes_correct(tree)
+        assert are_nodes_heights_correct(tree)
+        assert are_balance_factors_normalized(tree)
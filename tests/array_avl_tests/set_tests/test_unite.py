@@ -0,0 +1,27 @@
+from hypothesis import given
+
+from tests.hints import ValueT
+from tests.utils import (
+    ArrayAvlTree,
+    BaseSet,
+    are_balance_factors_normalized,
+    are_nodes_heights_correct,
+    are_nodes_sizes_correct,
+)
+
+from . import strategies
+
+
+@given(strategies.set_pair_strategy)
+def test_properties(
+    sets_pair: tuple[BaseSet[ValueT], BaseSet[ValueT]],
+) -> None:
+    left_set, right_set = sets_pair
+
+    result = left_set | right_set
+
+    result_tree = result._tree
+    assert isinstance(result_tree, ArrayAvlTree)
+    assert are_nodes_sizes_correct(result_tree)
+    assert are_nodes_heights_correct(result_tree)
+    assert are_balance_factors_normalized(result_tree)
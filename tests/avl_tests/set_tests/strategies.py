@@ -14,6 +14,7 @@ from tests.utils import (
     BaseSet,
     ValueSequencePairWithOrder,
     ValueSequenceWithOrder,
+    split_values_by_pivot,
 )
 
 
@@ -43,6 +44,23 @@ set_with_value_strategy = st.builds(
 )
 
 
+def to_ordered_set_pair(
+    values_list_with_order: ValueSequenceWithOrder[ValueT, KeyT], /
+) -> tuple[BaseSet[ValueT], BaseSet[ValueT]]:
+    lower_values, upper_values, order = split_values_by_pivot(
+        values_list_with_order
+    )
+    return (
+        avl.set_(*lower_values, key=order),
+        avl.set_(*upper_values, key=order),
+    )
+
+
+ordered_set_pair_strategy = st.builds(
+    to_ordered_set_pair, non_empty_value_sequence_with_order_strategy
+)
+
+
 def to_non_empty_set_with_their_value_strategy(
     set_: BaseSet[ValueT], /
 ) -> st.SearchStrategy[tuple[BaseSet[ValueT], ValueT]]:
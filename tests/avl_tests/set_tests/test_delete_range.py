@@ -0,0 +1,34 @@
+from hypothesis import given, strategies as st
+
+from tests.hints import ValueT
+from tests.utils import (
+    AvlTree,
+    BaseSet,
+    are_balance_factors_normalized,
+    are_nodes_heights_correct,
+    are_nodes_sizes_correct,
+)
+
+from . import strategies
+
+
+@given(strategies.set_with_value_strategy, st.booleans(), st.booleans())
+def test_properties(
+    set_with_value: tuple[BaseSet[ValueT], ValueT],
+    is_lower_bound: bool,
+    is_inclusive: bool,
+) -> None:
+    set_, value = set_with_value
+
+    result = (
+        set_.delete_range(value, None, inclusive=(is_inclusive, False))
+        if is_lower_bound
+        else set_.delete_range(None, value, inclusive=(True, is_inclusive))
+    )
+
+    for part in (set_, result):
+        tree = part._tree
+        assert isinstance(tree, AvlTree)
+        assert are_nodes_sizes_correct(tree)
+        assert are_nodes_heights_correct(tree)
+        assert are_balance_factors_normalized(tree)
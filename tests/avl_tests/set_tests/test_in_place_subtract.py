@@ -6,7 +6,7 @@ from tests.utils import (
     BaseSet,
     are_balance_factors_normalized,
     are_nodes_heights_correct,
-    are_nodes_parents_to_children,
+    are_nodes_sizes_correct,
 )
 
 from . import strategies
@@ -22,6 +22,6 @@ def test_properties(
 
     left_tree = left_set._tree
     assert isinstance(left_tree, AvlTree)
-    assert are_nodes_parents_to_children(left_tree)
+    assert are_nodes_sizes_correct(left_tree)
     assert are_nodes_heights_correct(left_tree)
     assert are_balance_factors_normalized(left_tree)
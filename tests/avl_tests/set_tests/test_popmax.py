@@ -6,7 +6,7 @@ from tests.utils import (
     BaseSet,
     are_balance_factors_normalized,
     are_nodes_heights_correct,
-    are_nodes_parents_to_children,
+    are_nodes_sizes_correct,
 )
 
 from . import strategies
@@ -18,6 +18,6 @@ def test_properties(set_: BaseSet[ValueT]) -> None:
 
     tree = set_._tree
     assert isinstance(tree, AvlTree)
-    assert are_nodes_parents_to_children(tree)
+    assert are_nodes_sizes_correct(tree)
     assert are_nodes_heights_correct(tree)
     assert are_balance_factors_normalized(tree)
@@ -9,7 +9,7 @@ from tests.utils import (
     ValueSequenceWithOrder,
     are_balance_factors_normalized,
     are_nodes_heights_correct,
-    are_nodes_parents_to_children,
+    are_nodes_sizes_correct,
     is_left_subtree_less_than_right_subtree,
     to_balanced_tree_height,
     to_height,
@@ -40,7 +40,7 @@ def test_properties(
     assert all(value in result for value in values)
     assert all(value in values for value in result)
     assert is_left_subtree_less_than_right_subtree(result_tree)
-    assert are_nodes_parents_to_children(result_tree)
+    assert are_nodes_sizes_correct(result_tree)
     assert are_nodes_heights_correct(result_tree)
     assert are_balance_factors_normalized(result_tree)
 
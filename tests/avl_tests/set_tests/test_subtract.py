@@ -6,7 +6,7 @@ from tests.utils import (
     BaseSet,
     are_balance_factors_normalized,
     are_nodes_heights_correct,
-    are_nodes_parents_to_children,
+    are_nodes_sizes_correct,
 )
 
 from . import strategies
@@ -22,6 +22,6 @@ def test_properties(
 
     result_tree = result._tree
     assert isinstance(result_tree, AvlTree)
-    assert are_nodes_parents_to_children(result_tree)
+    assert are_nodes_sizes_correct(result_tree)
     assert are_nodes_heights_correct(result_tree)
     assert are_balance_factors_normalized(result_tree)
@@ -3,7 +3,7 @@ from functools import partial, wraps
 
 from hypothesis import strategies
 
-from dendroid import avl, binary, red_black, splay
+from dendroid import array_avl, avl, binary, red_black, splay
 from dendroid.hints import Order
 from tests.hints import KeyT, ValueT
 from tests.strategies import (
@@ -23,6 +23,7 @@ from tests.utils import (
     ValueSequencePairWithOrder,
     ValueSequenceWithOrder,
     has_size_two_or_more,
+    split_values_by_pivot,
 )
 
 
@@ -41,10 +42,11 @@ def to_degenerate_factory(
     return wrapper
 
 
-factories = strategies.sampled_from(
-    [binary.set_, avl.set_, red_black.set_, splay.set_]
+backends = strategies.sampled_from([binary, avl, array_avl, red_black, splay])
+plain_factories = strategies.sampled_from(
+    [binary.set_, avl.set_, array_avl.set_, red_black.set_, splay.set_]
 )
-factories |= factories.map(to_degenerate_factory)
+factories = plain_factories | plain_factories.map(to_degenerate_factory)
 
 
 def to_set(
@@ -130,11 +132,53 @@ def to_set_with_values_pair(
 sets_with_values_pairs = strategies.builds(
     to_set_with_values_pair, factories, two_or_more_values_with_order_strategy
 )
+
+
+def to_ordered_sets_pair(
+    factory: Callable[..., BaseSet[ValueT]],
+    values_list_with_order: ValueSequenceWithOrder[ValueT, KeyT],
+    /,
+) -> BaseSetsPair[ValueT]:
+    lower_values, upper_values, order = split_values_by_pivot(
+        values_list_with_order
+    )
+    return factory(*lower_values, key=order), factory(*upper_values, key=order)
+
+
+ordered_sets_pairs = strategies.builds(
+    to_ordered_sets_pair,
+    factories,
+    non_empty_value_sequence_with_order_strategy,
+)
 non_empty_sets_with_their_values = non_empty_sets.flatmap(
     to_non_empty_set_with_their_value_strategy
 )
 
 
+def to_non_empty_set_with_index(
+    set_: BaseSet[ValueT], /
+) -> strategies.SearchStrategy[tuple[BaseSet[ValueT], int]]:
+    return strategies.tuples(
+        strategies.just(set_), strategies.integers(-len(set_), len(set_) - 1)
+    )
+
+
+def to_set_with_external_index(
+    set_: BaseSet[ValueT], /
+) -> strategies.SearchStrategy[tuple[BaseSet[ValueT], int]]:
+    return strategies.tuples(
+        strategies.just(set_),
+        strategies.integers(max_value=-len(set_) - 1)
+        | strategies.integers(min_value=len(set_)),
+    )
+
+
+non_empty_sets_with_indices = non_empty_sets.flatmap(
+    to_non_empty_set_with_index
+)
+sets_with_external_indices = sets.flatmap(to_set_with_external_index)
+
+
 def to_sets_tuple(
     factory: Callable[..., BaseSet[ValueT]],
     value_sequences_pair_with_order: ValueSequencePairWithOrder[ValueT, KeyT],
@@ -188,3 +232,7 @@ sets_pairs_with_values = strategies.builds(
         )
     ),
 )
+
+
+values_lists_with_orders = value_sequence_with_order_strategy
+values_lists_with_none_orders = value_sequence_with_none_order_strategy
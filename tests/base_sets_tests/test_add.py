@@ -20,7 +20,7 @@ def test_type(set_with_value: tuple[BaseSet[ValueT], ValueT]) -> None:
 
     result = set_.add(value)
 
-    assert result is None
+    assert isinstance(result, bool)
 
 
 @given(strategies.sets_with_values)
@@ -56,7 +56,8 @@ def test_step(set_with_value: tuple[BaseSet[ValueT], ValueT]) -> None:
     set_, value = set_with_value
     original = copy(set_)
 
-    set_.add(value)
+    result = set_.add(value)
 
+    assert result is (value not in original)
     assert len(set_) == len(original) + (value not in original)
     assert value in set_
@@ -0,0 +1,26 @@
+from hypothesis import given
+
+from tests.hints import ValueT
+from tests.utils import BaseSet, set_value_to_key
+
+from . import strategies
+
+
+@given(strategies.empty_sets_with_values)
+def test_base_case(set_with_value: tuple[BaseSet[ValueT], ValueT]) -> None:
+    set_, value = set_with_value
+
+    assert set_.bisect_right(value) == 0
+
+
+@given(strategies.non_empty_sets_with_values)
+def test_step(set_with_value: tuple[BaseSet[ValueT], ValueT]) -> None:
+    set_, value = set_with_value
+
+    result = set_.bisect_right(value)
+
+    assert result == sum(
+        not set_value_to_key(set_, value) < set_value_to_key(set_, candidate)
+        for candidate in set_
+    )
+    assert result == set_.bisect_left(value) + (value in set_)
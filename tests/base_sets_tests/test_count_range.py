@@ -0,0 +1,27 @@
+from hypothesis import given, strategies as st
+
+from tests.hints import ValueT
+from tests.utils import BaseSet
+
+from . import strategies
+
+
+@given(strategies.sets)
+def test_unbounded(set_: BaseSet[ValueT]) -> None:
+    result = set_.count_range()
+
+    assert result == len(set_)
+
+
+@given(
+    strategies.sets_with_values_pairs, st.tuples(st.booleans(), st.booleans())
+)
+def test_properties(
+    set_with_values_pair: tuple[BaseSet[ValueT], tuple[ValueT, ValueT]],
+    inclusive: tuple[bool, bool],
+) -> None:
+    set_, (lo, hi) = set_with_values_pair
+
+    result = set_.count_range(lo, hi, inclusive=inclusive)
+
+    assert result == len(list(set_.irange(lo, hi, inclusive=inclusive)))
@@ -0,0 +1,32 @@
+from hypothesis import given
+
+from tests.hints import ValueT
+from tests.utils import BaseSet
+
+from . import strategies
+
+
+@given(strategies.sets)
+def test_traversal(set_: BaseSet[ValueT]) -> None:
+    cursor = set_.cursor()
+
+    values = []
+    if cursor:
+        values.append(cursor.value)
+        while cursor.next():
+            values.append(cursor.value)
+    assert values == list(set_)
+
+
+@given(strategies.sets_with_values)
+def test_seek(set_with_value: tuple[BaseSet[ValueT], ValueT]) -> None:
+    set_, value = set_with_value
+
+    cursor = set_.cursor(value)
+
+    try:
+        ceil_value = set_.ceil(value)
+    except ValueError:
+        assert not cursor
+    else:
+        assert cursor.value == ceil_value
@@ -0,0 +1,34 @@
+from hypothesis import given, strategies as st
+
+from tests.hints import ValueT
+from tests.utils import BaseSet, is_in_range, set_value_to_key
+
+from . import strategies
+
+
+@given(
+    strategies.sets_with_values_pairs, st.tuples(st.booleans(), st.booleans())
+)
+def test_properties(
+    set_with_values_pair: tuple[BaseSet[ValueT], tuple[ValueT, ValueT]],
+    inclusive: tuple[bool, bool],
+) -> None:
+    set_, (lo, hi) = set_with_values_pair
+    original_values = list(set_)
+
+    result = set_.delete_range(lo, hi, inclusive=inclusive)
+
+    def is_value_in_range(value: ValueT) -> bool:
+        return is_in_range(
+            set_value_to_key(set_, value),
+            set_value_to_key(set_, lo),
+            set_value_to_key(set_, hi),
+            inclusive=inclusive,
+        )
+
+    assert list(result) == [
+        value for value in original_values if is_value_in_range(value)
+    ]
+    assert list(set_) == [
+        value for value in original_values if not is_value_in_range(value)
+    ]
@@ -0,0 +1,25 @@
+from hypothesis import given
+
+from tests.hints import ValueT
+from tests.utils import BaseSet, set_value_to_key
+
+from . import strategies
+
+
+@given(strategies.sets_with_values)
+def test_properties(set_with_value: tuple[BaseSet[ValueT], ValueT]) -> None:
+    set_, value = set_with_value
+    original_values = list(set_)
+
+    def predicate(candidate: ValueT) -> bool:
+        return bool(
+            set_value_to_key(set_, candidate) < set_value_to_key(set_, value)
+        )
+
+    result = set_.filter(predicate)
+
+    assert list(set_) == original_values
+    assert list(result) == [
+        candidate for candidate in original_values if predicate(candidate)
+    ]
+    assert all(candidate in set_ for candidate in result)
@@ -0,0 +1,33 @@
+from copy import copy
+
+from hypothesis import given
+
+from dendroid.hints import Counters
+from tests.hints import ValueT
+from tests.utils import BaseSet
+
+from . import strategies
+
+
+@given(strategies.sets)
+def test_basic(set_: BaseSet[ValueT]) -> None:
+    result = set_.instrument()
+
+    assert isinstance(result, Counters)
+    assert repr(result) == repr(Counters())
+    assert set_.instrument() is result
+
+
+@given(strategies.sets_with_values)
+def test_add(set_with_value: tuple[BaseSet[ValueT], ValueT]) -> None:
+    set_, value = set_with_value
+    original = copy(set_)
+    counters = set_.instrument()
+
+    set_.add(value)
+
+    assert counters.allocations == (value not in original)
+    assert counters.comparisons >= counters.visits
+    assert (counters.visits > 0) is bool(original)
+    assert len(set_) == len(original) + (value not in original)
+    assert value in set_
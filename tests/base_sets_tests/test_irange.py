@@ -0,0 +1,39 @@
+from hypothesis import given, strategies as st
+
+from tests.hints import ValueT
+from tests.utils import BaseSet, is_in_range, set_value_to_key
+
+from . import strategies
+
+
+@given(strategies.sets, st.booleans())
+def test_unbounded(set_: BaseSet[ValueT], reverse: bool) -> None:
+    result = set_.irange(reverse=reverse)
+
+    assert list(result) == (list(reversed(set_)) if reverse else list(set_))
+
+
+@given(
+    strategies.sets_with_values_pairs,
+    st.tuples(st.booleans(), st.booleans()),
+    st.booleans(),
+)
+def test_properties(
+    set_with_values_pair: tuple[BaseSet[ValueT], tuple[ValueT, ValueT]],
+    inclusive: tuple[bool, bool],
+    reverse: bool,
+) -> None:
+    set_, (lo, hi) = set_with_values_pair
+
+    result = set_.irange(lo, hi, inclusive=inclusive, reverse=reverse)
+
+    assert list(result) == [
+        value
+        for value in (reversed(set_) if reverse else set_)
+        if is_in_range(
+            set_value_to_key(set_, value),
+            set_value_to_key(set_, lo),
+            set_value_to_key(set_, hi),
+            inclusive=inclusive,
+        )
+    ]
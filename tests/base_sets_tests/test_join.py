@@ -0,0 +1,26 @@
+import copy
+
+import pytest
+from hypothesis import given
+
+from tests.hints import ValueT
+from tests.utils import BaseSet, BaseSetsPair
+
+from . import strategies
+
+
+@given(strategies.ordered_sets_pairs)
+def test_properties(sets_pair: BaseSetsPair[ValueT]) -> None:
+    first, second = sets_pair
+    first_values, second_values = list(first), list(second)
+
+    result = first.join(second)
+
+    assert len(first) == len(second) == 0
+    assert list(result) == first_values + second_values
+
+
+@given(strategies.non_empty_sets)
+def test_overlapping(set_: BaseSet[ValueT]) -> None:
+    with pytest.raises(ValueError):
+        set_.join(copy.copy(set_))
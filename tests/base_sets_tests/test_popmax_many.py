@@ -0,0 +1,17 @@
+from hypothesis import given, strategies as st
+
+from tests.hints import ValueT
+from tests.utils import BaseSet
+
+from . import strategies
+
+
+@given(strategies.sets, st.integers(0, 10))
+def test_properties(set_: BaseSet[ValueT], count: int) -> None:
+    original_values = list(set_)
+    size = max(len(original_values) - count, 0)
+
+    result = set_.popmax_many(count)
+
+    assert list(result) == original_values[size:]
+    assert list(set_) == original_values[:size]
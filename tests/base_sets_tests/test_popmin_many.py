@@ -0,0 +1,16 @@
+from hypothesis import given, strategies as st
+
+from tests.hints import ValueT
+from tests.utils import BaseSet
+
+from . import strategies
+
+
+@given(strategies.sets, st.integers(0, 10))
+def test_properties(set_: BaseSet[ValueT], count: int) -> None:
+    original_values = list(set_)
+
+    result = set_.popmin_many(count)
+
+    assert list(result) == original_values[:count]
+    assert list(set_) == original_values[count:]
@@ -0,0 +1,35 @@
+import pytest
+from hypothesis import given
+
+from tests.hints import ValueT
+from tests.utils import BaseSet
+
+from . import strategies
+
+
+@given(strategies.empty_sets_with_values)
+def test_base_case(set_with_value: tuple[BaseSet[ValueT], ValueT]) -> None:
+    set_, value = set_with_value
+
+    with pytest.raises(ValueError):
+        set_.rank(value)
+
+
+@given(strategies.non_empty_sets_with_their_values)
+def test_step(set_with_value: tuple[BaseSet[ValueT], ValueT]) -> None:
+    set_, value = set_with_value
+
+    result = set_.rank(value)
+
+    assert 0 <= result < len(set_)
+    assert set_.select(result) is value
+
+
+@given(strategies.non_empty_sets_with_external_values)
+def test_external_value(
+    set_with_value: tuple[BaseSet[ValueT], ValueT],
+) -> None:
+    set_, value = set_with_value
+
+    with pytest.raises(ValueError):
+        set_.rank(value)
@@ -0,0 +1,24 @@
+import pytest
+from hypothesis import given
+
+from tests.hints import ValueT
+from tests.utils import BaseSet
+
+from . import strategies
+
+
+@given(strategies.non_empty_sets_with_indices)
+def test_properties(set_with_index: tuple[BaseSet[ValueT], int]) -> None:
+    set_, index = set_with_index
+
+    result = set_.select(index)
+
+    assert result is list(set_)[index]
+
+
+@given(strategies.sets_with_external_indices)
+def test_external_index(set_with_index: tuple[BaseSet[ValueT], int]) -> None:
+    set_, index = set_with_index
+
+    with pytest.raises(IndexError):
+        set_.select(index)
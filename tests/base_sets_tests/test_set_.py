@@ -0,0 +1,28 @@
+from collections.abc import Callable
+
+from hypothesis import given
+
+from tests.hints import KeyT, ValueT
+from tests.utils import BaseSet, ValueSequenceWithOrder
+
+from . import strategies
+
+
+@given(strategies.plain_factories, strategies.values_lists_with_orders)
+def test_reverse(
+    factory: Callable[..., BaseSet[ValueT]],
+    values_with_order: ValueSequenceWithOrder[ValueT, KeyT],
+) -> None:
+    values, order = values_with_order
+
+    result = factory(*values, key=order, reverse=True)
+
+    ascending = factory(*values, key=order)
+    assert list(result) == list(reversed(ascending))
+    assert all(
+        result.floor(value) == ascending.ceil(value) for value in values
+    )
+    assert all(
+        result.ceil(value) == ascending.floor(value) for value in values
+    )
+    assert result | ascending.from_iterable(values) == result
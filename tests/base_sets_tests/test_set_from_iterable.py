@@ -0,0 +1,32 @@
+from types import ModuleType
+
+from hypothesis import given
+
+from tests.hints import KeyT, ValueT
+from tests.utils import ValueSequenceWithOrder
+
+from . import strategies
+
+
+@given(strategies.backends, strategies.values_lists_with_orders)
+def test_basic(
+    backend: ModuleType,
+    values_with_order: ValueSequenceWithOrder[ValueT, KeyT],
+) -> None:
+    values, order = values_with_order
+
+    result = backend.set_from_iterable(iter(values), key=order)
+
+    assert list(result) == list(backend.set_(*values, key=order))
+
+
+@given(strategies.backends, strategies.values_lists_with_orders)
+def test_reverse(
+    backend: ModuleType,
+    values_with_order: ValueSequenceWithOrder[ValueT, KeyT],
+) -> None:
+    values, order = values_with_order
+
+    result = backend.set_from_iterable(iter(values), key=order, reverse=True)
+
+    assert list(result) == list(backend.set_(*values, key=order, reverse=True))
@@ -0,0 +1,20 @@
+from types import ModuleType
+
+from hypothesis import given
+
+from tests.hints import ValueT
+from tests.utils import BaseSet
+
+from . import strategies
+
+
+@given(strategies.backends, strategies.sets)
+def test_properties(backend: ModuleType, set_: BaseSet[ValueT]) -> None:
+    original_values = list(set_)
+
+    result = backend.set_from_set(set_)
+
+    assert list(result) == original_values
+    assert list(set_) == original_values
+    assert result == set_
+    assert all(value in result for value in set_)
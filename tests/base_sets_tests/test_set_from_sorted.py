@@ -0,0 +1,34 @@
+from types import ModuleType
+
+from hypothesis import given
+
+from tests.hints import KeyT, OrderedValueT
+from tests.utils import ValueSequenceWithOrder
+
+from . import strategies
+
+
+@given(strategies.backends, strategies.values_lists_with_none_orders)
+def test_basic(
+    backend: ModuleType,
+    values_with_order: ValueSequenceWithOrder[OrderedValueT, KeyT],
+) -> None:
+    values, _ = values_with_order
+    sorted_values = sorted(values)
+
+    result = backend.set_from_sorted(iter(sorted_values))
+
+    assert list(result) == list(backend.set_(*sorted_values))
+
+
+@given(strategies.backends, strategies.values_lists_with_none_orders)
+def test_assume_unique(
+    backend: ModuleType,
+    values_with_order: ValueSequenceWithOrder[OrderedValueT, KeyT],
+) -> None:
+    values, _ = values_with_order
+    set_ = backend.set_(*values)
+
+    result = backend.set_from_sorted(set_, assume_unique=True)
+
+    assert list(result) == list(set_)
@@ -0,0 +1,25 @@
+from hypothesis import given
+
+from tests.hints import ValueT
+from tests.utils import BaseSet, set_value_to_key
+
+from . import strategies
+
+
+@given(strategies.sets_with_values)
+def test_properties(set_with_value: tuple[BaseSet[ValueT], ValueT]) -> None:
+    set_, value = set_with_value
+    original_values = list(set_)
+
+    lower, upper = set_.split(value)
+
+    assert len(set_) == 0
+    assert all(
+        set_value_to_key(lower, candidate) < set_value_to_key(lower, value)
+        for candidate in lower
+    )
+    assert not any(
+        set_value_to_key(upper, candidate) < set_value_to_key(upper, value)
+        for candidate in upper
+    )
+    assert list(lower) + list(upper) == original_values
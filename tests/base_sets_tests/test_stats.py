@@ -0,0 +1,25 @@
+from hypothesis import given
+
+from dendroid.hints import Stats
+from tests.hints import ValueT
+from tests.utils import BaseSet, to_height
+
+from . import strategies
+
+
+@given(strategies.sets)
+def test_basic(set_: BaseSet[ValueT]) -> None:
+    result = set_.stats()
+
+    assert isinstance(result, Stats)
+
+
+@given(strategies.sets)
+def test_properties(set_: BaseSet[ValueT]) -> None:
+    result = set_.stats()
+
+    assert result.size == len(set_)
+    assert result.height == to_height(set_._tree)
+    assert sum(result.depths.values()) == len(set_)
+    assert max(result.depths, default=-1) == result.height
+    assert (result.bytes_per_node > 0) is bool(set_)
@@ -0,0 +1,24 @@
+from hypothesis import given
+
+from tests.hints import ValueT
+from tests.utils import BaseSet, set_value_to_key
+
+from . import strategies
+
+
+@given(strategies.sets_with_values)
+def test_properties(set_with_value: tuple[BaseSet[ValueT], ValueT]) -> None:
+    set_, value = set_with_value
+    original_values = list(set_)
+
+    result = set_.truncate_below(value)
+
+    assert all(
+        set_value_to_key(set_, candidate) < set_value_to_key(set_, value)
+        for candidate in result
+    )
+    assert not any(
+        set_value_to_key(set_, candidate) < set_value_to_key(set_, value)
+        for candidate in set_
+    )
+    assert list(result) + list(set_) == original_values
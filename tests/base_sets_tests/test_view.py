@@ -0,0 +1,65 @@
+from hypothesis import given, strategies as st
+
+from tests.hints import ValueT
+from tests.utils import BaseSet, is_in_range, set_value_to_key
+
+from . import strategies
+
+
+@given(
+    strategies.sets_with_values_pairs, st.tuples(st.booleans(), st.booleans())
+)
+def test_properties(
+    set_with_values_pair: tuple[BaseSet[ValueT], tuple[ValueT, ValueT]],
+    inclusive: tuple[bool, bool],
+) -> None:
+    set_, (lo, hi) = set_with_values_pair
+
+    result = set_.view(lo, hi, inclusive=inclusive)
+
+    assert list(result) == [
+        value
+        for value in set_
+        if is_in_range(
+            set_value_to_key(set_, value),
+            set_value_to_key(set_, lo),
+            set_value_to_key(set_, hi),
+            inclusive=inclusive,
+        )
+    ]
+    assert list(reversed(result)) == list(result)[::-1]
+    assert len(result) == len(list(result))
+    assert all(value in result for value in result)
+    assert not result or (
+        result.min() == next(iter(result))
+        and result.max() == next(reversed(result))
+    )
+
+
+@given(strategies.sets_with_values_pairs)
+def test_liveness(
+    set_with_values_pair: tuple[BaseSet[ValueT], tuple[ValueT, ValueT]],
+) -> None:
+    set_, (lo, hi) = set_with_values_pair
+    view = set_.view(lo, hi, inclusive=(True, True))
+
+    set_.add(lo)
+
+    assert (lo in view) is is_in_range(
+        set_value_to_key(set_, lo),
+        set_value_to_key(set_, lo),
+        set_value_to_key(set_, hi),
+        inclusive=(True, True),
+    )
+
+    view.clear()
+
+    assert not any(
+        is_in_range(
+            set_value_to_key(set_, value),
+            set_value_to_key(set_, lo),
+            set_value_to_key(set_, hi),
+            inclusive=(True, True),
+        )
+        for value in set_
+    )
@@ -3,8 +3,9 @@ from functools import partial, wraps
 from typing import Any
 
 from hypothesis import strategies as st
+from typing_extensions import Self
 
-from dendroid import avl, binary, red_black, splay
+from dendroid import array_avl, avl, binary, red_black, splay
 from dendroid.hints import Item
 from tests.hints import KeyT, ValueT
 from tests.strategies import (
@@ -12,6 +13,7 @@ from tests.strategies import (
     single_value_with_order_strategy,
     to_value_sequences_with_order_strategy,
     two_or_more_values_with_order_strategy,
+    value_sequence_with_none_order_strategy,
     value_sequence_with_order_strategy,
     value_with_order_strategy_strategy,
 )
@@ -37,10 +39,11 @@ def to_degenerate_factory(
     return wrapper
 
 
-factories = st.sampled_from(
-    [binary.map_, avl.map_, red_black.map_, splay.map_]
+backends = st.sampled_from([binary, avl, array_avl, red_black, splay])
+plain_factories = st.sampled_from(
+    [binary.map_, avl.map_, array_avl.map_, red_black.map_, splay.map_]
 )
-factories |= factories.map(to_degenerate_factory)
+factories = plain_factories | plain_factories.map(to_degenerate_factory)
 
 
 def values_list_with_order_to_items_list(
@@ -97,6 +100,53 @@ empty_maps_with_keys = st.builds(to_map_with_key, factories, single_items)
 non_empty_maps_with_keys = st.builds(
     to_map_with_key, factories, two_or_more_items
 )
+maps_with_keys = st.builds(to_map_with_key, factories, non_empty_items_lists)
+
+
+def to_counter_with_key(
+    factory: Callable[..., Map[KeyT, int]], items: list[Item[KeyT, ValueT]], /
+) -> tuple[Map[KeyT, int], KeyT]:
+    *rest_items, (key, _) = items
+    return (
+        factory(*[(key, index) for index, (key, _) in enumerate(rest_items)]),
+        key,
+    )
+
+
+counters_with_keys = st.builds(
+    to_counter_with_key, factories, non_empty_items_lists
+)
+
+
+def to_map_with_keys_pair(
+    factory: Callable[..., Map[KeyT, ValueT]],
+    items: list[Item[KeyT, ValueT]],
+    /,
+) -> tuple[Map[KeyT, ValueT], tuple[KeyT, KeyT]]:
+    *rest_items, (first_key, _), (second_key, _) = items
+    return factory(*rest_items), (first_key, second_key)
+
+
+maps_with_keys_pairs = st.builds(
+    to_map_with_keys_pair, factories, two_or_more_items
+)
+
+
+def to_ordered_maps_pair(
+    factory: Callable[..., Map[KeyT, ValueT]],
+    items: list[Item[KeyT, ValueT]],
+    /,
+) -> MapsPair[KeyT, ValueT]:
+    *rest_items, (pivot, _) = items
+    return (
+        factory(*[item for item in rest_items if item[0] < pivot]),
+        factory(*[item for item in rest_items if not item[0] < pivot]),
+    )
+
+
+ordered_maps_pairs = st.builds(
+    to_ordered_maps_pair, factories, non_empty_items_lists
+)
 
 
 def to_map_with_item(
@@ -137,6 +187,28 @@ non_empty_maps_with_their_items = non_empty_maps.flatmap(
 )
 
 
+def to_non_empty_map_with_index(
+    map_: Map[KeyT, ValueT], /
+) -> st.SearchStrategy[tuple[Map[KeyT, ValueT], int]]:
+    return st.tuples(st.just(map_), st.integers(-len(map_), len(map_) - 1))
+
+
+def to_map_with_external_index(
+    map_: Map[KeyT, ValueT], /
+) -> st.SearchStrategy[tuple[Map[KeyT, ValueT], int]]:
+    return st.tuples(
+        st.just(map_),
+        st.integers(max_value=-len(map_) - 1)
+        | st.integers(min_value=len(map_)),
+    )
+
+
+non_empty_maps_with_indices = non_empty_maps.flatmap(
+    to_non_empty_map_with_index
+)
+maps_with_external_indices = maps.flatmap(to_map_with_external_index)
+
+
 def is_key_external(map_with_key: tuple[Map[KeyT, ValueT], KeyT]) -> bool:
     map_, key = map_with_key
     return key not in map_
@@ -207,3 +279,39 @@ maps_pairs = st.builds(
     ).map(value_sequences_with_order_to_items_lists),
 )
 maps_with_items_lists_or_maps = maps_with_items_lists | maps_pairs
+
+
+keys_lists_with_orders = value_sequence_with_order_strategy
+keys_lists_with_none_orders = value_sequence_with_none_order_strategy
+
+
+class AttributeKey:
+    """Key which compares with an attribute of the other key."""
+
+    __slots__ = ('value',)
+
+    def __init__(self, value: int, /) -> None:
+        self.value = value
+
+    def __lt__(self, other: Self, /) -> bool:
+        return self.value < other.value
+
+    def __repr__(self, /) -> str:
+        return f'{type(self).__qualname__}({self.value!r})'
+
+
+def to_attribute_keyed_map_with_key(
+    factory: Callable[..., Map[AttributeKey, int]], values: list[int], /
+) -> tuple[Map[AttributeKey, int], AttributeKey]:
+    *rest_values, value = values
+    return (
+        factory(*[(AttributeKey(value), value) for value in rest_values]),
+        AttributeKey(value),
+    )
+
+
+attribute_keyed_maps_with_keys = st.builds(
+    to_attribute_keyed_map_with_key,
+    factories,
+    st.lists(st.integers(), min_size=1),
+)
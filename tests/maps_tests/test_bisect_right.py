@@ -0,0 +1,23 @@
+from hypothesis import given
+
+from tests.hints import KeyT, ValueT
+from tests.utils import Map
+
+from . import strategies
+
+
+@given(strategies.empty_maps_with_keys)
+def test_base_case(map_with_key: tuple[Map[KeyT, ValueT], KeyT]) -> None:
+    map_, key = map_with_key
+
+    assert map_.bisect_right(key) == 0
+
+
+@given(strategies.non_empty_maps_with_keys)
+def test_step(map_with_key: tuple[Map[KeyT, ValueT], KeyT]) -> None:
+    map_, key = map_with_key
+
+    result = map_.bisect_right(key)
+
+    assert result == sum(not key < candidate for candidate in map_)
+    assert result == map_.bisect_left(key) + (key in map_)
@@ -0,0 +1,27 @@
+from hypothesis import given, strategies as st
+
+from tests.hints import KeyT, ValueT
+from tests.utils import Map
+
+from . import strategies
+
+
+@given(strategies.maps)
+def test_unbounded(map_: Map[KeyT, ValueT]) -> None:
+    result = map_.count_range()
+
+    assert result == len(map_)
+
+
+@given(
+    strategies.maps_with_keys_pairs, st.tuples(st.booleans(), st.booleans())
+)
+def test_properties(
+    map_with_keys_pair: tuple[Map[KeyT, ValueT], tuple[KeyT, KeyT]],
+    inclusive: tuple[bool, bool],
+) -> None:
+    map_, (lo, hi) = map_with_keys_pair
+
+    result = map_.count_range(lo, hi, inclusive=inclusive)
+
+    assert result == len(list(map_.irange(lo, hi, inclusive=inclusive)))
@@ -0,0 +1,62 @@
+import pytest
+from hypothesis import given
+
+from dendroid.hints import Item
+from tests.hints import KeyT, ValueT
+from tests.utils import Map
+
+from . import strategies
+
+
+@given(strategies.maps)
+def test_traversal(map_: Map[KeyT, ValueT]) -> None:
+    cursor = map_.cursor()
+
+    items = []
+    if cursor:
+        items.append((cursor.key, cursor.value))
+        while cursor.next():
+            items.append((cursor.key, cursor.value))
+    assert items == list(map_.items())
+
+
+@given(strategies.maps)
+def test_reversed_traversal(map_: Map[KeyT, ValueT]) -> None:
+    cursor = map_.cursor()
+
+    keys = []
+    if cursor.last():
+        keys.append(cursor.key)
+        while cursor.prev():
+            keys.append(cursor.key)
+    assert keys == list(reversed(map_))
+
+
+@given(strategies.maps_with_keys)
+def test_seek(map_with_key: tuple[Map[KeyT, ValueT], KeyT]) -> None:
+    map_, key = map_with_key
+
+    cursor = map_.cursor(key)
+
+    try:
+        ceil_item = map_.ceilitem(key)
+    except KeyError:
+        assert not cursor
+    else:
+        assert (cursor.key, cursor.value) == ceil_item
+
+
+@given(strategies.non_empty_maps_with_their_items)
+def test_removal(
+    map_with_item: tuple[Map[KeyT, ValueT], Item[KeyT, ValueT]],
+) -> None:
+    map_, (key, _) = map_with_item
+    cursor = map_.cursor(key)
+    next_keys = list(map_.irange(key, None, inclusive=(False, True)))
+
+    del map_[key]
+
+    with pytest.raises(KeyError):
+        _ = cursor.key
+    assert cursor.next() is bool(next_keys)
+    assert not next_keys or cursor.key == next_keys[0]
@@ -0,0 +1,55 @@
+from hypothesis import given, strategies as st
+
+from tests.hints import KeyT, ValueT
+from tests.utils import (
+    Map,
+    is_in_range,
+    is_left_subtree_less_than_right_subtree,
+    to_height,
+    to_max_binary_tree_height,
+    to_min_binary_tree_height,
+)
+
+from . import strategies
+
+
+@given(
+    strategies.maps_with_keys_pairs, st.tuples(st.booleans(), st.booleans())
+)
+def test_properties(
+    map_with_keys_pair: tuple[Map[KeyT, ValueT], tuple[KeyT, KeyT]],
+    inclusive: tuple[bool, bool],
+) -> None:
+    map_, (lo, hi) = map_with_keys_pair
+    original_items = list(map_.items())
+
+    result = map_.delete_range(lo, hi, inclusive=inclusive)
+
+    assert list(result.items()) == [
+        (key, value)
+        for key, value in original_items
+        if is_in_range(key, lo, hi, inclusive=inclusive)
+    ]
+    assert list(map_.items()) == [
+        (key, value)
+        for key, value in original_items
+        if not is_in_range(key, lo, hi, inclusive=inclusive)
+    ]
+    for part in (map_, result):
+        tree = part._tree
+        assert (
+            to_min_binary_tree_height(tree)
+            <= to_height(tree)
+            <= to_max_binary_tree_height(tree)
+        )
+        assert is_left_subtree_less_than_right_subtree(tree)
+
+
+@given(strategies.maps)
+def test_unbounded(map_: Map[KeyT, ValueT]) -> None:
+    original_items = list(map_.items())
+
+    result = map_.delete_range()
+
+    assert len(map_) == 0
+    assert list(result.items()) == original_items
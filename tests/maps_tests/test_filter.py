@@ -0,0 +1,21 @@
+from hypothesis import given
+
+from tests.hints import KeyT, ValueT
+from tests.utils import Map
+
+from . import strategies
+
+
+@given(strategies.maps_with_keys)
+def test_properties(map_with_key: tuple[Map[KeyT, ValueT], KeyT]) -> None:
+    map_, key = map_with_key
+    original_items = list(map_.items())
+
+    result = map_.filter(lambda candidate, _value: candidate < key)
+
+    assert list(map_.items()) == original_items
+    assert list(result.items()) == [
+        (candidate, value)
+        for candidate, value in original_items
+        if candidate < key
+    ]
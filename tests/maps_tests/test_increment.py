@@ -0,0 +1,45 @@
+from copy import copy
+
+from hypothesis import given, strategies as st
+
+from tests.hints import KeyT
+from tests.utils import (
+    Map,
+    is_left_subtree_less_than_right_subtree,
+    to_height,
+    to_max_binary_tree_height,
+    to_min_binary_tree_height,
+)
+
+from . import strategies
+
+
+@given(strategies.counters_with_keys, st.integers())
+def test_properties(
+    counter_with_key: tuple[Map[KeyT, int], KeyT], delta: int
+) -> None:
+    counter, key = counter_with_key
+
+    counter.increment(key, delta)
+
+    tree = counter._tree
+    assert (
+        to_min_binary_tree_height(tree)
+        <= to_height(tree)
+        <= to_max_binary_tree_height(tree)
+    )
+    assert is_left_subtree_less_than_right_subtree(tree)
+
+
+@given(strategies.counters_with_keys, st.integers())
+def test_step(
+    counter_with_key: tuple[Map[KeyT, int], KeyT], delta: int
+) -> None:
+    counter, key = counter_with_key
+    original = copy(counter)
+
+    result = counter.increment(key, delta)
+
+    assert result == counter[key]
+    assert result == (original[key] + delta if key in original else delta)
+    assert len(counter) == len(original) + (key not in original)
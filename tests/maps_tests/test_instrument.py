@@ -0,0 +1,72 @@
+from copy import copy
+
+from hypothesis import given
+
+from dendroid.hints import Counters
+from tests.hints import KeyT, ValueT
+from tests.utils import Map
+
+from . import strategies
+from .strategies import AttributeKey
+
+
+@given(strategies.maps)
+def test_basic(map_: Map[KeyT, ValueT]) -> None:
+    result = map_.instrument()
+
+    assert isinstance(result, Counters)
+    assert repr(result) == repr(Counters())
+    assert map_.instrument() is result
+
+
+@given(strategies.maps_with_keys)
+def test_lookup(map_with_key: tuple[Map[KeyT, ValueT], KeyT]) -> None:
+    map_, key = map_with_key
+    counters = map_.instrument()
+
+    map_.get(key)
+
+    assert counters.comparisons >= counters.visits
+    assert (counters.visits > 0) is bool(map_)
+    assert counters.allocations == 0
+
+
+@given(strategies.maps_with_items)
+def test_insertion(
+    map_with_item: tuple[Map[KeyT, ValueT], tuple[KeyT, ValueT]],
+) -> None:
+    map_, (key, value) = map_with_item
+    original = copy(map_)
+    counters = map_.instrument()
+
+    map_[key] = value
+
+    assert counters.allocations == (key not in original)
+    original[key] = value
+    assert list(map_.items()) == list(original.items())
+
+
+@given(strategies.maps_with_keys)
+def test_reset(map_with_key: tuple[Map[KeyT, ValueT], KeyT]) -> None:
+    map_, key = map_with_key
+    counters = map_.instrument()
+    map_.get(key)
+
+    counters.reset()
+
+    assert repr(counters) == repr(Counters())
+
+
+@given(strategies.attribute_keyed_maps_with_keys)
+def test_attribute_keys(
+    map_with_key: tuple[Map[AttributeKey, int], AttributeKey],
+) -> None:
+    map_, key = map_with_key
+    counters = map_.instrument()
+
+    map_[key] = key.value
+
+    assert map_[key] == key.value
+    assert counters.comparisons >= counters.visits
+    assert (counters.visits > 0) is (len(map_) > 0)
+    assert map_.pop(key) == key.value
@@ -0,0 +1,34 @@
+from hypothesis import given, strategies as st
+
+from tests.hints import KeyT, ValueT
+from tests.utils import Map, is_in_range
+
+from . import strategies
+
+
+@given(strategies.maps, st.booleans())
+def test_unbounded(map_: Map[KeyT, ValueT], reverse: bool) -> None:
+    result = map_.irange(reverse=reverse)
+
+    assert list(result) == (list(reversed(map_)) if reverse else list(map_))
+
+
+@given(
+    strategies.maps_with_keys_pairs,
+    st.tuples(st.booleans(), st.booleans()),
+    st.booleans(),
+)
+def test_properties(
+    map_with_keys_pair: tuple[Map[KeyT, ValueT], tuple[KeyT, KeyT]],
+    inclusive: tuple[bool, bool],
+    reverse: bool,
+) -> None:
+    map_, (lo, hi) = map_with_keys_pair
+
+    result = map_.irange(lo, hi, inclusive=inclusive, reverse=reverse)
+
+    assert list(result) == [
+        key
+        for key in (reversed(map_) if reverse else map_)
+        if is_in_range(key, lo, hi, inclusive=inclusive)
+    ]
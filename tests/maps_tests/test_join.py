@@ -0,0 +1,26 @@
+import copy
+
+import pytest
+from hypothesis import given
+
+from tests.hints import KeyT, ValueT
+from tests.utils import Map, MapsPair
+
+from . import strategies
+
+
+@given(strategies.ordered_maps_pairs)
+def test_properties(maps_pair: MapsPair[KeyT, ValueT]) -> None:
+    first, second = maps_pair
+    first_items, second_items = list(first.items()), list(second.items())
+
+    result = first.join(second)
+
+    assert len(first) == len(second) == 0
+    assert list(result.items()) == first_items + second_items
+
+
+@given(strategies.non_empty_maps)
+def test_overlapping(map_: Map[KeyT, ValueT]) -> None:
+    with pytest.raises(ValueError):
+        map_.join(copy.copy(map_))
@@ -0,0 +1,51 @@
+from collections.abc import Callable
+from itertools import pairwise
+from typing import Any
+
+from hypothesis import given
+
+from tests.hints import KeyT, ValueT
+from tests.utils import Map, ValueSequenceWithOrder, identity
+
+from . import strategies
+
+
+@given(strategies.plain_factories, strategies.keys_lists_with_orders)
+def test_key(
+    factory: Callable[..., Map[Any, int]],
+    keys_with_order: ValueSequenceWithOrder[ValueT, KeyT],
+) -> None:
+    keys, order = keys_with_order
+    items = [(key, index) for index, key in enumerate(keys)]
+
+    result = factory(*items, key=order)
+
+    sort_key: Callable[[ValueT], Any] = identity if order is None else order
+    assert len(result) <= len(keys)
+    assert all(key in result for key in keys)
+    assert all(key in keys for key in result)
+    assert all(
+        sort_key(key) < sort_key(next_key)
+        for key, next_key in pairwise(result)
+    )
+
+
+@given(strategies.plain_factories, strategies.keys_lists_with_orders)
+def test_reverse(
+    factory: Callable[..., Map[Any, int]],
+    keys_with_order: ValueSequenceWithOrder[ValueT, KeyT],
+) -> None:
+    keys, order = keys_with_order
+    items = [(key, index) for index, key in enumerate(keys)]
+
+    result = factory(*items, key=order, reverse=True)
+
+    ascending = factory(*items, key=order)
+    assert list(result.items()) == list(reversed(ascending.items()))
+    assert list(reversed(result.items())) == list(ascending.items())
+    assert all(result.floor(key) == ascending.ceil(key) for key in keys)
+    assert all(result.ceil(key) == ascending.floor(key) for key in keys)
+    assert all(
+        result.rank(key) == len(ascending) - 1 - ascending.rank(key)
+        for key in keys
+    )
@@ -0,0 +1,40 @@
+from types import ModuleType
+
+from hypothesis import given
+
+from tests.hints import KeyT, ValueT
+from tests.utils import ValueSequenceWithOrder
+
+from . import strategies
+
+
+@given(strategies.backends, strategies.keys_lists_with_orders)
+def test_basic(
+    backend: ModuleType, keys_with_order: ValueSequenceWithOrder[ValueT, KeyT]
+) -> None:
+    keys, order = keys_with_order
+    values = range(len(keys))
+
+    result = backend.map_from_columns(iter(keys), values, key=order)
+
+    assert list(result.items()) == list(
+        backend.map_(*zip(keys, values, strict=True), key=order).items()
+    )
+
+
+@given(strategies.backends, strategies.keys_lists_with_orders)
+def test_reverse(
+    backend: ModuleType, keys_with_order: ValueSequenceWithOrder[ValueT, KeyT]
+) -> None:
+    keys, order = keys_with_order
+    values = range(len(keys))
+
+    result = backend.map_from_columns(
+        iter(keys), values, key=order, reverse=True
+    )
+
+    assert list(result.items()) == list(
+        backend.map_(
+            *zip(keys, values, strict=True), key=order, reverse=True
+        ).items()
+    )
@@ -0,0 +1,36 @@
+from types import ModuleType
+
+from hypothesis import given
+
+from tests.hints import KeyT, ValueT
+from tests.utils import ValueSequenceWithOrder
+
+from . import strategies
+
+
+@given(strategies.backends, strategies.keys_lists_with_orders)
+def test_basic(
+    backend: ModuleType, keys_with_order: ValueSequenceWithOrder[ValueT, KeyT]
+) -> None:
+    keys, order = keys_with_order
+    items = [(key, index) for index, key in enumerate(keys)]
+
+    result = backend.map_from_iterable(iter(items), key=order)
+
+    assert list(result.items()) == list(
+        backend.map_(*items, key=order).items()
+    )
+
+
+@given(strategies.backends, strategies.keys_lists_with_orders)
+def test_reverse(
+    backend: ModuleType, keys_with_order: ValueSequenceWithOrder[ValueT, KeyT]
+) -> None:
+    keys, order = keys_with_order
+    items = [(key, index) for index, key in enumerate(keys)]
+
+    result = backend.map_from_iterable(iter(items), key=order, reverse=True)
+
+    assert list(result.items()) == list(
+        backend.map_(*items, key=order, reverse=True).items()
+    )
@@ -0,0 +1,33 @@
+from types import ModuleType
+
+from hypothesis import given
+
+from tests.hints import KeyT, ValueT
+from tests.utils import Map
+
+from . import strategies
+
+
+@given(strategies.backends, strategies.maps)
+def test_properties(backend: ModuleType, map_: Map[KeyT, ValueT]) -> None:
+    original_items = list(map_.items())
+
+    result = backend.map_from_map(map_)
+
+    assert list(result.items()) == original_items
+    assert list(map_.items()) == original_items
+    assert all(
+        result.rank(key) == index
+        for index, (key, _) in enumerate(map_.items())
+    )
+
+
+@given(strategies.backends, strategies.maps)
+def test_independence(backend: ModuleType, map_: Map[KeyT, ValueT]) -> None:
+    original_items = list(map_.items())
+
+    result = backend.map_from_map(map_)
+
+    for key in result:
+        result[key] = None
+    assert list(map_.items()) == original_items
@@ -0,0 +1,39 @@
+from types import ModuleType
+
+from hypothesis import given
+
+from tests.hints import KeyT, OrderedValueT
+from tests.utils import ValueSequenceWithOrder
+
+from . import strategies
+
+
+@given(strategies.backends, strategies.keys_lists_with_none_orders)
+def test_basic(
+    backend: ModuleType,
+    keys_with_order: ValueSequenceWithOrder[OrderedValueT, KeyT],
+) -> None:
+    keys, _ = keys_with_order
+    sorted_keys = sorted(keys)
+    values = range(len(sorted_keys))
+
+    result = backend.map_from_sorted(iter(sorted_keys), values)
+
+    assert list(result.items()) == list(
+        backend.map_(*zip(sorted_keys, values, strict=True)).items()
+    )
+
+
+@given(strategies.backends, strategies.keys_lists_with_none_orders)
+def test_assume_unique(
+    backend: ModuleType,
+    keys_with_order: ValueSequenceWithOrder[OrderedValueT, KeyT],
+) -> None:
+    keys, _ = keys_with_order
+    map_ = backend.map_(*zip(keys, range(len(keys)), strict=True))
+
+    result = backend.map_from_sorted(
+        map_.keys(), map_.values(), assume_unique=True
+    )
+
+    assert list(result.items()) == list(map_.items())
@@ -0,0 +1,18 @@
+from hypothesis import given
+
+from tests.hints import KeyT, ValueT
+from tests.utils import Map
+
+from . import strategies
+
+
+@given(strategies.maps)
+def test_properties(map_: Map[KeyT, ValueT]) -> None:
+    original_items = list(map_.items())
+
+    result = map_.map_values(lambda value: (value,))
+
+    assert list(map_.items()) == original_items
+    assert list(result.items()) == [
+        (key, (value,)) for key, value in original_items
+    ]
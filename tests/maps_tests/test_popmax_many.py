@@ -0,0 +1,24 @@
+import pytest
+from hypothesis import given, strategies as st
+
+from tests.hints import KeyT, ValueT
+from tests.utils import Map
+
+from . import strategies
+
+
+@given(strategies.maps, st.integers(0, 10))
+def test_properties(map_: Map[KeyT, ValueT], count: int) -> None:
+    original_items = list(map_.items())
+    size = max(len(original_items) - count, 0)
+
+    result = map_.popmax_many(count)
+
+    assert list(result.items()) == original_items[size:]
+    assert list(map_.items()) == original_items[:size]
+
+
+@given(strategies.maps, st.integers(max_value=-1))
+def test_negative_count(map_: Map[KeyT, ValueT], count: int) -> None:
+    with pytest.raises(ValueError):
+        map_.popmax_many(count)
@@ -0,0 +1,23 @@
+import pytest
+from hypothesis import given, strategies as st
+
+from tests.hints import KeyT, ValueT
+from tests.utils import Map
+
+from . import strategies
+
+
+@given(strategies.maps, st.integers(0, 10))
+def test_properties(map_: Map[KeyT, ValueT], count: int) -> None:
+    original_items = list(map_.items())
+
+    result = map_.popmin_many(count)
+
+    assert list(result.items()) == original_items[:count]
+    assert list(map_.items()) == original_items[count:]
+
+
+@given(strategies.maps, st.integers(max_value=-1))
+def test_negative_count(map_: Map[KeyT, ValueT], count: int) -> None:
+    with pytest.raises(ValueError):
+        map_.popmin_many(count)
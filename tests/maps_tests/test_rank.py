@@ -0,0 +1,33 @@
+import pytest
+from hypothesis import given
+
+from tests.hints import KeyT, ValueT
+from tests.utils import Map, are_keys_equal
+
+from . import strategies
+
+
+@given(strategies.empty_maps_with_keys)
+def test_base_case(map_with_key: tuple[Map[KeyT, ValueT], KeyT]) -> None:
+    map_, key = map_with_key
+
+    with pytest.raises(KeyError):
+        map_.rank(key)
+
+
+@given(strategies.non_empty_maps_with_their_keys)
+def test_step(map_with_key: tuple[Map[KeyT, ValueT], KeyT]) -> None:
+    map_, key = map_with_key
+
+    result = map_.rank(key)
+
+    assert 0 <= result < len(map_)
+    assert are_keys_equal(list(map_)[result], key)
+
+
+@given(strategies.non_empty_maps_with_external_keys)
+def test_external_key(map_with_key: tuple[Map[KeyT, ValueT], KeyT]) -> None:
+    map_, key = map_with_key
+
+    with pytest.raises(KeyError):
+        map_.rank(key)
@@ -0,0 +1,25 @@
+import pytest
+from hypothesis import given
+
+from tests.hints import KeyT, ValueT
+from tests.utils import Map
+
+from . import strategies
+
+
+@given(strategies.non_empty_maps_with_indices)
+def test_properties(map_with_index: tuple[Map[KeyT, ValueT], int]) -> None:
+    map_, index = map_with_index
+
+    key, value = map_.selectitem(index)
+
+    assert map_.rank(key) == index % len(map_)
+    assert value is map_[key]
+
+
+@given(strategies.maps_with_external_indices)
+def test_external_index(map_with_index: tuple[Map[KeyT, ValueT], int]) -> None:
+    map_, index = map_with_index
+
+    with pytest.raises(IndexError):
+        map_.selectitem(index)
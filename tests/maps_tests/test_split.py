@@ -0,0 +1,19 @@
+from hypothesis import given
+
+from tests.hints import KeyT, ValueT
+from tests.utils import Map
+
+from . import strategies
+
+
+@given(strategies.non_empty_maps_with_keys)
+def test_properties(map_with_key: tuple[Map[KeyT, ValueT], KeyT]) -> None:
+    map_, key = map_with_key
+    original_items = list(map_.items())
+
+    lower, upper = map_.split(key)
+
+    assert len(map_) == 0
+    assert all(candidate < key for candidate in lower)
+    assert not any(candidate < key for candidate in upper)
+    assert list(lower.items()) + list(upper.items()) == original_items
@@ -0,0 +1,36 @@
+from hypothesis import given
+
+from dendroid.hints import Stats
+from tests.hints import KeyT, ValueT
+from tests.utils import Map, to_height
+
+from . import strategies
+
+
+@given(strategies.maps)
+def test_basic(map_: Map[KeyT, ValueT]) -> None:
+    result = map_.stats()
+
+    assert isinstance(result, Stats)
+
+
+@given(strategies.maps)
+def test_properties(map_: Map[KeyT, ValueT]) -> None:
+    result = map_.stats()
+
+    assert result.size == len(map_)
+    assert result.height == to_height(map_._tree)
+    assert sum(result.depths.values()) == len(map_)
+    assert max(result.depths, default=-1) == result.height
+    assert all(
+        result.depths.get(depth, 0) <= 2**depth for depth in result.depths
+    )
+    assert sum(result.balance_factors.values()) in (0, len(map_))
+    assert all(
+        abs(balance_factor) <= 1 for balance_factor in result.balance_factors
+    )
+    assert sum(result.colours.values()) in (0, len(map_))
+    assert (result.item_bytes > 0) is bool(map_)
+    assert result.total_bytes == (
+        result.item_bytes + result.node_bytes + result.weakref_bytes
+    )
@@ -0,0 +1,18 @@
+from hypothesis import given
+
+from tests.hints import KeyT, ValueT
+from tests.utils import Map
+
+from . import strategies
+
+
+@given(strategies.maps_with_keys)
+def test_properties(map_with_key: tuple[Map[KeyT, ValueT], KeyT]) -> None:
+    map_, key = map_with_key
+    original_items = list(map_.items())
+
+    result = map_.truncate_below(key)
+
+    assert all(candidate < key for candidate in result)
+    assert not any(candidate < key for candidate in map_)
+    assert list(result.items()) + list(map_.items()) == original_items
@@ -0,0 +1,63 @@
+from copy import copy
+from typing import Any
+
+from hypothesis import given
+
+from dendroid.hints import Item
+from tests.hints import KeyT, ValueT
+from tests.utils import (
+    Map,
+    is_left_subtree_less_than_right_subtree,
+    to_height,
+    to_max_binary_tree_height,
+    to_min_binary_tree_height,
+)
+
+from . import strategies
+
+
+def to_singleton(value: Any, /) -> Any:
+    return (value,)
+
+
+@given(strategies.maps_with_items)
+def test_properties(
+    map_with_item: tuple[Map[KeyT, ValueT], Item[KeyT, ValueT]],
+) -> None:
+    map_, (key, default) = map_with_item
+
+    map_.upsert(key, to_singleton, default)
+
+    tree = map_._tree
+    assert (
+        to_min_binary_tree_height(tree)
+        <= to_height(tree)
+        <= to_max_binary_tree_height(tree)
+    )
+    assert is_left_subtree_less_than_right_subtree(tree)
+
+
+@given(strategies.empty_maps_with_items)
+def test_base_case(
+    map_with_item: tuple[Map[KeyT, ValueT], Item[KeyT, ValueT]],
+) -> None:
+    map_, (key, default) = map_with_item
+
+    result = map_.upsert(key, to_singleton, default)
+
+    assert result is map_[key]
+    assert result == (default,)
+
+
+@given(strategies.non_empty_maps_with_items)
+def test_step(
+    map_with_item: tuple[Map[KeyT, ValueT], Item[KeyT, ValueT]],
+) -> None:
+    map_, (key, default) = map_with_item
+    original = copy(map_)
+
+    result = map_.upsert(key, to_singleton, default)
+
+    assert result is map_[key]
+    assert result == ((original[key],) if key in original else (default,))
+    assert len(map_) == len(original) + (key not in original)
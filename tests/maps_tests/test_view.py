@@ -0,0 +1,70 @@
+from hypothesis import given, strategies as st
+
+from tests.hints import KeyT, ValueT
+from tests.utils import Map, is_in_range
+
+from . import strategies
+
+
+@given(
+    strategies.maps_with_keys_pairs, st.tuples(st.booleans(), st.booleans())
+)
+def test_properties(
+    map_with_keys_pair: tuple[Map[KeyT, ValueT], tuple[KeyT, KeyT]],
+    inclusive: tuple[bool, bool],
+) -> None:
+    map_, (lo, hi) = map_with_keys_pair
+
+    result = map_.view(lo, hi, inclusive=inclusive)
+
+    assert list(result.items()) == [
+        (key, value)
+        for key, value in map_.items()
+        if is_in_range(key, lo, hi, inclusive=inclusive)
+    ]
+    assert list(reversed(result)) == list(result)[::-1]
+    assert len(result) == len(list(result))
+    assert all(key in result for key in result)
+    assert all(result[key] == map_[key] for key in result)
+
+
+@given(
+    strategies.maps_with_keys_pairs, st.tuples(st.booleans(), st.booleans())
+)
+def test_narrowing(
+    map_with_keys_pair: tuple[Map[KeyT, ValueT], tuple[KeyT, KeyT]],
+    inclusive: tuple[bool, bool],
+) -> None:
+    map_, (lo, hi) = map_with_keys_pair
+    view = map_.view(lo, hi, inclusive=inclusive)
+
+    result = view.view(lo)
+
+    assert list(result) == [
+        key
+        for key in map_
+        if is_in_range(key, lo, hi, inclusive=inclusive)
+        and is_in_range(key, lo, None)
+    ]
+
+
+@given(strategies.maps_with_keys_pairs, st.none() | st.integers())
+def test_liveness(
+    map_with_keys_pair: tuple[Map[KeyT, ValueT], tuple[KeyT, KeyT]],
+    value: ValueT,
+) -> None:
+    map_, (lo, hi) = map_with_keys_pair
+    view = map_.view(lo, hi, inclusive=(True, True))
+
+    map_[lo] = value
+
+    assert (lo in view) is is_in_range(lo, lo, hi, inclusive=(True, True))
+    assert list(view) == [
+        key for key in map_ if is_in_range(key, lo, hi, inclusive=(True, True))
+    ]
+
+    view.clear()
+
+    assert not any(
+        is_in_range(key, lo, hi, inclusive=(True, True)) for key in map_
+    )
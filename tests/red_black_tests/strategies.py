@@ -14,6 +14,7 @@ from tests.utils import (
     BaseSet,
     ValueSequencePairWithOrder,
     ValueSequenceWithOrder,
+    split_values_by_pivot,
 )
 
 
@@ -44,6 +45,23 @@ sets_with_values = st.builds(
 )
 
 
+def to_ordered_set_pair(
+    values_list_with_order: ValueSequenceWithOrder[ValueT, KeyT], /
+) -> tuple[BaseSet[ValueT], BaseSet[ValueT]]:
+    lower_values, upper_values, order = split_values_by_pivot(
+        values_list_with_order
+    )
+    return (
+        red_black.set_(*lower_values, key=order),
+        red_black.set_(*upper_values, key=order),
+    )
+
+
+ordered_sets_pairs = st.builds(
+    to_ordered_set_pair, non_empty_value_sequence_with_order_strategy
+)
+
+
 def to_non_empty_sets_with_their_values(
     set_: BaseSet[ValueT], /
 ) -> st.SearchStrategy[tuple[BaseSet[ValueT], ValueT]]:
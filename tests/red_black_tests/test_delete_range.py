@@ -0,0 +1,36 @@
+from hypothesis import given, strategies as st
+
+from tests.hints import ValueT
+from tests.utils import (
+    BaseSet,
+    RedBlackTree,
+    are_nodes_sizes_correct,
+    do_paths_to_leaves_have_same_black_nodes_count,
+    do_red_nodes_have_black_children,
+    is_root_black,
+)
+
+from . import strategies
+
+
+@given(strategies.sets_with_values, st.booleans(), st.booleans())
+def test_properties(
+    set_with_value: tuple[BaseSet[ValueT], ValueT],
+    is_lower_bound: bool,
+    is_inclusive: bool,
+) -> None:
+    set_, value = set_with_value
+
+    result = (
+        set_.delete_range(value, None, inclusive=(is_inclusive, False))
+        if is_lower_bound
+        else set_.delete_range(None, value, inclusive=(True, is_inclusive))
+    )
+
+    for part in (set_, result):
+        tree = part._tree
+        assert isinstance(tree, RedBlackTree)
+        assert are_nodes_sizes_correct(tree)
+        assert is_root_black(tree)
+        assert do_red_nodes_have_black_children(tree)
+        assert do_paths_to_leaves_have_same_black_nodes_count(tree)
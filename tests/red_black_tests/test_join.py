@@ -0,0 +1,29 @@
+from hypothesis import given
+
+from tests.hints import ValueT
+from tests.utils import (
+    BaseSet,
+    RedBlackTree,
+    are_nodes_sizes_correct,
+    do_paths_to_leaves_have_same_black_nodes_count,
+    do_red_nodes_have_black_children,
+    is_root_black,
+)
+
+from . import strategies
+
+
+@given(strategies.ordered_sets_pairs)
+def test_properties(
+    sets_pair: tuple[BaseSet[ValueT], BaseSet[ValueT]],
+) -> None:
+    first, second = sets_pair
+
+    result = first.join(second)
+
+    tree = result._tree
+    assert isinstance(tree, RedBlackTree)
+    assert are_nodes_sizes_correct(tree)
+    assert is_root_black(tree)
+    assert do_red_nodes_have_black_children(tree)
+    assert do_paths_to_leaves_have_same_black_nodes_count(tree)
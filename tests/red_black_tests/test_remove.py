@@ -4,7 +4,7 @@ from tests.hints import ValueT
 from tests.utils import (
     BaseSet,
     RedBlackTree,
-    are_nodes_parents_to_children,
+    are_nodes_sizes_correct,
     do_paths_to_leaves_have_same_black_nodes_count,
     do_red_nodes_have_black_children,
     is_root_black,
@@ -21,7 +21,7 @@ def test_properties(set_with_value: tuple[BaseSet[ValueT], ValueT]) -> None:
 
     tree = set_._tree
     assert isinstance(tree, RedBlackTree)
-    assert are_nodes_parents_to_children(tree)
+    assert are_nodes_sizes_correct(tree)
     assert is_root_black(tree)
     assert do_red_nodes_have_black_children(tree)
     assert do_paths_to_leaves_have_same_black_nodes_count(tree)
@@ -7,7 +7,7 @@ from tests.utils import (
     BaseSet,
     RedBlackTree,
     ValueSequenceWithOrder,
-    are_nodes_parents_to_children,
+    are_nodes_sizes_correct,
     do_paths_to_leaves_have_same_black_nodes_count,
     do_red_nodes_have_black_children,
     is_left_subtree_less_than_right_subtree,
@@ -41,7 +41,7 @@ def test_properties(
     assert all(value in result for value in values)
     assert all(value in values for value in result)
     assert is_left_subtree_less_than_right_subtree(result_tree)
-    assert are_nodes_parents_to_children(result_tree)
+    assert are_nodes_sizes_correct(result_tree)
     assert is_root_black(result_tree)
     assert do_red_nodes_have_black_children(result_tree)
     assert do_paths_to_leaves_have_same_black_nodes_count(result_tree)
@@ -4,7 +4,7 @@ from tests.hints import ValueT
 from tests.utils import (
     BaseSet,
     RedBlackTree,
-    are_nodes_parents_to_children,
+    are_nodes_sizes_correct,
     do_paths_to_leaves_have_same_black_nodes_count,
     do_red_nodes_have_black_children,
     is_root_black,
@@ -23,7 +23,7 @@ def test_properties(
 
     result_tree = result._tree
     assert isinstance(result_tree, RedBlackTree)
-    assert are_nodes_parents_to_children(result_tree)
+    assert are_nodes_sizes_correct(result_tree)
     assert is_root_black(result_tree)
     assert do_red_nodes_have_black_children(result_tree)
     assert do_paths_to_leaves_have_same_black_nodes_count(result_tree)
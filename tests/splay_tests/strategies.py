@@ -63,3 +63,19 @@ sets_with_values = strategies.builds(
 non_empty_sets_with_values = strategies.builds(
     to_set_with_value, two_or_more_values_with_order_strategy
 )
+
+
+def to_degenerate_set_with_its_values(
+    size: int, /
+) -> tuple[BaseSet[int], list[int]]:
+    values = list(range(size))
+    result: BaseSet[int] = splay.set_()
+    for value in values:
+        result.add(value)
+    return result, values
+
+
+degenerate_sets_with_their_values = strategies.builds(
+    to_degenerate_set_with_its_values,
+    strategies.integers(min_value=0, max_value=1_000),
+)
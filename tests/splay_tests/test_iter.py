@@ -0,0 +1,65 @@
+from itertools import islice
+
+from hypothesis import given
+
+from tests.hints import ValueT
+from tests.utils import BaseSet
+
+from . import strategies
+
+
+@given(strategies.non_empty_sets_with_their_values)
+def test_accessing_during_iteration(
+    set_with_value: tuple[BaseSet[ValueT], ValueT],
+) -> None:
+    set_, value = set_with_value
+
+    values = list(set_)
+    result = []
+    for element in set_:
+        result.append(element)
+        _ = value in set_
+
+    assert result == values
+
+
+@given(strategies.non_empty_sets_with_their_values)
+def test_accessing_during_reversed_iteration(
+    set_with_value: tuple[BaseSet[ValueT], ValueT],
+) -> None:
+    set_, value = set_with_value
+
+    values = list(reversed(set_))
+    result = []
+    for element in reversed(set_):
+        result.append(element)
+        _ = value in set_
+
+    assert result == values
+
+
+@given(strategies.non_empty_sets_with_their_values)
+def test_removing_during_iteration(
+    set_with_value: tuple[BaseSet[ValueT], ValueT],
+) -> None:
+    set_, value = set_with_value
+
+    values = list(set_)
+    result = []
+    iterator = iter(set_)
+    for element in iterator:
+        result.append(element)
+        if element == value:
+            set_.remove(value)
+
+    assert result == values
+    assert value not in set_
+
+
+@given(strategies.degenerate_sets_with_their_values)
+def test_degenerate(set_with_values: tuple[BaseSet[int], list[int]]) -> None:
+    set_, values = set_with_values
+
+    assert list(islice(set_, 1)) == values[:1]
+    assert list(reversed(set_)) == values[::-1]
+    assert list(set_) == values
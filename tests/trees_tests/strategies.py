@@ -6,7 +6,7 @@ from typing import Any
 
 from hypothesis import strategies as st
 
-from dendroid import avl, binary, red_black, splay
+from dendroid import array_avl, avl, binary, red_black, splay
 from dendroid.hints import Item
 from tests.hints import KeyT, ValueT
 from tests.strategies import (
@@ -27,7 +27,7 @@ from tests.utils import (
 )
 
 factories = st.sampled_from(
-    [binary.map_, avl.map_, red_black.map_, splay.map_]
+    [binary.map_, avl.map_, array_avl.map_, red_black.map_, splay.map_]
 ).map(partial(compose, attrgetter('_tree')))
 
 
@@ -83,6 +83,33 @@ empty_trees_with_keys = st.builds(to_tree_with_key, factories, single_items)
 trees_with_keys = st.builds(to_tree_with_key, factories, non_empty_items_lists)
 
 
+def to_tree_with_keys_pair(
+    factory: Callable[..., Tree[KeyT, ValueT]], items: list[Item[KeyT, ValueT]]
+) -> tuple[Tree[KeyT, ValueT], tuple[KeyT, KeyT]]:
+    *rest_items, (first_key, _), (second_key, _) = items
+    return factory(*rest_items), (first_key, second_key)
+
+
+trees_with_keys_pairs = st.builds(
+    to_tree_with_keys_pair, factories, two_or_more_items
+)
+
+
+def to_ordered_trees_pair(
+    factory: Callable[..., Tree[KeyT, ValueT]], items: list[Item[KeyT, ValueT]]
+) -> tuple[Tree[KeyT, ValueT], Tree[KeyT, ValueT]]:
+    *rest_items, (pivot, _) = items
+    return (
+        factory(*[item for item in rest_items if item[0] < pivot]),
+        factory(*[item for item in rest_items if not item[0] < pivot]),
+    )
+
+
+ordered_trees_pairs = st.builds(
+    to_ordered_trees_pair, factories, non_empty_items_lists
+)
+
+
 def to_non_empty_trees_with_their_keys(
     tree: Tree[KeyT, ValueT], /
 ) -> st.SearchStrategy[tuple[Tree[KeyT, ValueT], KeyT]]:
@@ -105,6 +132,15 @@ non_empty_trees_with_their_nodes = non_empty_trees.flatmap(
 )
 
 
+def to_tree_with_index(
+    tree: Tree[KeyT, ValueT], /
+) -> st.SearchStrategy[tuple[Tree[KeyT, ValueT], int]]:
+    return st.tuples(st.just(tree), st.integers(-1, len(tree)))
+
+
+trees_with_indices = trees.flatmap(to_tree_with_index)
+
+
 def value_sequences_with_order_to_items_lists(
     value_sequences_with_order: ValueSequencesWithOrder[ValueT, KeyT], /
 ) -> tuple[list[Item[KeyT, ValueT]] | list[tuple[ValueT, ValueT]], ...]:
@@ -0,0 +1,17 @@
+from hypothesis import given
+
+from tests.hints import KeyT, ValueT
+from tests.utils import Tree
+
+from . import strategies
+
+
+@given(strategies.trees_with_keys)
+def test_properties(tree_with_key: tuple[Tree[KeyT, ValueT], KeyT]) -> None:
+    tree, key = tree_with_key
+
+    result = tree.bisect_left(key)
+
+    assert 0 <= result <= len(tree)
+    assert all(node.key < key for node in list(tree)[:result])
+    assert not any(node.key < key for node in list(tree)[result:])
@@ -0,0 +1,34 @@
+import copy
+
+from hypothesis import given
+
+from tests.hints import KeyT, ValueT
+from tests.utils import NIL, Tree, to_height
+
+from . import strategies
+
+
+@given(strategies.trees)
+def test_properties(tree: Tree[KeyT, ValueT]) -> None:
+    result = copy.copy(tree)
+
+    assert result is not tree
+    assert len(result) == len(tree)
+    assert to_height(result) == to_height(tree)
+    assert all(
+        result_node is not node
+        and result_node.key is node.key
+        and result_node.value is node.value
+        for result_node, node in zip(result, tree, strict=True)
+    )
+
+
+@given(strategies.non_empty_trees_with_their_keys)
+def test_independence(tree_with_key: tuple[Tree[KeyT, ValueT], KeyT]) -> None:
+    tree, key = tree_with_key
+
+    result = copy.copy(tree)
+    result.pop(key)
+
+    assert tree.find(key) is not NIL
+    assert len(tree) == len(result) + 1
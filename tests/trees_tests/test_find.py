@@ -0,0 +1,29 @@
+from hypothesis import given
+
+from tests.hints import KeyT, ValueT
+from tests.utils import NIL, Tree
+
+from . import strategies
+
+
+@given(strategies.trees_with_keys)
+def test_properties(tree_with_key: tuple[Tree[KeyT, ValueT], KeyT]) -> None:
+    tree, key = tree_with_key
+
+    result = tree.find(key)
+
+    assert (
+        result is NIL
+        and all(key < node.key or node.key < key for node in tree)
+    ) or (result is not NIL and not (key < result.key or result.key < key))
+
+
+@given(strategies.non_empty_trees_with_their_keys)
+def test_base_case(tree_with_key: tuple[Tree[KeyT, ValueT], KeyT]) -> None:
+    tree, key = tree_with_key
+
+    result = tree.find(key)
+
+    assert result is not NIL
+    assert not (key < result.key)
+    assert not (result.key < key)
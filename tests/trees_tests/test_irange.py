@@ -0,0 +1,34 @@
+from hypothesis import given, strategies as st
+
+from tests.hints import KeyT, ValueT
+from tests.utils import Tree, is_in_range
+
+from . import strategies
+
+
+@given(strategies.trees, st.booleans())
+def test_unbounded(tree: Tree[KeyT, ValueT], reverse: bool) -> None:
+    result = tree.irange(reverse=reverse)
+
+    assert list(result) == (list(reversed(tree)) if reverse else list(tree))
+
+
+@given(
+    strategies.trees_with_keys_pairs,
+    st.tuples(st.booleans(), st.booleans()),
+    st.booleans(),
+)
+def test_properties(
+    tree_with_keys_pair: tuple[Tree[KeyT, ValueT], tuple[KeyT, KeyT]],
+    inclusive: tuple[bool, bool],
+    reverse: bool,
+) -> None:
+    tree, (lo, hi) = tree_with_keys_pair
+
+    result = tree.irange(lo, hi, inclusive=inclusive, reverse=reverse)
+
+    assert list(result) == [
+        node
+        for node in (reversed(tree) if reverse else tree)
+        if is_in_range(node.key, lo, hi, inclusive=inclusive)
+    ]
@@ -0,0 +1,32 @@
+import copy
+
+import pytest
+from hypothesis import given
+
+from tests.hints import KeyT, ValueT
+from tests.utils import Tree, capacity, is_left_subtree_less_than_right_subtree
+
+from . import strategies
+
+
+@given(strategies.ordered_trees_pairs)
+def test_properties(
+    trees_pair: tuple[Tree[KeyT, ValueT], Tree[KeyT, ValueT]],
+) -> None:
+    first, second = trees_pair
+    first_items = [node.item for node in first]
+    second_items = [node.item for node in second]
+
+    result = first.join(second)
+
+    assert not first
+    assert not second
+    assert len(result) == capacity(result)
+    assert is_left_subtree_less_than_right_subtree(result)
+    assert [node.item for node in result] == first_items + second_items
+
+
+@given(strategies.non_empty_trees)
+def test_overlapping(tree: Tree[KeyT, ValueT]) -> None:
+    with pytest.raises(ValueError):
+        tree.join(copy.copy(tree))
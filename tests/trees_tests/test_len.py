@@ -0,0 +1,61 @@
+from hypothesis import given
+
+from tests.hints import KeyT, ValueT
+from tests.utils import NIL, Tree, capacity, equivalence
+
+from . import strategies
+
+
+@given(strategies.trees)
+def test_properties(tree: Tree[KeyT, ValueT]) -> None:
+    result = len(tree)
+
+    assert result == capacity(tree)
+    assert equivalence(bool(result), bool(tree))
+
+
+@given(strategies.trees_with_keys)
+def test_insert(tree_with_key: tuple[Tree[KeyT, ValueT], KeyT]) -> None:
+    tree, key = tree_with_key
+    original_size = len(tree)
+    is_key_missing = tree.find(key) is NIL
+
+    tree.insert(key, key)  # type: ignore[arg-type]
+
+    assert len(tree) == capacity(tree)
+    assert len(tree) == original_size + is_key_missing
+
+
+@given(strategies.non_empty_trees_with_their_keys)
+def test_pop(tree_with_key: tuple[Tree[KeyT, ValueT], KeyT]) -> None:
+    tree, key = tree_with_key
+    original_size = len(tree)
+
+    tree.pop(key)
+
+    assert len(tree) == capacity(tree) == original_size - 1
+
+
+@given(strategies.non_empty_trees)
+def test_popmax(tree: Tree[KeyT, ValueT]) -> None:
+    original_size = len(tree)
+
+    tree.popmax()
+
+    assert len(tree) == capacity(tree) == original_size - 1
+
+
+@given(strategies.non_empty_trees)
+def test_popmin(tree: Tree[KeyT, ValueT]) -> None:
+    original_size = len(tree)
+
+    tree.popmin()
+
+    assert len(tree) == capacity(tree) == original_size - 1
+
+
+@given(strategies.trees)
+def test_clear(tree: Tree[KeyT, ValueT]) -> None:
+    tree.clear()
+
+    assert len(tree) == capacity(tree) == 0
@@ -0,0 +1,27 @@
+from hypothesis import given
+
+from tests.hints import KeyT, ValueT
+from tests.utils import (
+    Tree,
+    is_left_subtree_less_than_right_subtree,
+    pickle_round_trip,
+    to_height,
+    to_max_binary_tree_height,
+    to_min_binary_tree_height,
+)
+
+from . import strategies
+
+
+@given(strategies.trees)
+def test_round_trip(tree: Tree[KeyT, ValueT]) -> None:
+    result = pickle_round_trip(tree)
+
+    assert type(result) is type(tree)
+    assert [node.item for node in result] == [node.item for node in tree]
+    assert (
+        to_min_binary_tree_height(result)
+        <= to_height(result)
+        <= to_max_binary_tree_height(result)
+    )
+    assert is_left_subtree_less_than_right_subtree(result)
@@ -0,0 +1,19 @@
+from hypothesis import given
+
+from tests.hints import KeyT, ValueT
+from tests.utils import NIL, Tree
+
+from . import strategies
+
+
+@given(strategies.trees_with_indices)
+def test_properties(tree_with_index: tuple[Tree[KeyT, ValueT], int]) -> None:
+    tree, index = tree_with_index
+
+    result = tree.select(index)
+
+    assert (
+        result is list(tree)[index]
+        if 0 <= index < len(tree)
+        else result is NIL
+    )
@@ -0,0 +1,25 @@
+from hypothesis import given
+
+from tests.hints import KeyT, ValueT
+from tests.utils import Tree, capacity, is_left_subtree_less_than_right_subtree
+
+from . import strategies
+
+
+@given(strategies.trees_with_keys)
+def test_properties(tree_with_key: tuple[Tree[KeyT, ValueT], KeyT]) -> None:
+    tree, key = tree_with_key
+    original_items = [node.item for node in tree]
+
+    lower, upper = tree.split(key)
+
+    assert not tree
+    assert len(lower) == capacity(lower)
+    assert len(upper) == capacity(upper)
+    assert is_left_subtree_less_than_right_subtree(lower)
+    assert is_left_subtree_less_than_right_subtree(upper)
+    assert all(node.key < key for node in lower)
+    assert not any(node.key < key for node in upper)
+    assert [node.item for node in lower] + [
+        node.item for node in upper
+    ] == original_items
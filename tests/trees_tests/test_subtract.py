@@ -0,0 +1,35 @@
+from copy import copy
+
+from hypothesis import given
+
+from tests.hints import KeyT, ValueT
+from tests.utils import Tree, capacity, is_left_subtree_less_than_right_subtree
+
+from . import strategies
+
+
+@given(strategies.trees_pairs)
+def test_properties(
+    trees_pair: tuple[Tree[KeyT, ValueT], Tree[KeyT, ValueT]],
+) -> None:
+    first, second = trees_pair
+    first_items = [node.item for node in first]
+    second_items = [node.item for node in second]
+    second_keys = [key for key, _ in second_items]
+
+    result = first.subtract(second)
+
+    assert not first
+    assert not second
+    assert len(result) == capacity(result)
+    assert is_left_subtree_less_than_right_subtree(result)
+    assert [node.item for node in result] == [
+        item for item in first_items if item[0] not in second_keys
+    ]
+
+
+@given(strategies.trees)
+def test_self_inverse(tree: Tree[KeyT, ValueT]) -> None:
+    result = tree.subtract(copy(tree))
+
+    assert not result
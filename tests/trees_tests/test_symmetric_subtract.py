@@ -0,0 +1,39 @@
+from copy import copy
+from operator import itemgetter
+
+from hypothesis import given
+
+from tests.hints import KeyT, ValueT
+from tests.utils import Tree, capacity, is_left_subtree_less_than_right_subtree
+
+from . import strategies
+
+
+@given(strategies.trees_pairs)
+def test_properties(
+    trees_pair: tuple[Tree[KeyT, ValueT], Tree[KeyT, ValueT]],
+) -> None:
+    first, second = trees_pair
+    first_items = [node.item for node in first]
+    second_items = [node.item for node in second]
+    first_keys = [key for key, _ in first_items]
+    second_keys = [key for key, _ in second_items]
+
+    result = first.symmetric_subtract(second)
+
+    assert not first
+    assert not second
+    assert len(result) == capacity(result)
+    assert is_left_subtree_less_than_right_subtree(result)
+    assert sorted(
+        [item for item in first_items if item[0] not in second_keys]
+        + [item for item in second_items if item[0] not in first_keys],
+        key=itemgetter(0),
+    ) == [node.item for node in result]
+
+
+@given(strategies.trees)
+def test_self_inverse(tree: Tree[KeyT, ValueT]) -> None:
+    result = tree.symmetric_subtract(copy(tree))
+
+    assert not result
@@ -11,6 +11,7 @@ from typing_extensions import TypeIs
 
 from dendroid._core import (
     abcs as _abcs,
+    array_avl,
     avl,
     binary,
     maps as _maps,
@@ -27,6 +28,7 @@ from tests.hints import Domain, KeyT, Range, ValueT
 AnyNode: TypeAlias = (
     binary.Node[KeyT, ValueT]
     | avl.Node[KeyT, ValueT]
+    | array_avl.Node[KeyT, ValueT]
     | red_black.Node[KeyT, ValueT]
     | splay.Node[KeyT, ValueT]
     | _abcs.Node[KeyT, ValueT]
@@ -35,6 +37,7 @@ AnyNodeT = TypeVar(
     'AnyNodeT',
     binary.Node[Any, Any],
     avl.Node[Any, Any],
+    array_avl.Node[Any, Any],
     red_black.Node[Any, Any],
     splay.Node[Any, Any],
     _abcs.Node[Any, Any],
@@ -61,6 +64,7 @@ BaseSetsTriplet: TypeAlias = tuple[
 ]
 Tree = _abcs.Tree
 AvlTree = avl.Tree
+ArrayAvlTree = array_avl.Tree
 RedBlackTree = red_black.Tree
 TreesPair: TypeAlias = tuple[Tree[KeyT, ValueT], Tree[KeyT, ValueT]]
 TreesTriplet: TypeAlias = tuple[
@@ -180,6 +184,34 @@ def pairwise(iterable: Iterable[ValueT]) -> Iterable[tuple[ValueT, ValueT]]:
             value = next_value
 
 
+def is_in_range(
+    key: Any,
+    lo: Any,
+    hi: Any,
+    /,
+    *,
+    inclusive: tuple[bool, bool] = (True, False),
+) -> bool:
+    is_lo_inclusive, is_hi_inclusive = inclusive
+    return (
+        lo is None or (not key < lo if is_lo_inclusive else bool(lo < key))
+    ) and (hi is None or (not hi < key if is_hi_inclusive else bool(key < hi)))
+
+
+def split_values_by_pivot(
+    values_list_with_order: ValueSequenceWithOrder[ValueT, KeyT], /
+) -> tuple[Sequence[ValueT], Sequence[ValueT], Order[ValueT, KeyT] | None]:
+    values_list, order = values_list_with_order
+    *rest_values_list, pivot = values_list
+    key: Callable[[ValueT], Any] = identity if order is None else order
+    pivot_key = key(pivot)
+    return (
+        [value for value in rest_values_list if key(value) < pivot_key],
+        [value for value in rest_values_list if not key(value) < pivot_key],
+        order,
+    )
+
+
 def pickle_round_trip(object_: Any, /) -> Any:
     return pickle.loads(pickle.dumps(object_))
 
@@ -249,33 +281,26 @@ def is_left_subtree_less_than_right_subtree(
     return True
 
 
-def are_nodes_parents_to_children(
-    tree: avl.Tree[KeyT, ValueT] | red_black.Tree[KeyT, ValueT], /
+def are_nodes_sizes_correct(
+    tree: avl.Tree[KeyT, ValueT]
+    | array_avl.Tree[KeyT, ValueT]
+    | red_black.Tree[KeyT, ValueT],
+    /,
 ) -> bool:
     return all(
-        _is_node_with_parent(node) and _is_node_parent_to_its_children(node)
+        _is_node_with_size(node) and node.size == capacity(iter_nodes(node))
         for node in iter_nodes(tree.root)  # type: ignore[type-var]
     )
 
 
-def _is_node_with_parent(
+def _is_node_with_size(
     node: Any, /
-) -> TypeIs[avl.Node[KeyT, ValueT] | red_black.Node[KeyT, ValueT]]:
-    return isinstance(node, avl.Node | red_black.Node)
-
-
-def _is_node_parent_to_its_children(
-    node: avl.Node[KeyT, ValueT] | red_black.Node[KeyT, ValueT], /
-) -> bool:
-    return _is_child_node(node.left, node) and _is_child_node(node.right, node)
-
-
-def _is_child_node(
-    node: avl.Node[KeyT, ValueT] | red_black.Node[KeyT, ValueT] | Nil,
-    parent: avl.Node[KeyT, ValueT] | red_black.Node[KeyT, ValueT],
-    /,
-) -> bool:
-    return node is NIL or node.parent is parent
+) -> TypeIs[
+    avl.Node[KeyT, ValueT]
+    | array_avl.Node[KeyT, ValueT]
+    | red_black.Node[KeyT, ValueT]
+]:
+    return isinstance(node, avl.Node | array_avl.Node | red_black.Node)
 
 
 def to_height(tree: Tree[KeyT, ValueT], /) -> int:
@@ -308,7 +333,8 @@ MAX_AVL_TREE_HEIGHT_INTERCEPT = (
 
 
 @to_max_binary_tree_height.register(avl.Tree)
-def _(tree: avl.Tree[KeyT, ValueT], /) -> int:
+@to_max_binary_tree_height.register(array_avl.Tree)
+def _(tree: avl.Tree[KeyT, ValueT] | array_avl.Tree[KeyT, ValueT], /) -> int:
     return math.floor(
         MAX_AVL_TREE_HEIGHT_SLOPE * math.log2(len(tree) + 2)
         + MAX_AVL_TREE_HEIGHT_INTERCEPT
@@ -320,13 +346,16 @@ def _(tree: red_black.Tree[KeyT, ValueT], /) -> int:
     return 2 * _utils.to_balanced_tree_height(len(tree) + 1)
 
 
-def are_balance_factors_normalized(tree: avl.Tree[KeyT, ValueT], /) -> bool:
+_AvlTreeT = TypeVar('_AvlTreeT', avl.Tree[Any, Any], array_avl.Tree[Any, Any])
+
+
+def are_balance_factors_normalized(tree: _AvlTreeT, /) -> bool:
     return all(
         node.balance_factor in (-1, 0, 1) for node in iter_nodes(tree.root)
     )
 
 
-def are_nodes_heights_correct(tree: avl.Tree[KeyT, ValueT], /) -> bool:
+def are_nodes_heights_correct(tree: _AvlTreeT, /) -> bool:
     return all(
         node.height == to_node_height(node) for node in iter_nodes(tree.root)
     )
@@ -0,0 +1,30 @@
+from hypothesis import given, strategies as st
+
+from dendroid.hints import Item
+from tests.hints import KeyT, ValueT
+from tests.utils import ItemsView, is_in_range
+
+from . import strategies
+
+
+@given(
+    strategies.items_views_with_items_pairs,
+    st.tuples(st.booleans(), st.booleans()),
+    st.booleans(),
+)
+def test_properties(
+    items_view_with_items_pair: tuple[
+        ItemsView[KeyT, ValueT], tuple[Item[KeyT, ValueT], Item[KeyT, ValueT]]
+    ],
+    inclusive: tuple[bool, bool],
+    reverse: bool,
+) -> None:
+    items_view, ((lo, _), (hi, _)) = items_view_with_items_pair
+
+    result = items_view.irange(lo, hi, inclusive=inclusive, reverse=reverse)
+
+    assert list(result) == [
+        item
+        for item in (reversed(items_view) if reverse else items_view)
+        if is_in_range(item[0], lo, hi, inclusive=inclusive)
+    ]
@@ -1,11 +1,12 @@
 from collections.abc import Callable, Sequence
 from functools import partial
 from itertools import starmap
+from operator import itemgetter
 from typing import Any
 
 from hypothesis import strategies
 
-from dendroid import avl, binary, red_black, splay
+from dendroid import array_avl, avl, binary, red_black, splay
 from dendroid.hints import Item
 from tests.hints import KeyT, ValueT
 from tests.strategies import (
@@ -23,10 +24,11 @@ from tests.utils import (
     ValueSequencesWithOrder,
     compose,
     has_size_two_or_more,
+    identity,
 )
 
 factories = strategies.sampled_from(
-    [binary.map_, avl.map_, red_black.map_, splay.map_]
+    [binary.map_, avl.map_, array_avl.map_, red_black.map_, splay.map_]
 ).map(partial(compose, Map.keys))
 
 
@@ -127,6 +129,20 @@ def to_keys_views_tuple(
     return tuple(starmap(factory, items_lists))
 
 
+def to_differently_ordered_keys_views_pair(
+    map_factory: Callable[..., Map[KeyT, ValueT]],
+    options_pair: tuple[dict[str, Any], dict[str, Any]],
+    items_lists: tuple[list[Item[KeyT, ValueT]], list[Item[KeyT, ValueT]]],
+    /,
+) -> tuple[KeysView[KeyT], KeysView[KeyT]]:
+    first_options, second_options = options_pair
+    first_items, second_items = items_lists
+    return (
+        map_factory(*first_items, **first_options).keys(),
+        map_factory(*second_items, **second_options).keys(),
+    )
+
+
 keys_views_pairs = strategies.builds(
     to_keys_views_tuple,
     factories,
@@ -172,3 +188,24 @@ keys_views_pairs_with_keys = strategies.builds(
         )
     ).map(value_sequences_with_order_to_items_lists),
 )
+differently_ordered_keys_views_pairs = strategies.builds(
+    to_differently_ordered_keys_views_pair,
+    strategies.sampled_from(
+        [binary.map_, avl.map_, array_avl.map_, red_black.map_, splay.map_]
+    ),
+    strategies.permutations(
+        [
+            {},
+            {'reverse': True},
+            {'key': identity},
+            {'key': identity, 'reverse': True},
+        ]
+    ).map(itemgetter(0, 1)),
+    (
+        value_with_order_strategy_strategy.flatmap(
+            partial(
+                to_value_sequences_with_order_strategy, sizes=[(0, None)] * 2
+            )
+        ).map(value_sequences_with_order_to_items_lists)
+    ),
+)
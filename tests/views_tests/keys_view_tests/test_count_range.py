@@ -0,0 +1,21 @@
+from hypothesis import given, strategies as st
+
+from tests.hints import KeyT
+from tests.utils import KeysView
+
+from . import strategies
+
+
+@given(
+    strategies.keys_views_with_keys_pairs,
+    st.tuples(st.booleans(), st.booleans()),
+)
+def test_properties(
+    keys_view_with_keys_pair: tuple[KeysView[KeyT], tuple[KeyT, KeyT]],
+    inclusive: tuple[bool, bool],
+) -> None:
+    keys_view, (lo, hi) = keys_view_with_keys_pair
+
+    result = keys_view.count_range(lo, hi, inclusive=inclusive)
+
+    assert result == len(list(keys_view.irange(lo, hi, inclusive=inclusive)))
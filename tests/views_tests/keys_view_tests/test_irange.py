@@ -0,0 +1,27 @@
+from hypothesis import given, strategies as st
+
+from tests.hints import KeyT
+from tests.utils import KeysView, is_in_range
+
+from . import strategies
+
+
+@given(
+    strategies.keys_views_with_keys_pairs,
+    st.tuples(st.booleans(), st.booleans()),
+    st.booleans(),
+)
+def test_properties(
+    keys_view_with_keys_pair: tuple[KeysView[KeyT], tuple[KeyT, KeyT]],
+    inclusive: tuple[bool, bool],
+    reverse: bool,
+) -> None:
+    keys_view, (lo, hi) = keys_view_with_keys_pair
+
+    result = keys_view.irange(lo, hi, inclusive=inclusive, reverse=reverse)
+
+    assert list(result) == [
+        key
+        for key in (reversed(keys_view) if reverse else keys_view)
+        if is_in_range(key, lo, hi, inclusive=inclusive)
+    ]
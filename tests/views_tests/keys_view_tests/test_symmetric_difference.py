@@ -162,3 +162,20 @@ def test_connection_with_disjoint(
         left_keys_view.isdisjoint(right_keys_view),
         result == left_keys_view | right_keys_view,
     )
+
+
+@given(strategies.differently_ordered_keys_views_pairs)
+def test_differently_ordered(keys_views_pair: KeysViewsPair[KeyT]) -> None:
+    left_keys_view, right_keys_view = keys_views_pair
+
+    result = left_keys_view ^ right_keys_view
+
+    assert len(result) == (
+        len(left_keys_view - right_keys_view)
+        + len(right_keys_view - left_keys_view)
+    )
+    assert all(
+        (key in left_keys_view) is not (key in right_keys_view)
+        for key in result
+    )
+    assert list(result) == list(left_keys_view.from_iterable(result))
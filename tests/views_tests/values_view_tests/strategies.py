@@ -5,7 +5,7 @@ from typing import Any
 
 from hypothesis import strategies
 
-from dendroid import avl, binary, red_black, splay
+from dendroid import array_avl, avl, binary, red_black, splay
 from dendroid.hints import Item
 from tests.hints import KeyT, ValueT
 from tests.strategies import (
@@ -25,7 +25,7 @@ from tests.utils import (
 )
 
 factories = strategies.sampled_from(
-    [binary.map_, avl.map_, red_black.map_, splay.map_]
+    [binary.map_, avl.map_, array_avl.map_, red_black.map_, splay.map_]
 ).map(partial(compose, Map.values))
 
 